@@ -0,0 +1,110 @@
+"""
+Guardrail scanning cost: per-keyword loop and per-detector rescans against
+the single-pass PatternMatcher.
+
+Generates a banned-keyword list and messages of random words with a few card
+numbers and API keys mixed in, then checks every message both ways: the old
+ContentFilterMiddleware loop (``keyword in content`` for each keyword) followed
+by one regex scan per PII detector, and one PatternMatcher.scan. Both must
+agree on whether a message is blocked and on the PII they find.
+
+Usage:
+    python -m benchmarks.bench_guardrail_matcher [--keywords 2000] [--chars 20000] [--messages 200]
+"""
+import argparse
+import random
+import re
+import string
+import time
+
+from src.backend.ai.middleware.pattern_matcher import PII_DETECTORS, PatternMatcher, passes_luhn
+
+CARDS = ["4111 1111 1111 1111", "5500-0000-0000-0004", "4012888888881881"]
+
+
+def random_word(rng: random.Random, low: int, high: int) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(low, high)))
+
+
+def make_messages(rng: random.Random, keywords: list, count: int, chars: int, hit_rate: float) -> list:
+    messages = []
+    for _ in range(count):
+        words = []
+        size = 0
+        while size < chars:
+            word = random_word(rng, 2, 9)
+            roll = rng.random()
+            if roll < 0.002:
+                word = rng.choice(CARDS)
+            elif roll < 0.003:
+                word = "sk-" + "".join(rng.choices(string.ascii_letters + string.digits, k=32))
+            words.append(word)
+            size += len(word) + 1
+        if rng.random() < hit_rate:
+            words.insert(rng.randrange(len(words)), rng.choice(keywords).upper())
+        messages.append(" ".join(words))
+    return messages
+
+
+def scan_loop(keywords: list, detectors: dict, content: str):
+    lowered = content.lower()
+    blocked = False
+    for keyword in keywords:
+        if keyword in lowered:
+            blocked = True
+            break
+    pii = []
+    for name, pattern in detectors.items():
+        for match in re.finditer(pattern, content):
+            if name == "credit_card" and not passes_luhn(match.group()):
+                continue
+            pii.append((name, match.start()))
+    return blocked, sorted(pii)
+
+
+def scan_single_pass(matcher: PatternMatcher, content: str):
+    matches = matcher.scan(content)
+    blocked = any(match["type"] == "keyword" for match in matches)
+    pii = sorted((match["type"], match["start"]) for match in matches if match["type"] != "keyword")
+    return blocked, pii
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keywords", type=int, default=2000)
+    parser.add_argument("--chars", type=int, default=20000)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--hit-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    # Long enough that random text rarely contains one by chance
+    keywords = sorted({random_word(rng, 7, 12) for _ in range(args.keywords)})
+    messages = make_messages(rng, keywords, args.messages, args.chars, args.hit_rate)
+
+    started = time.perf_counter()
+    matcher = PatternMatcher(keywords, detectors=PII_DETECTORS)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    expected = [scan_loop(keywords, PII_DETECTORS, message) for message in messages]
+    loop_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    actual = [scan_single_pass(matcher, message) for message in messages]
+    single_s = time.perf_counter() - started
+
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+    blocked = sum(1 for result in actual if result[0])
+    megabytes = sum(len(message) for message in messages) / 1e6
+
+    print(f"keywords={len(keywords)} messages={args.messages} chars/message={args.chars} blocked={blocked}")
+    print(f"matcher build: {build_ms:.1f} ms")
+    print(f"{'loop + rescans':16s} {loop_s * 1000 / args.messages:8.3f} ms/message  {megabytes / loop_s:7.2f} MB/s")
+    print(f"{'single pass':16s} {single_s * 1000 / args.messages:8.3f} ms/message  {megabytes / single_s:7.2f} MB/s")
+    print(f"speedup: {loop_s / single_s:.1f}x  mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
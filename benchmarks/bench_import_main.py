@@ -0,0 +1,96 @@
+"""
+Cold-start cost of an API worker: wall time of ``import main`` in a fresh interpreter.
+
+Every sample starts a new Python process, so nothing is shared between runs
+except the OS file cache and compiled .pyc files. Agents, model clients and the
+vector store are built on first use, so ``import main`` should only pay for
+FastAPI, SQLAlchemy and the route modules. The "eager" row imports every agent
+module on top of main, which is what a worker used to pay before serving its
+first request. ``--profile`` prints the slowest imports reported by
+``python -X importtime``.
+
+Usage:
+    python -m benchmarks.bench_import_main [--repeat 7] [--profile]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENV = {
+    "MODEL_API_KEY": "benchmark",
+    # File-backed so the pooled engine settings apply; the SQL agent reflects it on import
+    "AZURE_SQL_CONNECTION_STRING": f"sqlite:///{os.path.join(tempfile.gettempdir(), 'bench_import_main.db')}",
+    "MONGODB_ATLAS_CLUSTER_URI": "mongodb://localhost:27017",
+    "GOOGLE_API_KEY": "benchmark",
+    "LANGSMITH_TRACING": "false",
+}
+
+SCENARIOS = [
+    ("interpreter", "pass"),
+    ("import fastapi", "import fastapi"),
+    ("import main", "import main"),
+    ("import main + agents (eager)", (
+        "import main; "
+        "import src.backend.ai.agents.auditor_agent, src.backend.ai.agents.anomaly_detection_agent, "
+        "src.backend.ai.agents.sql_agent, src.backend.ai.agents.doc_agent"
+    )),
+]
+
+
+def run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, **{key: os.environ.get(key, value) for key, value in ENV.items()}}
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def timed(code: str, repeat: int) -> list:
+    """Wall time of each fresh-process run of ``code`` in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        run(code)
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return sorted(samples)
+
+
+def profile(code: str, top: int) -> None:
+    rows = []
+    for line in run(code, "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            rows.append((int(cumulative), name.rstrip()))
+    print(f"slowest imports (cumulative) for: {code}")
+    for cumulative, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {cumulative / 1000:8.1f} ms {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    # Warm the .pyc cache so the first sample is not an outlier
+    run(SCENARIOS[-1][1])
+
+    print(f"fresh-process wall time over {args.repeat} runs")
+    for label, code in SCENARIOS:
+        samples = timed(code, args.repeat)
+        print(f"  {label:<30} median {samples[len(samples) // 2]:8.1f} ms   min {samples[0]:8.1f} ms")
+
+    if args.profile:
+        profile("import main", args.top)
+
+
+if __name__ == "__main__":
+    main()
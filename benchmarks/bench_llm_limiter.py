@@ -0,0 +1,133 @@
+"""
+Adaptive LLM limiter against a local fake model server.
+
+The fake server behaves like a single Ollama endpoint: it has a fixed number of
+decode slots, every request slows down super-linearly once more requests are
+in flight than there are slots, and it sheds load with HTTP 503 past a hard
+cap. The benchmark fires several concurrent "audits" (one call per rule) at it,
+first with an unbounded gather and then through AdaptiveConcurrencyLimiter.
+
+Usage:
+    python -m benchmarks.bench_llm_limiter [--audits 5] [--rules 40]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("MODEL_API_KEY", "benchmark")
+os.environ.setdefault("AZURE_SQL_CONNECTION_STRING", "sqlite://")
+os.environ.setdefault("MONGODB_ATLAS_CLUSTER_URI", "mongodb://localhost:27017")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from src.backend.ai.llm_limiter import AdaptiveConcurrencyLimiter
+
+
+class FakeModelServer:
+    """Minimal HTTP server whose latency collapses under overload"""
+
+    def __init__(self, slots: int, service_seconds: float, shed_at: int):
+        self.slots = slots
+        self.service_seconds = service_seconds
+        self.shed_at = shed_at
+        self.in_flight = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await reader.readuntil(b"\r\n\r\n")
+        self.in_flight += 1
+        try:
+            if self.in_flight > self.shed_at:
+                status, body = "503 Service Unavailable", b"overloaded"
+            else:
+                overload = max(1.0, self.in_flight / self.slots)
+                await asyncio.sleep(self.service_seconds * overload ** 1.5)
+                status, body = "200 OK", b'{"message": {"content": "Status: PASS"}}'
+        finally:
+            self.in_flight -= 1
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+        writer.close()
+
+
+async def call_model(port: int) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"POST /api/chat HTTP/1.1\r\nHost: localhost\r\nContent-Length: 0\r\n\r\n")
+    await writer.drain()
+    status_line = await reader.readline()
+    await reader.read()
+    writer.close()
+    if b" 200 " not in status_line:
+        raise RuntimeError(status_line.decode().strip())
+
+
+async def run(calls: int, limiter: AdaptiveConcurrencyLimiter | None, server: FakeModelServer) -> dict:
+    listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    latencies, errors = [], 0
+
+    async def one():
+        nonlocal errors
+        started_at = time.perf_counter()
+        try:
+            if limiter is None:
+                await call_model(port)
+            else:
+                async with limiter.slot():
+                    await call_model(port)
+        except RuntimeError:
+            errors += 1
+        latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(calls)))
+    elapsed = time.perf_counter() - started_at
+    listener.close()
+    await listener.wait_closed()
+
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--audits", type=int, default=5)
+    parser.add_argument("--rules", type=int, default=40)
+    parser.add_argument("--slots", type=int, default=4)
+    parser.add_argument("--service-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    calls = args.audits * args.rules
+    service_seconds = args.service_ms / 1000
+
+    unbounded = asyncio.run(run(
+        calls, None, FakeModelServer(args.slots, service_seconds, shed_at=args.slots * 25)
+    ))
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=args.slots,
+        min_limit=1,
+        max_limit=64,
+        latency_target_seconds=service_seconds * 3,
+    )
+    adaptive = asyncio.run(run(
+        calls, limiter, FakeModelServer(args.slots, service_seconds, shed_at=args.slots * 25)
+    ))
+
+    print(f"calls={calls} server_slots={args.slots} service_time={args.service_ms}ms")
+    for name, result in (("unbounded gather", unbounded), ("adaptive limiter", adaptive)):
+        print(
+            f"{name:17s} total={result['elapsed']:.2f}s p50={result['p50']:.2f}s "
+            f"p95={result['p95']:.2f}s errors={result['errors']}"
+        )
+    print(f"limiter stats: {limiter.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Recall and latency of LocalVectorIndex search modes against brute force.
+
+Builds one submission partition of clustered random unit vectors, then runs the
+same queries through exact search, IVF search and a plain numpy brute-force
+reference, reporting recall@k of each mode and per-query latency.
+
+Usage:
+    python -m benchmarks.bench_local_vector_index [--rows 50000] [--dim 768] [--queries 200]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+os.environ.setdefault("MODEL_API_KEY", "benchmark")
+os.environ.setdefault("AZURE_SQL_CONNECTION_STRING", "sqlite://")
+os.environ.setdefault("MONGODB_ATLAS_CLUSTER_URI", "mongodb://localhost:27017")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+import numpy as np
+from langchain_core.documents import Document
+
+from src.backend.services.local_vectorstore_service import LocalVectorIndex
+
+
+def clustered_vectors(rng, rows: int, dim: int, clusters: int) -> np.ndarray:
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    members = centers[rng.integers(0, clusters, size=rows)]
+    vectors = members + 0.6 * rng.standard_normal((rows, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--nprobe", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    vectors = clustered_vectors(rng, args.rows, args.dim, clusters=200)
+    queries = clustered_vectors(rng, args.queries, args.dim, clusters=200)
+    documents = [Document(id=str(i), page_content=f"chunk {i}") for i in range(args.rows)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = LocalVectorIndex(tmp, embeddings=None, nprobe=args.nprobe)
+        index.add_vectors("benchmark-submission", documents, vectors.tolist())
+
+        started_at = time.perf_counter()
+        reference = [np.argsort(-(vectors @ query))[:args.k] for query in queries]
+        brute_force_ms = (time.perf_counter() - started_at) * 1000 / args.queries
+        truth = [set(map(str, row)) for row in reference]
+
+        started_at = time.perf_counter()
+        index.search_vectors("benchmark-submission", queries[:1].tolist(), args.k, 0.0, mode="ivf")
+        ivf_build_s = time.perf_counter() - started_at
+
+        print(f"rows={args.rows} dim={args.dim} queries={args.queries} k={args.k} nprobe={args.nprobe}")
+        print(f"ivf build: {ivf_build_s:.2f}s")
+        print(f"{'brute force (numpy)':22s} {brute_force_ms:8.3f} ms/query  recall@{args.k}=1.000")
+
+        for mode in ("exact", "ivf"):
+            started_at = time.perf_counter()
+            results = [
+                index.search_vectors("benchmark-submission", [query.tolist()], args.k, 0.0, mode=mode)[0]
+                for query in queries
+            ]
+            latency_ms = (time.perf_counter() - started_at) * 1000 / args.queries
+            recall = np.mean([
+                len({document.id for document in found} & expected) / args.k
+                for found, expected in zip(results, truth)
+            ])
+            print(f"{'local ' + mode:22s} {latency_ms:8.3f} ms/query  recall@{args.k}={recall:.3f}")
+
+
+if __name__ == "__main__":
+    main()
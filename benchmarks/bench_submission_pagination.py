@@ -0,0 +1,127 @@
+"""
+Deep-page latency of submission listing: OFFSET paging vs keyset cursors.
+
+Seeds an SQLite file with a large Submissions table (1M rows by default) and the
+indexes declared on submissions_table, then times fetching page N both with the
+old OFFSET/LIMIT query and with SubmissionService's keyset cursor. Also compares
+the insured_name filter in "contains" mode (leading wildcard, full scan) with
+"prefix" and "exact" mode. Prefix LIKE is an index seek on SQL Server, but
+SQLite only optimizes case-sensitive LIKE without an ESCAPE clause, so on this
+fixture prefix still scans and only exact mode shows the index.
+
+Usage:
+    python -m benchmarks.bench_submission_pagination [--rows 1000000] [--page 1000] [--page-size 100]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+os.environ.setdefault("MODEL_API_KEY", "benchmark")
+os.environ.setdefault("AZURE_SQL_CONNECTION_STRING", "sqlite://")
+os.environ.setdefault("MONGODB_ATLAS_CLUSTER_URI", "mongodb://localhost:27017")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from sqlalchemy import create_engine
+
+from src.backend.services.sql_service import AsyncDatabase
+from src.backend.services.submission_service import (
+    SUBMISSION_SELECT, SubmissionService, encode_cursor, metadata, submissions_table
+)
+
+STATUSES = ("Draft", "Submitted", "Quoted", "Bound", "Declined")
+
+
+def seed(engine, rows: int, batch: int = 50000) -> None:
+    metadata.create_all(engine)
+    start = datetime(2020, 1, 1)
+    with engine.begin() as connection:
+        for offset in range(0, rows, batch):
+            connection.execute(submissions_table.insert(), [
+                {
+                    "SubmissionID": str(uuid.uuid4()),
+                    "SubmissionNo": f"SUB-{i:07d}",
+                    "InsuredName": f"Insured {i % 50000:05d} Holdings",
+                    "OverAllStatus": STATUSES[i % len(STATUSES)],
+                    "Underwriter": f"uw{i % 40}",
+                    # Several rows share each timestamp so the SubmissionID tie-break matters
+                    "CreatedAt": start + timedelta(seconds=i // 3),
+                    "UpdatedAt": start + timedelta(seconds=i // 3),
+                }
+                for i in range(offset, min(offset + batch, rows))
+            ])
+        connection.exec_driver_sql("ANALYZE")
+
+
+def timed(fn, repeat: int) -> float:
+    """Median wall time of ``fn()`` in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return sorted(samples)[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    order = (submissions_table.c.CreatedAt.desc(), submissions_table.c.SubmissionID.desc())
+    skip = (args.page - 1) * args.page_size
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'submissions.db')}")
+        started_at = time.perf_counter()
+        seed(engine, args.rows)
+        print(f"seeded {args.rows} rows in {time.perf_counter() - started_at:.1f}s")
+
+        service = SubmissionService(db=AsyncDatabase(engine, max_workers=1))
+
+        def list_page(**kwargs):
+            return asyncio.run(service.get_all_submissions(limit=args.page_size, **kwargs))
+
+        def offset_page(*filters):
+            with engine.connect() as connection:
+                statement = SUBMISSION_SELECT.where(*filters).order_by(*order).offset(skip).limit(args.page_size)
+                return connection.execute(statement).fetchall()
+
+        # The cursor a client holds after reading page - 1
+        with engine.connect() as connection:
+            last_row = connection.execute(
+                SUBMISSION_SELECT.order_by(*order).offset(skip - 1).limit(1)
+            ).mappings().first()
+        cursor = encode_cursor(last_row)
+
+        offset_rows = [row.submission_id for row in offset_page()]
+        keyset_rows = [str(row["submission_id"]) for row in list_page(cursor=cursor)[0]]
+        assert offset_rows == keyset_rows, "keyset page differs from OFFSET page"
+
+        offset_ms = timed(offset_page, args.repeat)
+        keyset_ms = timed(lambda: list_page(cursor=cursor), args.repeat)
+        first_ms = timed(lambda: list_page(), args.repeat)
+
+        print(f"page {args.page} x {args.page_size} rows")
+        print(f"  OFFSET {skip:>9} FETCH NEXT:  {offset_ms:8.2f} ms")
+        print(f"  keyset cursor:               {keyset_ms:8.2f} ms  (page 1: {first_ms:.2f} ms)")
+
+        print("insured_name filter, first page")
+        for match_mode, value in (("contains", "Insured 04242"), ("prefix", "Insured 04242"),
+                                  ("exact", "Insured 04242 Holdings")):
+            elapsed = timed(lambda: list_page(insured_name=value, match_mode=match_mode), args.repeat)
+            print(f"  {match_mode:<8}  {elapsed:8.2f} ms")
+
+        total_ms = timed(lambda: list_page(include_total=True), args.repeat)
+        print(f"first page with X-Total-Estimate: {total_ms:.2f} ms")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
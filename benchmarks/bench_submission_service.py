@@ -0,0 +1,111 @@
+"""
+Concurrent throughput of SubmissionService against SQLite.
+
+Compares the old pattern (blocking SQL executed directly on the event loop)
+with the async data-access layer (bounded SQL thread pool). A fixed per-statement
+delay stands in for the Azure SQL network round trip.
+
+Usage:
+    python -m benchmarks.bench_submission_service [--requests 200] [--concurrency 50] [--latency-ms 20]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+os.environ.setdefault("MODEL_API_KEY", "benchmark")
+os.environ.setdefault("AZURE_SQL_CONNECTION_STRING", "sqlite://")
+os.environ.setdefault("MONGODB_ATLAS_CLUSTER_URI", "mongodb://localhost:27017")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from sqlalchemy import create_engine, event
+
+from src.backend.services.sql_service import AsyncDatabase
+from src.backend.services.submission_service import (
+    SUBMISSION_SELECT, SubmissionService, metadata, submissions_table
+)
+
+
+def build_engine(path: str, latency_ms: float):
+    engine = create_engine(f"sqlite:///{path}", pool_size=10, max_overflow=20)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _simulate_round_trip(conn, cursor, statement, parameters, context, executemany):
+        time.sleep(latency_ms / 1000)
+
+    return engine
+
+
+def seed(engine, rows: int) -> list:
+    metadata.create_all(engine)
+    ids = [str(uuid.uuid4()) for _ in range(rows)]
+    now = datetime.now()
+    with engine.begin() as connection:
+        connection.execute(submissions_table.insert(), [
+            {
+                "SubmissionID": submission_id,
+                "SubmissionNo": f"SUB-{i:06d}",
+                "InsuredName": f"Insured {i}",
+                "OverAllStatus": "Draft",
+                "CreatedAt": now,
+                "UpdatedAt": now,
+            }
+            for i, submission_id in enumerate(ids)
+        ])
+    return ids
+
+
+async def run_blocking(engine, ids, requests: int, concurrency: int) -> float:
+    """Old behaviour: the SQL call runs inline on the event loop"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with semaphore:
+            with engine.connect() as connection:
+                statement = SUBMISSION_SELECT.where(submissions_table.c.SubmissionID == ids[i % len(ids)])
+                connection.execute(statement).first()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return time.perf_counter() - start
+
+
+async def run_async(engine, ids, requests: int, concurrency: int) -> float:
+    """New behaviour: SubmissionService on the bounded SQL thread pool"""
+    service = SubmissionService(db=AsyncDatabase(engine, max_workers=10))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with semaphore:
+            await service.get_submission(ids[i % len(ids)])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(os.path.join(tmp, "submissions.db"), args.latency_ms)
+        ids = seed(engine, 1000)
+
+        blocking = asyncio.run(run_blocking(engine, ids, args.requests, args.concurrency))
+        non_blocking = asyncio.run(run_async(engine, ids, args.requests, args.concurrency))
+        engine.dispose()
+
+    print(f"requests={args.requests} concurrency={args.concurrency} simulated_latency={args.latency_ms}ms")
+    print(f"blocking (db.run on event loop): {blocking:.2f}s  {args.requests / blocking:8.1f} req/s")
+    print(f"async (bounded thread pool):     {non_blocking:.2f}s  {args.requests / non_blocking:8.1f} req/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,12 @@
 import os
-from fastapi import FastAPI
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
-from slowapi import _rate_limit_exceeded_handler
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI
 from src.backend.api.v1.api import api_router
+from src.backend.api.v1.endpoints import health
 from src.backend.core.config import settings
 from src.backend.api.limiter import limiter
+from src.backend.services.job_service import job_service
+from src.backend.services.warmup_service import warmup_service
 
 # Enable LangSmith tracing
 if settings.langsmith_tracing.lower() == "true":
@@ -14,12 +15,25 @@ if settings.langsmith_tracing.lower() == "true":
     os.environ["LANGSMITH_API_KEY"] = settings.langsmith_api_key.get_secret_value()
     os.environ["LANGSMITH_PROJECT"] = settings.langsmith_project
 
-app = FastAPI(title=settings.PROJECT_NAME)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Agents and clients are built on first use; optionally build them right
+    # after startup instead, in the background so probes answer meanwhile
+    warmup_task = None
+    if settings.warmup_on_startup:
+        warmup_task = warmup_service.start()
+    # Background audits and anomaly scans queued through /jobs
+    job_service.start()
+    yield
+    await job_service.stop()
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
 
-# Link limiter to app state and register error handler
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-app.add_middleware(SlowAPIMiddleware)
 
-# Include all V1 routes
-app.include_router(api_router, prefix="/api/v1")
+app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
+
+# Include all V1 routes, each drawing its cost from the caller's rate limit budget
+app.include_router(api_router, prefix="/api/v1", dependencies=[Depends(limiter)])
+
+# Liveness/readiness probes live outside the versioned API and its rate limit
+app.include_router(health.router, prefix="/health", tags=["Health"])
@@ -1,34 +1,14 @@
-from langchain.chat_models import init_chat_model
-from pydantic import BaseModel, Field
 from typing import List
 import asyncio
 from datetime import datetime
+from src.backend.ai.llm_cache import llm_cache
+from src.backend.ai.model_registry import model_registry
 from src.backend.core.config import settings
-
-# ============================================================================
-# RESPONSE SCHEMAS
-# ============================================================================
-
-class DetectedAnomaly(BaseModel):
-    """A detected anomaly in submission documents"""
-    anomaly_id: str
-    document_type: str
-    anomaly_type: str  # e.g., "missing_field", "inconsistent_data", "suspicious_pattern"
-    severity: str = Field(..., description="low, medium, high, critical")
-    description: str
-    affected_field: str
-    evidence: str
-    recommended_action: str
-
-class AnomalyDetectionResponse(BaseModel):
-    """Complete anomaly detection response"""
-    submission_id: str
-    documents_analyzed: int
-    anomalies_detected: int
-    risk_level: str = Field(..., description="low, medium, high, critical")
-    detected_anomalies: List[DetectedAnomaly]
-    summary: str
-    analyzed_at: datetime
+from src.backend.core.singleflight import single_flight
+from src.backend.schemas.anomaly_response import AnomalyDetectionResponse, DetectedAnomaly
+from src.backend.schemas.extracted_fields import ExtractedDocument
+from src.backend.services.anomaly_prescreen_service import anomaly_prescreen
+from src.backend.services.field_store_service import extracted_field_store, render_compact
 
 # ============================================================================
 # MOCK DATABASE & MONGODB FUNCTIONS
@@ -139,17 +119,8 @@ class AnomalyDetectionAgent:
     
     def __initialize_agent(self):
         """Initialize the anomaly detection agent with LLM"""
-        model_name = "qwen2.5-coder"
-        model_provider = "ollama"
-        base_url = "https://waldo-unappliable-supersolemnly.ngrok-free.dev"
-        api_key = settings.model_api_key.get_secret_value()
-        
-        self.model = init_chat_model(
-            model=model_name,
-            model_provider=model_provider,
-            base_url=base_url,
-            api_key=api_key
-        )
+        self.model_name = settings.llm_model_name
+        self.model = model_registry.get_model()
         
         print("Anomaly Detection Agent initialized")
     
@@ -161,12 +132,17 @@ class AnomalyDetectionAgent:
         """Retrieve document metadata from database (mocked)"""
         return mock_get_document_metadata(document_id)
     
-    async def detect_anomalies(self, submission_id: str) -> AnomalyDetectionResponse:
+    @single_flight(
+        "anomalies",
+        key=lambda self, submission_id, use_cache=True: (submission_id, use_cache)
+    )
+    async def detect_anomalies(self, submission_id: str, use_cache: bool = True) -> AnomalyDetectionResponse:
         """
         Detect anomalies in submission documents
         
         Args:
             submission_id: The submission ID to analyze
+            use_cache: Serve byte-identical prompts from the LLM response cache
         
         Returns:
             AnomalyDetectionResponse with detected anomalies
@@ -175,17 +151,29 @@ class AnomalyDetectionAgent:
         # Get all submission documents
         documents = self._get_submission_documents(submission_id)
         
-        # Create tasks to analyze each document in parallel
+        # Parse each document into typed fields once; unchanged documents come from the store
+        extracted = await asyncio.to_thread(extracted_field_store.get_documents, submission_id, documents)
+        
+        # Deterministic checks first, within and across documents; only documents
+        # that pass them or need judgment are sent to the LLM
+        all_anomalies = anomaly_prescreen.check_consistency(extracted)
+        llm_documents = []
+        for doc, fields in zip(documents, extracted):
+            prescreen_anomalies, needs_llm = anomaly_prescreen.screen(doc)
+            all_anomalies.extend(prescreen_anomalies)
+            if needs_llm:
+                llm_documents.append((doc, fields))
+        
+        # Create tasks to analyze each remaining document in parallel
         tasks = [
-            self._analyze_document(submission_id, doc)
-            for doc in documents
+            self._analyze_document(submission_id, doc, fields, use_cache)
+            for doc, fields in llm_documents
         ]
         
         # Execute all analyses concurrently
         analysis_results = await asyncio.gather(*tasks)
         
         # Flatten and collect all detected anomalies
-        all_anomalies = []
         for result in analysis_results:
             all_anomalies.extend(result)
         
@@ -218,18 +206,27 @@ class AnomalyDetectionAgent:
             risk_level=overall_risk_level,
             detected_anomalies=all_anomalies,
             summary=summary,
-            analyzed_at=datetime.now()
+            analyzed_at=datetime.now(),
+            llm_calls_avoided=len(documents) - len(llm_documents)
         )
         
         return anomaly_response
     
-    async def _analyze_document(self, submission_id: str, document: dict) -> List[DetectedAnomaly]:
+    async def _analyze_document(
+        self,
+        submission_id: str,
+        document: dict,
+        fields: ExtractedDocument,
+        use_cache: bool = True
+    ) -> List[DetectedAnomaly]:
         """
         Analyze a single document for anomalies (called in parallel for all documents)
         
         Args:
             submission_id: The submission ID
             document: The document to analyze
+            fields: The document's extracted fields, sent instead of its raw content
+            use_cache: Serve a byte-identical prompt from the LLM response cache
         
         Returns:
             List of DetectedAnomaly objects for this document
@@ -248,8 +245,8 @@ class AnomalyDetectionAgent:
         Uploaded Date: {document.get('uploaded_date')}
         File Size: {document.get('file_size')} bytes
         
-        DOCUMENT CONTENT:
-        {document.get('content')}
+        DOCUMENT FIELDS (extracted from the document content, dates in ISO format):
+        {render_compact(fields)}
         
         DOCUMENT METADATA:
         {self._format_metadata(metadata)}
@@ -274,7 +271,7 @@ class AnomalyDetectionAgent:
         """
         
         # Get LLM analysis
-        response_text = await self.model.ainvoke(prompt)
+        response_text = await llm_cache.ainvoke(self.model, self.model_name, prompt, use_cache=use_cache)
         
         # Parse response into DetectedAnomaly objects
         return self._parse_anomaly_response(
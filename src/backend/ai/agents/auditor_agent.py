@@ -1,11 +1,20 @@
-from langchain.chat_models import init_chat_model
+from langchain_core.documents import Document
 import asyncio
+import hashlib
+import json
 from datetime import datetime
-from src.backend.ai.prompts.prompt import AUDITOR_AGENT_PROMPT
+from typing import AsyncIterator, List, Optional, Tuple
+from src.backend.ai.llm_cache import llm_cache
+from src.backend.ai.model_registry import model_registry
+from src.backend.ai.prompts.prompt import AUDITOR_AGENT_PROMPT, AUDITOR_BATCH_AGENT_PROMPT
 from src.backend.core.config import settings
+from src.backend.core.singleflight import single_flight
+from pydantic import ValidationError
 from src.backend.schemas.audit_response import AuditResponse, RuleValidationResult
+from src.backend.services.audit_result_store import audit_result_store
 from src.backend.services.auditor_service import get_audit_rules_from_db
-from src.backend.services.mongo_vectorstore_service import get_document_context
+from src.backend.services.field_store_service import CONTEXT_FORMAT_VERSION, extracted_field_store, render_compact
+from src.backend.services.mongo_vectorstore_service import get_document_contexts
 
 
 class AuditorAgent:
@@ -21,50 +30,257 @@ class AuditorAgent:
     
     def __initialize_agent(self):
         """Initialize the auditor agent with LLM"""
-        model_name = "qwen2.5-coder"
-        model_provider = "ollama"
-        base_url = "https://waldo-unappliable-supersolemnly.ngrok-free.dev"
-        api_key = settings.model_api_key.get_secret_value()
-        
-        self.model = init_chat_model(
-            model=model_name,
-            model_provider=model_provider,
-            base_url=base_url,
-            api_key=api_key
-        )
+        self.model_name = settings.llm_model_name
+        self.model = model_registry.get_model()
         
         print("Auditor Agent initialized")
     
     
-    async def _retrieve_context(self, submission_id: str, rule: dict) -> str:
-        """Retrieve relevant context from MongoDB (mocked)"""
-        query = f"submission:{submission_id} context:document {rule.get('rule_name', '')}"
-        return await get_document_context(submission_id, query)
+    async def _retrieve_contexts(self, submission_id: str, rules: list) -> list:
+        """Retrieve context for every rule with one batched embedding call and search pass"""
+        queries = [
+            f"submission:{submission_id} context:document {rule.get('rule_name', '')}"
+            for rule in rules
+        ]
+        return await get_document_contexts(submission_id, queries)
+    
+    def _fingerprint(self, rule: dict, doc_context: list) -> str:
+        """Hash everything a rule's verdict depends on: rule text, prompt, model, retrieved chunks and how they are rendered"""
+        payload = {
+            "rule": [rule["rule_id"], rule["rule_name"], rule["rule_description"], rule["severity"]],
+            "prompt": AUDITOR_BATCH_AGENT_PROMPT if settings.audit_batch_size > 1 else AUDITOR_AGENT_PROMPT,
+            "context_format": CONTEXT_FORMAT_VERSION,
+            "model": self.model_name,
+            "chunks": [
+                [
+                    str(doc.id or doc.metadata.get("_id", "")),
+                    doc.metadata.get("FileName", ""),
+                    hashlib.sha256(doc.page_content.encode("utf-8")).hexdigest()
+                ]
+                for doc in doc_context
+            ],
+        }
+        return hashlib.sha256(json.dumps(payload, default=str).encode("utf-8")).hexdigest()
+    
+    async def _plan_evaluation(self, submission_id: str, reuse_previous: bool):
+        """
+        Split the rules into stored results that are still valid and rules to evaluate
+        
+        Returns:
+            (rules, reused results, [(rule, doc_context, fingerprint)] still to evaluate)
+        """
+        # Get audit rules
+        rules = await get_audit_rules_from_db()
+        
+        # Retrieve context for all rules in one batch
+        rule_contexts = await self._retrieve_contexts(submission_id, rules)
+        
+        stored = await asyncio.to_thread(audit_result_store.get_results, submission_id) if reuse_previous else {}
+        
+        reused, pending = [], []
+        for rule, doc_context in zip(rules, rule_contexts):
+            fingerprint = self._fingerprint(rule, doc_context)
+            previous = stored.get(rule["rule_id"])
+            if previous and previous[0] == fingerprint:
+                reused.append(previous[1])
+            else:
+                pending.append((rule, doc_context, fingerprint))
+        
+        return rules, reused, await self._compact_contexts(submission_id, pending)
+    
+    async def _compact_contexts(self, submission_id: str, pending: list) -> list:
+        """Replace each pending rule's chunks with their extracted fields from the shared field store"""
+        chunks = {}
+        for _, doc_context, _ in pending:
+            for doc in doc_context:
+                chunks.setdefault(self._chunk_key(doc), doc)
+        if not chunks:
+            return pending
+        
+        extracted = await asyncio.to_thread(
+            extracted_field_store.get_documents,
+            submission_id,
+            [
+                {"document_id": key, "document_type": doc.metadata.get("FileName"), "content": doc.page_content}
+                for key, doc in chunks.items()
+            ]
+        )
+        compact = {
+            key: Document(page_content=render_compact(fields), metadata=doc.metadata, id=doc.id)
+            for (key, doc), fields in zip(chunks.items(), extracted)
+        }
+        return [
+            (rule, [compact[self._chunk_key(doc)] for doc in doc_context], fingerprint)
+            for rule, doc_context, fingerprint in pending
+        ]
+    
+    @staticmethod
+    def _chunk_key(doc) -> str:
+        return str(doc.id or hashlib.sha256(doc.page_content.encode("utf-8")).hexdigest())
     
+    def _group_pending(self, pending: list) -> List[list]:
+        """
+        Pack pending (rule, doc_context, fingerprint) entries into batches of at most AUDIT_BATCH_SIZE
+        
+        Rules are first grouped with the batch whose retrieved chunks overlap theirs
+        most, so shared context is sent once. Under-filled batches are then merged
+        so the number of LLM calls stays close to len(pending) / batch size.
+        """
+        batch_size = settings.audit_batch_size
+        if batch_size <= 1:
+            return [[entry] for entry in pending]
+        
+        batches, batch_chunks = [], []
+        for entry in pending:
+            chunks = {self._chunk_key(doc) for doc in entry[1]}
+            best, best_overlap = None, 0
+            for i, batch in enumerate(batches):
+                overlap = len(chunks & batch_chunks[i])
+                if len(batch) < batch_size and overlap > best_overlap:
+                    best, best_overlap = i, overlap
+            if best is None:
+                batches.append([entry])
+                batch_chunks.append(set(chunks))
+            else:
+                batches[best].append(entry)
+                batch_chunks[best] |= chunks
+        
+        # First-fit merge of the leftovers, largest batches first
+        merged = []
+        for batch in sorted(batches, key=len, reverse=True):
+            target = next((m for m in merged if len(m) + len(batch) <= batch_size), None)
+            if target is None:
+                merged.append(list(batch))
+            else:
+                target.extend(batch)
+        return merged
+    
+    async def _evaluate_and_store(
+        self,
+        submission_id: str,
+        group: list,
+        use_cache: bool = True
+    ) -> List[RuleValidationResult]:
+        """Evaluate one group of (rule, doc_context, fingerprint) entries and persist the results"""
+        if len(group) == 1:
+            rule, doc_context, _ = group[0]
+            results = [await self._evaluate_single_rule(submission_id, rule, doc_context, use_cache)]
+        else:
+            results = await self._evaluate_rule_batch(
+                submission_id,
+                [(rule, doc_context) for rule, doc_context, _ in group],
+                use_cache
+            )
+        await asyncio.to_thread(
+            audit_result_store.save_results,
+            submission_id,
+            [(fingerprint, result) for (_, _, fingerprint), result in zip(group, results)]
+        )
+        return results
+    
+    # Duplicate audits of a submission (several underwriters opening it) share one run
+    @single_flight(
+        "audit",
+        key=lambda self, submission_id, reuse_previous=True, use_cache=True: (submission_id, reuse_previous, use_cache)
+    )
     async def evaluate_submission(
         self,
-        submission_id: str
+        submission_id: str,
+        reuse_previous: bool = True,
+        use_cache: bool = True
     ) -> AuditResponse:
         """
         Evaluate a submission against all audit rules in PARALLEL for faster execution
         
+        Rules whose text and retrieved context are unchanged since the last audit
+        reuse the stored result instead of calling the LLM again.
+        
         Args:
             submission_id: The submission ID to audit
+            reuse_previous: Reuse stored results for unchanged rules
+            use_cache: Serve byte-identical prompts from the LLM response cache
         
         Returns:
             AuditResponse with detailed validation results
         """
-        # Get audit rules
-        rules = get_audit_rules_from_db()
-        
-        # Create tasks for all rules to run in parallel
+        rules, reused, pending = await self._plan_evaluation(submission_id, reuse_previous)
+
+        # Create tasks for changed rules (one per batch) to run in parallel
         tasks = [
-            self._evaluate_single_rule(submission_id, rule)
-            for rule in rules
+            self._evaluate_and_store(submission_id, group, use_cache)
+            for group in self._group_pending(pending)
         ]
 
         # Execute all evaluations concurrently
-        validation_results = await asyncio.gather(*tasks)
+        computed = [result for results in await asyncio.gather(*tasks) for result in results]
+        
+        return self._build_audit_response(
+            submission_id,
+            self._in_rule_order(rules, reused + computed),
+            reused_count=len(reused)
+        )
+    
+    async def stream_evaluation(
+        self,
+        submission_id: str,
+        reuse_previous: bool = True,
+        use_cache: bool = True
+    ) -> AsyncIterator[dict]:
+        """
+        Evaluate a submission and yield each rule result as soon as it completes
+        
+        Args:
+            submission_id: The submission ID to audit
+            reuse_previous: Reuse stored results for unchanged rules
+            use_cache: Serve byte-identical prompts from the LLM response cache
+        
+        Yields:
+            {"event": "rule_result", "data": RuleValidationResult} per rule, reused results
+            first and the rest in completion order, then {"event": "summary", "data": AuditResponse}
+        """
+        rules, reused, pending = await self._plan_evaluation(submission_id, reuse_previous)
+        
+        tasks = [
+            asyncio.create_task(self._evaluate_and_store(submission_id, group, use_cache))
+            for group in self._group_pending(pending)
+        ]
+        
+        try:
+            validation_results = []
+            for result in reused:
+                validation_results.append(result)
+                yield {"event": "rule_result", "data": result}
+            
+            for next_results in asyncio.as_completed(tasks):
+                for result in await next_results:
+                    validation_results.append(result)
+                    yield {"event": "rule_result", "data": result}
+            
+            yield {
+                "event": "summary",
+                "data": self._build_audit_response(
+                    submission_id,
+                    self._in_rule_order(rules, validation_results),
+                    reused_count=len(reused)
+                )
+            }
+        finally:
+            # Stop outstanding LLM calls if the consumer goes away
+            for task in tasks:
+                task.cancel()
+    
+    def _in_rule_order(self, rules: list, results: List[RuleValidationResult]) -> List[RuleValidationResult]:
+        """Sort results into rules_master order"""
+        order = {rule["rule_id"]: i for i, rule in enumerate(rules)}
+        return sorted(results, key=lambda r: order.get(r.rule_id, len(order)))
+    
+    def _build_audit_response(
+        self,
+        submission_id: str,
+        validation_results: List[RuleValidationResult],
+        reused_count: int = 0
+    ) -> AuditResponse:
+        """Aggregate rule results into an AuditResponse"""
         
         # Calculate pass/fail counts
         passed_count = sum(1 for r in validation_results if r.status.upper() == "PASS")
@@ -78,9 +294,11 @@ class AuditorAgent:
             submission_id=submission_id,
             overall_status=overall_status,
             evaluated_at=datetime.now(),
-            total_rules=len(rules),
+            total_rules=len(validation_results),
             passed_rules=passed_count,
             failed_rules=failed_count,
+            reused_rules=reused_count,
+            recomputed_rules=len(validation_results) - reused_count,
             validation_results=validation_results
         )
         
@@ -89,7 +307,9 @@ class AuditorAgent:
     async def _evaluate_single_rule(
         self,
         submission_id: str,
-        rule: dict
+        rule: dict,
+        doc_context: list,
+        use_cache: bool = True
     ) -> RuleValidationResult:
         """
         Evaluate a single rule (called in parallel for all rules)
@@ -97,14 +317,13 @@ class AuditorAgent:
         Args:
             submission_id: The submission ID
             rule: The rule to evaluate
+            doc_context: Documents retrieved for this rule
+            use_cache: Serve a byte-identical prompt from the LLM response cache
         
         Returns:
             RuleValidationResult for this specific rule
         """
-        # Retrieve context for this rule
-        doc_context = await self._retrieve_context(submission_id, rule)
-
-        # 2. Format the context with Source names
+        # Format the context with Source names
         formatted_context = ""
         for i, doc in enumerate(doc_context):
             source = doc.metadata.get('FileName', 'Unknown Source')
@@ -118,16 +337,112 @@ class AuditorAgent:
             severity=rule["severity"]
         )
 
-        response =  await self.model.ainvoke(prompt)
+        response_text = await llm_cache.ainvoke(self.model, self.model_name, prompt, use_cache=use_cache)
 
         # Parse and return result
         return self._parse_evaluation_response(
             rule_id=rule['rule_id'],
             rule_name=rule['rule_name'],
             rule_description=rule['rule_description'],
-            response_text=response.content
+            response_text=response_text
         )
     
+    async def _evaluate_rule_batch(
+        self,
+        submission_id: str,
+        batch: List[Tuple[dict, list]],
+        use_cache: bool = True
+    ) -> List[RuleValidationResult]:
+        """
+        Evaluate several rules with one LLM call returning a JSON array
+        
+        Chunks shared between rules are sent once. Rules missing from the answer,
+        or all of them if it is not a valid JSON array, fall back to per-rule calls.
+        
+        Args:
+            submission_id: The submission ID
+            batch: (rule, doc_context) pairs to evaluate together
+            use_cache: Serve a byte-identical prompt from the LLM response cache
+        
+        Returns:
+            RuleValidationResult per rule, in batch order
+        """
+        # Number every distinct chunk once and point each rule at its own sources
+        sources = {}
+        formatted_context = ""
+        formatted_rules = ""
+        for rule, doc_context in batch:
+            rule_sources = []
+            for doc in doc_context:
+                key = self._chunk_key(doc)
+                if key not in sources:
+                    sources[key] = len(sources) + 1
+                    source = doc.metadata.get('FileName', 'Unknown Source')
+                    formatted_context += f"\n--- Source {sources[key]}: {source} ---\n{doc.page_content}\n"
+                rule_sources.append(str(sources[key]))
+            formatted_rules += (
+                f"\nRule ID: {rule['rule_id']}\n"
+                f"Rule Name: {rule['rule_name']}\n"
+                f"Rule Description: \n{rule['rule_description']}\n"
+                f"Severity: {rule['severity']}\n"
+                f"Relevant Sources: {', '.join(rule_sources) or 'None'}\n"
+            )
+        
+        prompt = AUDITOR_BATCH_AGENT_PROMPT.format(rules=formatted_rules, context=formatted_context)
+        response_text = await llm_cache.ainvoke(self.model, self.model_name, prompt, use_cache=use_cache)
+        
+        parsed = self._parse_batch_response([rule for rule, _ in batch], response_text)
+        missing = [(rule, doc_context) for rule, doc_context in batch if rule["rule_id"] not in parsed]
+        if missing:
+            print(f"Batch evaluation returned no valid result for {len(missing)} of {len(batch)} rules, falling back to per-rule calls")
+            fallback = await asyncio.gather(*[
+                self._evaluate_single_rule(submission_id, rule, doc_context, use_cache)
+                for rule, doc_context in missing
+            ])
+            parsed.update({result.rule_id: result for result in fallback})
+        
+        return [parsed[rule["rule_id"]] for rule, _ in batch]
+    
+    def _parse_batch_response(self, rules: List[dict], response_text: str) -> dict:
+        """Parse a JSON array answer into {rule_id: RuleValidationResult}, skipping invalid entries"""
+        items = self._extract_json_array(response_text)
+        if items is None:
+            return {}
+        
+        rules_by_id = {str(rule["rule_id"]): rule for rule in rules}
+        results = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            rule = rules_by_id.get(str(item.get("rule_id")))
+            status = str(item.get("status", "")).strip().upper()
+            if rule is None or status not in ("PASS", "FAIL"):
+                continue
+            try:
+                results[rule["rule_id"]] = RuleValidationResult.model_validate({
+                    "rule_id": rule["rule_id"],
+                    "rule_name": rule["rule_name"],
+                    "rule_description": rule["rule_description"],
+                    "status": status,
+                    "evidence": item.get("evidence"),
+                    "details": item.get("details"),
+                })
+            except ValidationError:
+                continue
+        return results
+    
+    @staticmethod
+    def _extract_json_array(response_text: str) -> Optional[list]:
+        """Return the JSON array in a model answer, tolerating code fences and surrounding prose"""
+        start, end = response_text.find("["), response_text.rfind("]")
+        if start == -1 or end <= start:
+            return None
+        try:
+            items = json.loads(response_text[start:end + 1])
+        except json.JSONDecodeError:
+            return None
+        return items if isinstance(items, list) else None
+    
     def _format_submission_data(self, submission_data: dict) -> str:
         """Format submission data for prompt"""
         lines = []
@@ -1,8 +1,8 @@
-from langchain.chat_models import init_chat_model
 from langchain.agents import create_agent
+from src.backend.ai.middleware.llm_limiter_middleware import LLMLimiterMiddleware
+from src.backend.ai.model_registry import model_registry
 from src.backend.ai.prompts.prompt import DOCUMENT_ANALYST_AGENT_PROMPT
 from src.backend.ai.tools.retrieve_context_tool import retrieve_context_tool
-from src.backend.core.config import settings
 
 class DocAnalystAgent:
     _instance = None  # Class-level variable to store the single instance
@@ -18,24 +18,13 @@ class DocAnalystAgent:
     def __initialize_agent(self):
         """Private initialization logic"""
 
-        model_name="qwen2.5-coder"
-        model_provider= "ollama"
-        base_url= "https://waldo-unappliable-supersolemnly.ngrok-free.dev"
-        api_key=settings.model_api_key.get_secret_value()
-
-
-        model = init_chat_model(
-            model=model_name,
-            model_provider=model_provider,
-            base_url=base_url,
-            api_key=api_key,
-            #max_tokens=500 
-        )
+        model = model_registry.get_model()
 
         self.agent = create_agent(
             model=model,
             tools=[retrieve_context_tool],
-            system_prompt=DOCUMENT_ANALYST_AGENT_PROMPT
+            system_prompt=DOCUMENT_ANALYST_AGENT_PROMPT,
+            middleware=[LLMLimiterMiddleware()]
         )
 
         print("Document RAG Agent initialized")
@@ -0,0 +1,8 @@
+from src.backend.core.lazy import lazy_import
+
+# Each agent module pulls in LangChain, LangGraph and its model/vector store
+# clients, so the API imports it on the first request that needs it.
+auditor_agent = lazy_import("src.backend.ai.agents.auditor_agent", "auditor_agent")
+anomaly_detection_agent = lazy_import("src.backend.ai.agents.anomaly_detection_agent", "anomaly_detection_agent")
+sql_analyst_agent = lazy_import("src.backend.ai.agents.sql_agent", "sql_analyst_agent")
+doc_analyst_agent = lazy_import("src.backend.ai.agents.doc_agent", "doc_analyst_agent")
@@ -1,16 +1,17 @@
-from langchain.chat_models import init_chat_model
-from langgraph.checkpoint.memory import InMemorySaver 
-from langchain.agents.middleware import PIIMiddleware, HumanInTheLoopMiddleware, ModelCallLimitMiddleware, ContextEditingMiddleware, ClearToolUsesEdit
-from langgraph.checkpoint.memory import InMemorySaver 
+from langchain.agents.middleware import HumanInTheLoopMiddleware, ModelCallLimitMiddleware, ContextEditingMiddleware, ClearToolUsesEdit
 from langchain.agents import create_agent
 from src.backend.ai.middleware.contentfilter_guardrail import ContentFilterMiddleware
-from src.backend.ai.middleware.delete_old_memory import delete_old_messages
+from src.backend.ai.middleware.conversation_compaction import conversation_compaction
+from src.backend.ai.middleware.llm_limiter_middleware import LLMLimiterMiddleware
+from src.backend.ai.model_registry import model_registry
 #from deepagents import create_deep_agent
 #from src.backend.ai.middleware.safety_guardrail import SafetyGuardrailMiddleware
 from src.backend.ai.tools.sql_analyst_tool import get_sql_analyst_tools
-from src.backend.core.config import settings
-from src.backend.ai.prompts.prompt import CONTENT_FILTER_LIST, SQL_ANALYST_AGENT_PROMPT
+from src.backend.ai.middleware.schema_prompt import sql_schema_prompt
+from src.backend.ai.prompts.prompt import CONTENT_FILTER_LIST
+from src.backend.ai.state.bounded_checkpointer import conversation_checkpointer
 from src.backend.ai.state.customer_state import CustomAgentState
+from src.backend.services.schema_digest_service import schema_digest
 from src.backend.services.sql_service import DatabaseManager
 
 class SQLAnalystAgent:
@@ -27,34 +28,29 @@ class SQLAnalystAgent:
     def __initialize_agent(self):
         """Private initialization logic"""
 
-        model_name="qwen2.5-coder"
-        model_provider= "ollama"
-        base_url= "https://waldo-unappliable-supersolemnly.ngrok-free.dev"
-        api_key=settings.model_api_key.get_secret_value()
-
-
-        model = init_chat_model(
-            model=model_name,
-            model_provider=model_provider,
-            base_url=base_url,
-            api_key=api_key,
-            #max_tokens=500 
-        )
+        model = model_registry.get_model()
 
         db = DatabaseManager.get_shared_db()
         tools = get_sql_analyst_tools(db,model)
 
-        system_prompt = SQL_ANALYST_AGENT_PROMPT.format(
-                dialect=db.dialect,
-                top_k=5,
-            )
+        # Built once here; the prompt middleware rebuilds it when it gets stale
+        schema_digest.refresh_if_stale()
 
         self.agent = create_agent(
             model=model,
             tools=tools,
-            system_prompt=system_prompt,
             middleware=[
-                ContentFilterMiddleware(banned_keywords=CONTENT_FILTER_LIST),
+                # System prompt with the schema of the tables relevant to the question
+                sql_schema_prompt(top_k=5),
+
+                # Banned keywords and PII in one pass over the user's messages
+                ContentFilterMiddleware(
+                    banned_keywords=CONTENT_FILTER_LIST,
+                    pii_strategies={
+                        "credit_card": "mask",
+                        "api_key": "block",
+                    },
+                ),
 
                 ModelCallLimitMiddleware(
                     run_limit=5,
@@ -70,25 +66,16 @@ class SQLAnalystAgent:
                     ],
                 ),
 
-                PIIMiddleware(
-                    "credit_card",
-                    strategy="mask",
-                    apply_to_input=True,
-                ),
-                PIIMiddleware(
-                    "api_key",
-                    detector=r"sk-[a-zA-Z0-9]{32}",
-                    strategy="block",
-                    apply_to_input=True,
-                ),
+                # Shrinks old tool outputs, then summarizes old turns, past the token budget
+                conversation_compaction,
 
-                delete_old_messages
+                LLMLimiterMiddleware(),
                 #HumanInTheLoopMiddleware(interrupt_on={"delete_database": True}),
 
                 # SafetyGuardrailMiddleware(),
             ],
             context_schema=CustomAgentState, 
-            checkpointer=InMemorySaver(),  
+            checkpointer=conversation_checkpointer,
             )
 
         print("SQL Agent initialized")
@@ -0,0 +1,187 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+from langchain_core.language_models import BaseChatModel
+from src.backend.ai.llm_limiter import llm_limiter
+from src.backend.core.config import settings
+
+
+class LLMResponseCache:
+    """
+    Exact-match cache for deterministic LLM calls.
+
+    Responses are keyed by a SHA-256 of (model name, prompt), so only a
+    byte-identical prompt to the same model is a hit. Entries expire after
+    ``ttl_seconds`` and the table is capped by size, evicting least recently
+    used responses first. Misses go through the shared LLM limiter.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float, max_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # The byte total lives in the database, kept by triggers, so every
+        # process sharing the file enforces the cap against the same number
+        self._connection.executescript("""
+            BEGIN IMMEDIATE;
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_llm_responses_last_access ON llm_responses (last_access);
+            CREATE TABLE IF NOT EXISTS llm_responses_size (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                total INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO llm_responses_size (id, total)
+                SELECT 0, COALESCE(SUM(size), 0) FROM llm_responses;
+            CREATE TRIGGER IF NOT EXISTS llm_responses_size_insert AFTER INSERT ON llm_responses
+                BEGIN UPDATE llm_responses_size SET total = total + NEW.size WHERE id = 0; END;
+            CREATE TRIGGER IF NOT EXISTS llm_responses_size_update AFTER UPDATE OF size ON llm_responses
+                BEGIN UPDATE llm_responses_size SET total = total + NEW.size - OLD.size WHERE id = 0; END;
+            CREATE TRIGGER IF NOT EXISTS llm_responses_size_delete AFTER DELETE ON llm_responses
+                BEGIN UPDATE llm_responses_size SET total = total - OLD.size WHERE id = 0; END;
+            COMMIT;
+        """)
+
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.expired = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(model_name: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model_name}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, model_name: str, prompt: str) -> Optional[str]:
+        """Return the cached response for this exact prompt, or None"""
+        key = self._key(model_name, prompt)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM llm_responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row and now - row[1] > self.ttl_seconds:
+                self._connection.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._connection.commit()
+                self.expired += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._connection.execute("UPDATE llm_responses SET last_access = ? WHERE key = ?", (now, key))
+            self._connection.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, model_name: str, prompt: str, response: str) -> None:
+        """Store a response, evicting old entries if the cache is over its size cap"""
+        key = self._key(model_name, prompt)
+        size = len(response.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            # Upsert rather than REPLACE so a re-stored key changes the total by its size delta
+            self._connection.execute(
+                """
+                INSERT INTO llm_responses (key, model, response, size, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    model = excluded.model, response = excluded.response, size = excluded.size,
+                    created_at = excluded.created_at, last_access = excluded.last_access
+                """,
+                (key, model_name, response, size, now, now)
+            )
+            # The write above holds the database lock, so the total is current
+            # for every process until this transaction commits
+            if self._bytes() > self.max_bytes:
+                self._evict()
+            self._connection.commit()
+
+    def _bytes(self) -> int:
+        return self._connection.execute("SELECT total FROM llm_responses_size WHERE id = 0").fetchone()[0]
+
+    def _evict(self) -> None:
+        """Drop expired responses, then least recently used ones until at 90% of the cap"""
+        cutoff = time.time() - self.ttl_seconds
+        expired = self._connection.execute("DELETE FROM llm_responses WHERE created_at < ?", (cutoff,))
+        self.expired += expired.rowcount
+
+        excess = self._bytes() - int(self.max_bytes * 0.9)
+        rows = self._connection.execute("SELECT key, size FROM llm_responses ORDER BY last_access")
+        evicted = []
+        for key, size in rows:
+            if excess <= 0:
+                break
+            evicted.append((key,))
+            excess -= size
+        self._connection.executemany("DELETE FROM llm_responses WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+
+    async def ainvoke(self, model: BaseChatModel, model_name: str, prompt: str, use_cache: bool = True) -> str:
+        """
+        Return the model's text response for ``prompt``, serving repeats from the cache
+
+        Args:
+            model: Chat model used on a miss
+            model_name: Name the response is cached under
+            prompt: Fully rendered prompt
+            use_cache: False skips the lookup and always calls the model (the fresh response is still stored)
+        """
+        if use_cache:
+            cached = await asyncio.to_thread(self.get, model_name, prompt)
+            if cached is not None:
+                return cached
+        else:
+            self.bypassed += 1
+
+        async with llm_limiter.slot():
+            response = await model.ainvoke(prompt)
+
+        await asyncio.to_thread(self.put, model_name, prompt, response.content)
+        return response.content
+
+    def clear(self) -> None:
+        """Drop every cached response"""
+        with self._lock:
+            self._connection.execute("DELETE FROM llm_responses")
+            self._connection.commit()
+
+    def stats(self) -> dict:
+        """Cache counters for the metrics endpoint"""
+        lookups = self.hits + self.misses
+        with self._lock:
+            entries = self._connection.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+            size = self._bytes()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "bypassed": self.bypassed,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size,
+        }
+
+
+llm_cache = LLMResponseCache(
+    db_path=settings.llm_cache_path,
+    ttl_seconds=settings.llm_cache_ttl_seconds,
+    max_bytes=settings.llm_cache_max_bytes
+)
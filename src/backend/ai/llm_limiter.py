@@ -0,0 +1,162 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque
+from src.backend.core.config import settings
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Shared AIMD limiter for outbound LLM calls.
+
+    Callers wait in a FIFO queue until fewer than ``limit`` calls are in flight.
+    Every call that finishes within the latency target raises the limit by
+    ``1 / limit`` (about +1 per full window); a slow or failed call halves it,
+    at most once per observed round trip so one burst of slow responses only
+    counts as a single congestion signal.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_target_seconds: float,
+        backoff_ratio: float = 0.5
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target_seconds = latency_target_seconds
+        self.backoff_ratio = backoff_ratio
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+        self._smoothed_latency = 0.0
+
+        self.total_calls = 0
+        self.failed_calls = 0
+        self.cancelled_calls = 0
+        self.slow_calls = 0
+        self.decreases = 0
+        self.max_queue_depth = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight"""
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    async def acquire(self) -> None:
+        """Wait for a free slot"""
+        if self._in_flight < self.limit and not self.queue_depth:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation; give it back
+                self._in_flight -= 1
+                self._wake_waiters()
+            raise
+
+    def release(self, latency_seconds: float, failed: bool = False, cancelled: bool = False) -> None:
+        """
+        Return a slot and feed the call outcome into the AIMD controller.
+        A cancelled call says nothing about the provider, so it only frees the slot.
+        """
+        self._in_flight -= 1
+        if cancelled:
+            self.cancelled_calls += 1
+        else:
+            self._record(latency_seconds, failed)
+        self._wake_waiters()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one LLM call slot for the duration of the block"""
+        await self.acquire()
+        started_at = time.monotonic()
+        failed = False
+        cancelled = False
+        try:
+            yield
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.release(time.monotonic() - started_at, failed, cancelled)
+
+    def _record(self, latency_seconds: float, failed: bool) -> None:
+        self.total_calls += 1
+        if self._smoothed_latency == 0.0:
+            self._smoothed_latency = latency_seconds
+        else:
+            self._smoothed_latency = 0.8 * self._smoothed_latency + 0.2 * latency_seconds
+
+        slow = latency_seconds > self.latency_target_seconds
+        if failed:
+            self.failed_calls += 1
+        if slow:
+            self.slow_calls += 1
+
+        now = time.monotonic()
+        if failed or slow:
+            # Multiplicative decrease, once per round trip
+            if now - self._last_decrease >= self._smoothed_latency:
+                self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+                self._last_decrease = now
+                self.decreases += 1
+        else:
+            # Additive increase
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def stats(self) -> dict:
+        """Limiter counters for the metrics endpoint"""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "total_calls": self.total_calls,
+            "failed_calls": self.failed_calls,
+            "cancelled_calls": self.cancelled_calls,
+            "slow_calls": self.slow_calls,
+            "decreases": self.decreases,
+            "smoothed_latency_seconds": round(self._smoothed_latency, 4),
+            "latency_target_seconds": self.latency_target_seconds,
+        }
+
+
+# This single instance is shared by every agent
+llm_limiter = AdaptiveConcurrencyLimiter(
+    initial_limit=settings.llm_concurrency_initial,
+    min_limit=settings.llm_concurrency_min,
+    max_limit=settings.llm_concurrency_max,
+    latency_target_seconds=settings.llm_latency_target_seconds,
+)
@@ -1,29 +1,57 @@
 from typing import Any
-from langchain.agents.middleware import AgentMiddleware, AgentState, hook_config
+from langchain.agents.middleware import AgentMiddleware, AgentState, PIIDetectionError, hook_config
+from langchain.messages import AIMessage, HumanMessage
 from langgraph.runtime import Runtime
+from src.backend.ai.middleware.pattern_matcher import KEYWORD, PII_DETECTORS, PatternMatcher
 
 class ContentFilterMiddleware(AgentMiddleware):
-    """Deterministic guardrail: Block requests containing banned keywords."""
+    """
+    Deterministic guardrail: Block requests containing banned keywords and
+    handle PII, with one scan per message.
 
-    def __init__(self, banned_keywords: list[str]):
+    ``pii_strategies`` maps a detector name to "mask" or "block", as
+    PIIMiddleware's ``strategy`` did. Every user message of the current turn
+    (those after the last AI reply) is checked.
+    """
+
+    def __init__(self, banned_keywords: list[str], pii_strategies: dict[str, str] | None = None):
         super().__init__()
-        self.banned_keywords = [kw.lower() for kw in banned_keywords]
+        self.pii_strategies = dict(pii_strategies or {})
+        unknown = set(self.pii_strategies) - set(PII_DETECTORS)
+        if unknown:
+            raise ValueError(f"Unknown PII detectors: {sorted(unknown)}")
+        for strategy in self.pii_strategies.values():
+            if strategy not in ("mask", "block"):
+                raise ValueError(f"Unsupported PII strategy: {strategy}")
+
+        self.matcher = PatternMatcher(
+            banned_keywords,
+            detectors={name: PII_DETECTORS[name] for name in self.pii_strategies}
+        )
 
     @hook_config(can_jump_to=["end"])
     def before_agent(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
-        # Get the first user message
-        if not state["messages"]:
+        messages = state["messages"]
+        if not messages:
             return None
 
-        first_message = state["messages"][0]
-        if first_message.type != "human":
-            return None
+        # Earlier turns were checked when they were sent
+        turn_start = 0
+        for index in range(len(messages) - 1, -1, -1):
+            if isinstance(messages[index], AIMessage):
+                turn_start = index + 1
+                break
 
-        content = first_message.content.lower()
+        updated = []
+        for message in messages[turn_start:]:
+            if not isinstance(message, HumanMessage) or not message.content:
+                continue
+            content = str(message.content)
+            matches = self.matcher.scan(content)
+            if not matches:
+                continue
 
-        # Check for banned keywords
-        for keyword in self.banned_keywords:
-            if keyword in content:
+            if any(match["type"] == KEYWORD for match in matches):
                 # Block execution before any processing
                 return {
                     "messages": [{
@@ -33,4 +61,21 @@ class ContentFilterMiddleware(AgentMiddleware):
                     "jump_to": "end"
                 }
 
+            for name, strategy in self.pii_strategies.items():
+                if strategy == "block":
+                    blocked = [match for match in matches if match["type"] == name]
+                    if blocked:
+                        raise PIIDetectionError(name, blocked)
+
+            masked = [match for match in matches if self.pii_strategies.get(match["type"]) == "mask"]
+            if masked:
+                # Same id, so the masked message replaces the original in state
+                updated.append(HumanMessage(
+                    content=self.matcher.mask(content, masked),
+                    id=message.id,
+                    name=message.name,
+                ))
+
+        if updated:
+            return {"messages": updated}
         return None
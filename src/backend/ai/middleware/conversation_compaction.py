@@ -0,0 +1,170 @@
+from typing import Any, List, Optional
+from langchain.agents.middleware import AgentMiddleware, AgentState
+from langchain.messages import AnyMessage, HumanMessage, RemoveMessage, SystemMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately, get_buffer_string
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
+from langgraph.runtime import Runtime
+from src.backend.ai.llm_cache import llm_cache
+from src.backend.ai.model_registry import model_registry
+from src.backend.ai.prompts.prompt import CONVERSATION_SUMMARY_PROMPT
+from src.backend.core.config import settings
+
+# count_tokens_approximately's ratio, used to turn token budgets into characters
+CHARS_PER_TOKEN = 4
+
+# Older turns are only summarized once they hold this share of the budget
+MIN_SUMMARIZED_SHARE = 0.25
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n\n"
+
+
+def message_tokens(message: AnyMessage) -> int:
+    """Approximate token count of one message, tool calls included"""
+    return count_tokens_approximately([message])
+
+
+def turn_starts(messages: List[AnyMessage]) -> List[int]:
+    """Indexes of the human messages that open each turn"""
+    return [index for index, message in enumerate(messages) if isinstance(message, HumanMessage)]
+
+
+class ConversationCompactionMiddleware(AgentMiddleware):
+    """
+    Keep the conversation sent to the model under a token budget.
+
+    Before each model call the messages are counted (approximately, about four
+    characters per token). Over ``max_tokens``, tool outputs from earlier turns
+    are cut down to ``tool_output_tokens``, oldest first; those are usually
+    large query results the model has already answered from. If that is not
+    enough and those turns still hold a fair share of the budget, every turn
+    before the last ``keep_turns`` is replaced with a model written summary.
+    The summary is a system message so the middleware never reads it as a
+    user turn: turn boundaries, the schema prompt's table selection and the
+    content filter only look at human messages. The chat model receives it
+    as an ordinary system-role message.
+    The current turn is never touched and the cut always falls on a user
+    message, so tool calls stay paired with their results. The compacted
+    messages are written back to the state, so the checkpointed thread
+    shrinks too.
+    """
+
+    def __init__(self, max_tokens: int, tool_output_tokens: int, keep_turns: int):
+        super().__init__()
+        self.max_tokens = max_tokens
+        self.tool_output_tokens = tool_output_tokens
+        self.keep_turns = keep_turns
+
+        self.turns = 0
+        self.compactions = 0
+        self.tool_outputs_shrunk = 0
+        self.summaries = 0
+        self.summary_failures = 0
+        self.tokens_saved = 0
+        self.last_tokens_before: Optional[int] = None
+        self.last_tokens_after: Optional[int] = None
+
+    def _shrink(self, message: ToolMessage) -> ToolMessage:
+        content = str(message.content)
+        keep = self.tool_output_tokens * CHARS_PER_TOKEN
+        removed = (len(content) - keep) // CHARS_PER_TOKEN
+        return ToolMessage(
+            content=f"{content[:keep]}\n[... about {removed} tokens of earlier tool output removed]",
+            id=message.id,
+            name=message.name,
+            tool_call_id=message.tool_call_id,
+        )
+
+    async def _summarize(self, messages: List[AnyMessage]) -> str:
+        conversation = get_buffer_string(messages)
+        # The summarizer's own prompt stays within the budget; the latest part matters most
+        limit = self.max_tokens * CHARS_PER_TOKEN
+        if len(conversation) > limit:
+            conversation = conversation[-limit:]
+        return await llm_cache.ainvoke(
+            model_registry.get_model(),
+            settings.llm_model_name,
+            CONVERSATION_SUMMARY_PROMPT.format(conversation=conversation),
+        )
+
+    async def abefore_agent(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+        self.turns += 1
+        return None
+
+    async def abefore_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+        messages = list(state["messages"])
+        if not messages:
+            return None
+
+        counts = [message_tokens(message) for message in messages]
+        before = sum(counts)
+        if before <= self.max_tokens:
+            return None
+
+        starts = turn_starts(messages)
+        current_turn = starts[-1] if starts else len(messages)
+        total = before
+        shrunk = []
+
+        # 1. Cut down tool outputs of earlier turns, oldest first
+        for index in range(current_turn):
+            if total <= self.max_tokens:
+                break
+            message = messages[index]
+            if not isinstance(message, ToolMessage) or counts[index] <= self.tool_output_tokens * 2:
+                continue
+            messages[index] = self._shrink(message)
+            new_count = message_tokens(messages[index])
+            total -= counts[index] - new_count
+            counts[index] = new_count
+            shrunk.append(messages[index])
+        self.tool_outputs_shrunk += len(shrunk)
+
+        # 2. Summarize the turns before the last keep_turns
+        summarized = False
+        cut = starts[-self.keep_turns] if self.keep_turns and len(starts) > self.keep_turns else None
+        # A summary of a few small turns costs a model call and saves next to nothing
+        if total > self.max_tokens and cut and sum(counts[:cut]) >= self.max_tokens * MIN_SUMMARIZED_SHARE:
+            try:
+                summary = await self._summarize(messages[:cut])
+                messages = [SystemMessage(content=SUMMARY_PREFIX + summary)] + messages[cut:]
+                total = sum(message_tokens(message) for message in messages)
+                summarized = True
+                self.summaries += 1
+            except Exception:
+                # Go on with the shrunk tool outputs; the next turn tries again
+                self.summary_failures += 1
+
+        if not shrunk and not summarized:
+            return None
+
+        saved = before - total
+        self.compactions += 1
+        self.tokens_saved += saved
+        self.last_tokens_before, self.last_tokens_after = before, total
+
+        if summarized:
+            return {"messages": [RemoveMessage(id=REMOVE_ALL_MESSAGES), *messages]}
+        # Same ids, so the shrunk messages replace the originals in place
+        return {"messages": shrunk}
+
+    def stats(self) -> dict:
+        """Compaction counters for the metrics endpoint"""
+        return {
+            "max_tokens": self.max_tokens,
+            "turns": self.turns,
+            "compactions": self.compactions,
+            "tool_outputs_shrunk": self.tool_outputs_shrunk,
+            "summaries": self.summaries,
+            "summary_failures": self.summary_failures,
+            "tokens_saved": self.tokens_saved,
+            "avg_tokens_saved_per_turn": self.tokens_saved / self.turns if self.turns else 0.0,
+            "last_tokens_before": self.last_tokens_before,
+            "last_tokens_after": self.last_tokens_after,
+        }
+
+
+conversation_compaction = ConversationCompactionMiddleware(
+    max_tokens=settings.conversation_max_tokens,
+    tool_output_tokens=settings.conversation_tool_output_tokens,
+    keep_turns=settings.conversation_keep_turns
+)
@@ -0,0 +1,15 @@
+from typing import Awaitable, Callable
+from langchain.agents.middleware import AgentMiddleware, ModelRequest, ModelResponse
+from src.backend.ai.llm_limiter import llm_limiter
+
+
+class LLMLimiterMiddleware(AgentMiddleware):
+    """Route every model call made by an agent through the shared LLM limiter."""
+
+    async def awrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+    ) -> ModelResponse:
+        async with llm_limiter.slot():
+            return await handler(request)
@@ -0,0 +1,144 @@
+import re
+import string
+from typing import Callable, Dict, Iterable, List, Optional, TypedDict
+
+CREDIT_CARD = r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b"
+API_KEY = r"sk-[a-zA-Z0-9]{32}"
+
+# Same detectors PIIMiddleware used for the SQL agent
+PII_DETECTORS = {
+    "credit_card": CREDIT_CARD,
+    "api_key": API_KEY,
+}
+
+KEYWORD = "keyword"
+
+# Digits that stay visible when a card number is masked
+UNMASKED_DIGITS = 4
+
+# Length-preserving fallback for the rare text str.lower() changes the length of
+ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+class PatternMatch(TypedDict):
+    type: str
+    value: str
+    start: int
+    end: int
+
+
+def passes_luhn(value: str) -> bool:
+    """Luhn checksum of the digits in a card number"""
+    digits = [int(c) for c in value if c.isdigit()]
+    checksum = 0
+    for position, digit in enumerate(reversed(digits)):
+        if position % 2 == 1:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        checksum += digit
+    return checksum % 10 == 0
+
+
+def mask_value(value: str) -> str:
+    """Hide all but the last four digits, keeping separators"""
+    return re.sub(r"\d", "*", value[:-UNMASKED_DIGITS]) + value[-UNMASKED_DIGITS:]
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """
+    Regex alternation for a word list arranged as a prefix trie, so each
+    position in the text is tested against one branch per distinct next
+    character instead of against every word
+    """
+    trie: dict = {}
+    for word in words:
+        if not word:
+            continue
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        terminal = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if terminal:
+            # A shorter word ends here; the longer ones are optional
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+class PatternMatcher:
+    """
+    Banned keywords and PII detectors compiled into one regex.
+
+    A scan lowercases the text once and runs a single ``finditer`` over it,
+    however many keywords and detectors there are; matching lowercase
+    literals is much cheaper for the regex engine than matching them
+    case-insensitively. Keywords match anywhere in the text, as the old
+    ``keyword in content`` loop did, through a zero-width lookahead so they
+    never hide a PII match that starts inside them. Detectors match their
+    span case-insensitively on the lowered text and are then confirmed
+    against the original, so case-sensitive patterns keep their meaning.
+    ``validators`` can reject a detector match (card numbers must pass the
+    Luhn check).
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        detectors: Optional[Dict[str, str]] = None,
+        validators: Optional[Dict[str, Callable[[str], bool]]] = None
+    ):
+        self.keywords = sorted({keyword.lower() for keyword in keywords if keyword})
+        self.detectors = {
+            name: re.compile(pattern)
+            for name, pattern in (PII_DETECTORS if detectors is None else detectors).items()
+        }
+        self.validators = {"credit_card": passes_luhn} if validators is None else dict(validators)
+
+        # Detectors first: at a given position a PII match wins over a keyword
+        alternatives = [f"(?P<{name}>(?i:{detector.pattern}))" for name, detector in self.detectors.items()]
+        if self.keywords:
+            alternatives.append(f"(?=(?P<{KEYWORD}>{trie_pattern(self.keywords)}))")
+        self.pattern = re.compile("|".join(alternatives)) if alternatives else None
+
+    def scan(self, text: str) -> List[PatternMatch]:
+        """Every keyword and PII match in the text, in order of position"""
+        if self.pattern is None or not text:
+            return []
+        folded = text.lower()
+        if len(folded) != len(text):
+            folded = text.translate(ASCII_LOWER)
+
+        matches: List[PatternMatch] = []
+        for match in self.pattern.finditer(folded):
+            kind = match.lastgroup
+            start, end = match.span(kind)
+            value = text[start:end]
+            if kind != KEYWORD:
+                if not self.detectors[kind].fullmatch(text, start, end):
+                    continue
+                validator = self.validators.get(kind)
+                if validator and not validator(value):
+                    continue
+            matches.append(PatternMatch(type=kind, value=value, start=start, end=end))
+        return matches
+
+    @staticmethod
+    def mask(text: str, matches: List[PatternMatch]) -> str:
+        """Text with the given matches masked"""
+        parts = []
+        position = 0
+        for match in matches:
+            parts.append(text[position:match["start"]])
+            parts.append(mask_value(match["value"]))
+            position = match["end"]
+        parts.append(text[position:])
+        return "".join(parts)
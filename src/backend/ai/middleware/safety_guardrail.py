@@ -1,9 +1,8 @@
 from langchain.agents.middleware import AgentMiddleware, AgentState, hook_config
 from langgraph.runtime import Runtime
 from langchain.messages import AIMessage
-from langchain.chat_models import init_chat_model
 from typing import Any
-from src.backend.core.config import settings
+from src.backend.ai.model_registry import model_registry
 
 class SafetyGuardrailMiddleware(AgentMiddleware):
     """Model-based guardrail: Use an LLM to evaluate response safety."""
@@ -12,17 +11,7 @@ class SafetyGuardrailMiddleware(AgentMiddleware):
         super().__init__()
 
         # cheaper model can be used.
-        model_name="qwen2.5-coder"
-        model_provider= "ollama"
-        base_url= "https://waldo-unappliable-supersolemnly.ngrok-free.dev"
-        api_key=settings.model_api_key.get_secret_value()
-
-        self.safety_model = init_chat_model(
-            model=model_name,
-            model_provider=model_provider,
-            base_url=base_url,
-            api_key=api_key,
-        )
+        self.safety_model = model_registry.get_model()
 
 
     @hook_config(can_jump_to=["end"])
@@ -0,0 +1,23 @@
+from langchain.agents.middleware import AgentMiddleware, ModelRequest, dynamic_prompt
+from src.backend.ai.prompts.prompt import SQL_ANALYST_AGENT_PROMPT
+from src.backend.services.schema_digest_service import schema_digest
+
+# Earlier user turns also count, so follow-ups like "and last month?" keep their tables
+QUESTION_TURNS = 2
+
+
+def sql_schema_prompt(top_k: int) -> AgentMiddleware:
+    """SQL analyst system prompt with the schema of the tables relevant to the conversation"""
+
+    @dynamic_prompt
+    async def sql_schema_prompt(request: ModelRequest) -> str:
+        await schema_digest.arefresh_if_stale()
+
+        questions = [message.text for message in request.messages if message.type == "human"]
+        return SQL_ANALYST_AGENT_PROMPT.format(
+            dialect=schema_digest.dialect,
+            top_k=top_k,
+            schema=schema_digest.render("\n".join(questions[-QUESTION_TURNS:]))
+        )
+
+    return sql_schema_prompt
@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from uuid import UUID
+import httpx
+from langchain.chat_models import init_chat_model
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from src.backend.core.config import settings
+
+# Recent call latencies kept per model for percentiles
+LATENCY_WINDOW = 512
+
+
+class ModelLatencyTracker(BaseCallbackHandler):
+    """Callback that records call count, errors and latency for one model client"""
+
+    # Record on the calling thread/loop instead of a callback executor
+    run_inline = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started: Dict[UUID, float] = {}
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+
+    def on_chat_model_start(self, serialized: dict, messages: list, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            self._started[run_id] = time.perf_counter()
+
+    def on_llm_start(self, serialized: dict, prompts: list, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            self._started[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, failed=False)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, failed=True)
+
+    def _finish(self, run_id: UUID, failed: bool) -> None:
+        with self._lock:
+            started = self._started.pop(run_id, None)
+            if started is None:
+                return
+            elapsed = time.perf_counter() - started
+            self.calls += 1
+            self.total_seconds += elapsed
+            self._latencies.append(elapsed)
+            if failed:
+                self.errors += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            calls, errors, total_seconds = self.calls, self.errors, self.total_seconds
+
+        def percentile(p: float) -> float:
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else 0.0
+
+        return {
+            "calls": calls,
+            "errors": errors,
+            "in_flight": len(self._started),
+            "avg_latency_seconds": total_seconds / calls if calls else 0.0,
+            "p50_latency_seconds": percentile(0.5),
+            "p95_latency_seconds": percentile(0.95),
+        }
+
+
+class ModelRegistry:
+    """
+    One chat model client per (provider, model, endpoint), shared by every agent.
+
+    Model name, provider and endpoint default to the LLM_* settings. Sharing the
+    client means all agents reuse the same keep-alive HTTP connection pool,
+    sized by the LLM_HTTP_* settings. Each client reports per-model latency
+    through a ModelLatencyTracker callback.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ModelRegistry, cls).__new__(cls)
+            cls._instance._models = {}
+            cls._instance._trackers = {}
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def get_model(
+        self,
+        model_name: Optional[str] = None,
+        model_provider: Optional[str] = None,
+        base_url: Optional[str] = None
+    ) -> BaseChatModel:
+        """Return the shared client for a model, creating it on first use"""
+        key = (
+            model_provider or settings.llm_model_provider,
+            model_name or settings.llm_model_name,
+            base_url or settings.llm_base_url,
+        )
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = self._create_model(*key)
+                self._models[key] = model
+            return model
+
+    def _create_model(self, model_provider: str, model_name: str, base_url: str) -> BaseChatModel:
+        tracker = ModelLatencyTracker()
+        self._trackers[(model_provider, model_name, base_url)] = tracker
+
+        kwargs = {}
+        if model_provider == "ollama":
+            # Ollama builds its own httpx clients; tune their pool instead of the defaults
+            kwargs["client_kwargs"] = {
+                "limits": httpx.Limits(
+                    max_connections=settings.llm_http_max_connections,
+                    max_keepalive_connections=settings.llm_http_max_keepalive_connections,
+                    keepalive_expiry=settings.llm_http_keepalive_expiry_seconds,
+                ),
+            }
+
+        return init_chat_model(
+            model=model_name,
+            model_provider=model_provider,
+            base_url=base_url,
+            api_key=settings.model_api_key.get_secret_value(),
+            callbacks=[tracker],
+            **kwargs
+        )
+
+    def stats(self) -> dict:
+        """Per-model call counts and latency for the metrics endpoint"""
+        with self._lock:
+            trackers = dict(self._trackers)
+        return {
+            f"{provider}:{model_name}@{base_url}": tracker.stats()
+            for (provider, model_name, base_url), tracker in trackers.items()
+        }
+
+
+model_registry = ModelRegistry()
@@ -0,0 +1,422 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, FrozenSet, Iterator, Optional, Sequence, Set, Tuple
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
+from langgraph.checkpoint.memory import InMemorySaver
+from src.backend.core.config import settings
+
+
+class BoundedCheckpointer(InMemorySaver):
+    """
+    InMemorySaver that keeps per-thread state and total memory bounded.
+
+    - Per thread: only the latest ``max_checkpoints_per_thread`` checkpoints of
+      each namespace are kept, and older ones are pruned while the thread is
+      larger than ``max_thread_bytes``. The latest checkpoint is always kept.
+    - Across threads: threads are ordered by last access. Threads idle for
+      ``idle_ttl_seconds`` and least recently used threads beyond
+      ``max_memory_bytes`` are evicted from memory.
+    - With ``db_path`` set, every checkpoint, write and channel blob is also
+      written through to SQLite. An evicted thread is reloaded from disk on its
+      next access, so conversations survive eviction and restarts. Without it,
+      an evicted conversation starts over.
+
+    Sizes are counted from the serialized checkpoint bytes held in memory.
+    The async methods run the sync ones on a worker thread, so SQLite writes
+    and pruning never block the event loop.
+    """
+
+    def __init__(
+        self,
+        max_checkpoints_per_thread: int,
+        max_thread_bytes: int,
+        max_memory_bytes: int,
+        idle_ttl_seconds: float,
+        db_path: Optional[str] = None
+    ):
+        super().__init__()
+        self.max_checkpoints_per_thread = max(1, max_checkpoints_per_thread)
+        self.max_thread_bytes = max_thread_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._lock = threading.RLock()
+
+        # thread_id -> last access, least recently used first
+        self._threads: "OrderedDict[str, float]" = OrderedDict()
+        self._thread_bytes: Dict[str, int] = {}
+        # Per-thread keys into self.writes / self.blobs, so no full scans
+        self._thread_writes: Dict[str, Set[tuple]] = {}
+        self._thread_blobs: Dict[str, Set[tuple]] = {}
+        # thread_id -> (checkpoint_ns, checkpoint_id) -> channel versions it references,
+        # so pruning knows which blobs are still needed without deserializing checkpoints
+        self._checkpoint_versions: Dict[str, Dict[tuple, FrozenSet[tuple]]] = {}
+        self._memory_bytes = 0
+
+        self._connection = None
+        if db_path:
+            if os.path.dirname(db_path):
+                os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            self._connection = sqlite3.connect(db_path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS checkpoints (
+                    thread_id TEXT NOT NULL,
+                    checkpoint_ns TEXT NOT NULL,
+                    checkpoint_id TEXT NOT NULL,
+                    checkpoint_type TEXT NOT NULL,
+                    checkpoint BLOB NOT NULL,
+                    metadata_type TEXT NOT NULL,
+                    metadata BLOB NOT NULL,
+                    parent_checkpoint_id TEXT,
+                    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+                );
+                CREATE TABLE IF NOT EXISTS checkpoint_writes (
+                    thread_id TEXT NOT NULL,
+                    checkpoint_ns TEXT NOT NULL,
+                    checkpoint_id TEXT NOT NULL,
+                    task_id TEXT NOT NULL,
+                    idx INTEGER NOT NULL,
+                    channel TEXT NOT NULL,
+                    value_type TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    task_path TEXT NOT NULL,
+                    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+                );
+                CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+                    thread_id TEXT NOT NULL,
+                    checkpoint_ns TEXT NOT NULL,
+                    channel TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    value_type TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+                );
+            """)
+            self._connection.commit()
+
+        self.checkpoints_pruned = 0
+        self.threads_evicted = 0
+        self.threads_expired = 0
+        self.threads_loaded = 0
+
+    # ---- access tracking and eviction ----
+
+    def _touch(self, thread_id: str) -> None:
+        """Mark a thread as used, loading it from disk if it is not in memory"""
+        now = time.monotonic()
+        while self._threads:
+            oldest, last_access = next(iter(self._threads.items()))
+            if oldest == thread_id or now - last_access <= self.idle_ttl_seconds:
+                break
+            self._evict(oldest)
+            self.threads_expired += 1
+
+        if thread_id not in self._threads:
+            self._thread_writes[thread_id] = set()
+            self._thread_blobs[thread_id] = set()
+            self._checkpoint_versions[thread_id] = {}
+            self._thread_bytes[thread_id] = 0
+            self._load_thread(thread_id)
+        self._threads[thread_id] = now
+        self._threads.move_to_end(thread_id)
+
+    def _evict(self, thread_id: str) -> None:
+        """Drop a thread from memory; with a persistent tier it stays on disk"""
+        self._threads.pop(thread_id, None)
+        self.storage.pop(thread_id, None)
+        for key in self._thread_writes.pop(thread_id, ()):
+            self.writes.pop(key, None)
+        for key in self._thread_blobs.pop(thread_id, ()):
+            self.blobs.pop(key, None)
+        self._checkpoint_versions.pop(thread_id, None)
+        self._memory_bytes -= self._thread_bytes.pop(thread_id, 0)
+
+    def _enforce_memory_limit(self, current_thread: str) -> None:
+        while self._memory_bytes > self.max_memory_bytes and len(self._threads) > 1:
+            oldest = next(iter(self._threads))
+            if oldest == current_thread:
+                break
+            self._evict(oldest)
+            self.threads_evicted += 1
+
+    # ---- size accounting and pruning ----
+
+    def _recount(self, thread_id: str) -> None:
+        size = 0
+        for checkpoints in self.storage.get(thread_id, {}).values():
+            for checkpoint, metadata, _ in checkpoints.values():
+                size += len(checkpoint[1]) + len(metadata[1])
+        for key in self._thread_writes.get(thread_id, ()):
+            for _, _, value, _ in self.writes.get(key, {}).values():
+                size += len(value[1])
+        for key in self._thread_blobs.get(thread_id, ()):
+            if key in self.blobs:
+                size += len(self.blobs[key][1])
+        self._memory_bytes += size - self._thread_bytes.get(thread_id, 0)
+        self._thread_bytes[thread_id] = size
+
+    def _prune(self, thread_id: str, checkpoint_ns: str) -> None:
+        """Drop the oldest checkpoints of a namespace beyond the per-thread caps"""
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        # uuid6 checkpoint ids sort by creation time
+        ordered = sorted(checkpoints)
+        if len(ordered) > self.max_checkpoints_per_thread:
+            keep = self.max_checkpoints_per_thread
+        elif self._thread_bytes.get(thread_id, 0) > self.max_thread_bytes and len(ordered) > 1:
+            keep = len(ordered) - 1
+        else:
+            return
+
+        while True:
+            dropped = ordered[:len(ordered) - keep]
+            for checkpoint_id in dropped:
+                del checkpoints[checkpoint_id]
+                write_key = (thread_id, checkpoint_ns, checkpoint_id)
+                self.writes.pop(write_key, None)
+                self._thread_writes[thread_id].discard(write_key)
+            ordered = ordered[len(dropped):]
+
+            # Blobs are shared between checkpoints; keep every version still referenced
+            versions = self._checkpoint_versions[thread_id]
+            for checkpoint_id in dropped:
+                versions.pop((checkpoint_ns, checkpoint_id), None)
+            referenced = set()
+            for checkpoint_id in ordered:
+                referenced.update(
+                    (thread_id, checkpoint_ns, channel, version)
+                    for channel, version in versions.get((checkpoint_ns, checkpoint_id), ())
+                )
+            stale_blobs = [
+                key for key in self._thread_blobs[thread_id]
+                if key[1] == checkpoint_ns and key not in referenced
+            ]
+            for key in stale_blobs:
+                self.blobs.pop(key, None)
+                self._thread_blobs[thread_id].discard(key)
+
+            self.checkpoints_pruned += len(dropped)
+            self._delete_persisted(thread_id, checkpoint_ns, ordered[0], stale_blobs)
+            self._recount(thread_id)
+            if self._thread_bytes[thread_id] <= self.max_thread_bytes or len(ordered) <= 1:
+                return
+            keep = len(ordered) - 1
+
+    # ---- persistent tier ----
+
+    def _load_thread(self, thread_id: str) -> None:
+        if self._connection is None:
+            return
+        checkpoint_rows = self._connection.execute(
+            """
+            SELECT checkpoint_ns, checkpoint_id, checkpoint_type, checkpoint, metadata_type, metadata, parent_checkpoint_id
+            FROM checkpoints WHERE thread_id = ?
+            """,
+            (thread_id,)
+        ).fetchall()
+        if not checkpoint_rows:
+            return
+
+        for checkpoint_ns, checkpoint_id, checkpoint_type, checkpoint, metadata_type, metadata, parent_id in checkpoint_rows:
+            self.storage[thread_id][checkpoint_ns][checkpoint_id] = (
+                (checkpoint_type, checkpoint), (metadata_type, metadata), parent_id
+            )
+            # Deserialized once per reload; puts record their versions directly
+            channel_versions = self.serde.loads_typed((checkpoint_type, checkpoint))["channel_versions"]
+            self._checkpoint_versions[thread_id][(checkpoint_ns, checkpoint_id)] = frozenset(channel_versions.items())
+        for checkpoint_ns, checkpoint_id, task_id, idx, channel, value_type, value, task_path in self._connection.execute(
+            """
+            SELECT checkpoint_ns, checkpoint_id, task_id, idx, channel, value_type, value, task_path
+            FROM checkpoint_writes WHERE thread_id = ?
+            """,
+            (thread_id,)
+        ):
+            key = (thread_id, checkpoint_ns, checkpoint_id)
+            self.writes[key][(task_id, idx)] = (task_id, channel, (value_type, value), task_path)
+            self._thread_writes[thread_id].add(key)
+        for checkpoint_ns, channel, version, value_type, value in self._connection.execute(
+            "SELECT checkpoint_ns, channel, version, value_type, value FROM checkpoint_blobs WHERE thread_id = ?",
+            (thread_id,)
+        ):
+            key = (thread_id, checkpoint_ns, channel, version)
+            self.blobs[key] = (value_type, value)
+            self._thread_blobs[thread_id].add(key)
+
+        self._recount(thread_id)
+        self.threads_loaded += 1
+
+    def _persist_checkpoint(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str, blob_keys: list) -> None:
+        if self._connection is None:
+            return
+        checkpoint, metadata, parent_id = self.storage[thread_id][checkpoint_ns][checkpoint_id]
+        self._connection.execute(
+            "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (thread_id, checkpoint_ns, checkpoint_id, checkpoint[0], checkpoint[1], metadata[0], metadata[1], parent_id)
+        )
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO checkpoint_blobs VALUES (?, ?, ?, ?, ?, ?)",
+            [(*key, *self.blobs[key]) for key in blob_keys]
+        )
+        self._connection.commit()
+
+    def _persist_writes(self, key: tuple) -> None:
+        if self._connection is None:
+            return
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO checkpoint_writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (*key, task_id, idx, channel, value[0], value[1], task_path)
+                for (_, idx), (task_id, channel, value, task_path) in self.writes[key].items()
+            ]
+        )
+        self._connection.commit()
+
+    def _delete_persisted(self, thread_id: str, checkpoint_ns: str, oldest_kept: str, blob_keys: list) -> None:
+        """Delete every persisted checkpoint of a namespace older than ``oldest_kept``, and the given blobs"""
+        if self._connection is None:
+            return
+        # uuid6 checkpoint ids sort by creation time, in SQL as in memory
+        for table in ("checkpoints", "checkpoint_writes"):
+            self._connection.execute(
+                f"DELETE FROM {table} WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id < ?",
+                (thread_id, checkpoint_ns, oldest_kept)
+            )
+        self._connection.executemany(
+            "DELETE FROM checkpoint_blobs WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+            blob_keys
+        )
+        self._connection.commit()
+
+    # ---- BaseCheckpointSaver ----
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        with self._lock:
+            self._touch(config["configurable"]["thread_id"])
+            return super().get_tuple(config)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[CheckpointTuple]:
+        # Without a thread only the threads currently in memory are listed
+        with self._lock:
+            if config:
+                self._touch(config["configurable"]["thread_id"])
+            return iter(list(super().list(config, filter=filter, before=before, limit=limit)))
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        with self._lock:
+            self._touch(thread_id)
+            next_config = super().put(config, checkpoint, metadata, new_versions)
+
+            blob_keys = [(thread_id, checkpoint_ns, channel, version) for channel, version in new_versions.items()]
+            self._thread_blobs[thread_id].update(blob_keys)
+            self._checkpoint_versions[thread_id][(checkpoint_ns, checkpoint["id"])] = frozenset(
+                checkpoint["channel_versions"].items()
+            )
+            self._persist_checkpoint(thread_id, checkpoint_ns, checkpoint["id"], blob_keys)
+            self._recount(thread_id)
+            self._prune(thread_id, checkpoint_ns)
+            self._enforce_memory_limit(thread_id)
+            return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = ""
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        key = (thread_id, config["configurable"].get("checkpoint_ns", ""), config["configurable"]["checkpoint_id"])
+        with self._lock:
+            self._touch(thread_id)
+            super().put_writes(config, writes, task_id, task_path)
+            self._thread_writes[thread_id].add(key)
+            self._persist_writes(key)
+            self._recount(thread_id)
+            self._enforce_memory_limit(thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._evict(thread_id)
+            if self._connection is not None:
+                for table in ("checkpoints", "checkpoint_writes", "checkpoint_blobs"):
+                    self._connection.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+                self._connection.commit()
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[CheckpointTuple]:
+        for item in await asyncio.to_thread(self.list, config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = ""
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    def stats(self) -> dict:
+        """Memory usage and eviction counters for the metrics endpoint"""
+        with self._lock:
+            return {
+                "threads_in_memory": len(self._threads),
+                "memory_bytes": self._memory_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "largest_thread_bytes": max(self._thread_bytes.values(), default=0),
+                "checkpoints_pruned": self.checkpoints_pruned,
+                "threads_evicted": self.threads_evicted,
+                "threads_expired": self.threads_expired,
+                "threads_loaded": self.threads_loaded,
+                "persistent": self._connection is not None,
+            }
+
+
+conversation_checkpointer = BoundedCheckpointer(
+    max_checkpoints_per_thread=settings.checkpoint_max_per_thread,
+    max_thread_bytes=settings.checkpoint_max_thread_bytes,
+    max_memory_bytes=settings.checkpoint_max_memory_bytes,
+    idle_ttl_seconds=settings.checkpoint_idle_ttl_seconds,
+    db_path=settings.checkpoint_store_path or None
+)
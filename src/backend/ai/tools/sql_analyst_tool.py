@@ -1,6 +1,70 @@
+from typing import Optional, Type
 from langchain_community.agent_toolkits import SQLDatabaseToolkit
+from langchain_community.tools.sql_database.tool import BaseSQLDatabaseTool, QuerySQLDatabaseTool
+from langchain_core.callbacks import CallbackManagerForToolRun
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel, Field
+from src.backend.services.bounded_query_service import READ_ONLY_REJECTION, bounded_query_executor
+from src.backend.services.query_cache_service import is_cacheable, is_read_only, normalize_sql, query_cache
 from src.backend.services.sql_service import DatabaseManager
 
+
+class BoundedQuerySQLDatabaseTool(QuerySQLDatabaseTool):
+    """
+    sql_db_query that streams rows under a row/byte budget and serves repeated
+    read-only statements from the query result cache. Anything other than a
+    read-only SELECT is refused, so the agent can never write to a table whose
+    results are cached (writes go through SubmissionService, which invalidates)
+    """
+
+    description: str = """
+    Execute a read-only SQL SELECT query against the database and get back the result.
+    INSERT, UPDATE, DELETE, DDL and multiple statements are refused.
+    Large results are cut to a preview that ends with the total row count and a handle;
+    pass the handle to sql_db_query_continue for the next rows (use ORDER BY for a stable order).
+    Queries without a filter, TOP/LIMIT or aggregate over large tables are rejected.
+    If the query is not correct, an error message will be returned.
+    If an error is returned, rewrite the query, check the query, and try again.
+    """
+
+    def _run(self, query: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
+        normalized = normalize_sql(query)
+        if not is_read_only(normalized):
+            return READ_ONLY_REJECTION
+        cacheable = is_cacheable(normalized)
+        if cacheable:
+            cached = query_cache.get(normalized)
+            if cached is not None:
+                return cached
+        else:
+            query_cache.not_cacheable += 1
+
+        result, truncated = bounded_query_executor.run(query)
+        # Errors come back as text, and a preview's handle does not outlive the process;
+        # only complete results are cached
+        if cacheable and not truncated and not result.startswith("Error:"):
+            query_cache.put(normalized, result)
+        return result
+
+
+class _ContinueQueryInput(BaseModel):
+    handle: str = Field(..., description="The handle printed at the end of a truncated sql_db_query result")
+
+
+class ContinueQuerySQLDatabaseTool(BaseSQLDatabaseTool, BaseTool):
+    """Next page of a result that sql_db_query cut short"""
+
+    name: str = "sql_db_query_continue"
+    description: str = """
+    Fetch the next rows of a sql_db_query result that was cut to a preview.
+    Input is the handle printed at the end of that result.
+    """
+    args_schema: Type[BaseModel] = _ContinueQueryInput
+
+    def _run(self, handle: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
+        return bounded_query_executor.resume(handle)
+
+
 def get_sql_analyst_tools(db ,model):
         """
         Factory method to generate SQL tools for an agent.
@@ -12,4 +76,9 @@ def get_sql_analyst_tools(db ,model):
         
         # Returns the list of standard tools: 
         # sql_db_query, sql_db_schema, sql_db_list_tables, sql_db_query_checker
-        return toolkit.get_tools()
+        # with sql_db_query bounded and backed by the query result cache
+        tools = [
+            BoundedQuerySQLDatabaseTool(db=db) if isinstance(tool, QuerySQLDatabaseTool) else tool
+            for tool in toolkit.get_tools()
+        ]
+        return tools + [ContinueQuerySQLDatabaseTool(db=db)]
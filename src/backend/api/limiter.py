@@ -1,9 +1,133 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import asyncio
+import json
+import math
+import time
+from fastapi import HTTPException, Request
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
+from src.backend.api import rate_limit_storage  # noqa: F401  registers sqlite://
+from src.backend.core.config import settings
+
+# Budget units each route draws per request; anything not listed costs 1.
+# Audits fan out to one model call per rule batch, the chat agents to a handful of calls;
+# bulk submission uploads hold a SQL worker for the whole body.
+ROUTE_COSTS = {
+    ("POST", "/api/v1/audit/{submission_id}"): 40,
+    ("POST", "/api/v1/audit/{submission_id}/stream"): 40,
+    ("POST", "/api/v1/audit/anomalies/{submission_id}"): 10,
+    ("POST", "/api/v1/jobs/audit/{submission_id}"): 40,
+    ("POST", "/api/v1/jobs/anomalies/{submission_id}"): 10,
+    ("POST", "/api/v1/database/chat"): 10,
+    ("POST", "/api/v1/document/chat"): 10,
+    ("POST", "/api/v1/document/test"): 2,
+    ("POST", "/api/v1/submission/bulk"): 10,
+    ("PUT", "/api/v1/submission/bulk"): 10,
+}
+
+# Request bodies up to this size are read to find the caller's user_id
+MAX_KEY_BODY_BYTES = 64 * 1024
+
+ANONYMOUS_USERS = {"", "guest"}
+
+
+class RateLimiter:
+    """
+    Cost-weighted, per-client rate limit shared by all worker processes.
+
+    Used as a router dependency. The client is the ``user_id`` of a JSON body
+    (ChatRequest) when one is given and not "guest", otherwise the remote
+    address. Each request draws its route's weight from ROUTE_COSTS out of
+    a fixed-window budget of ``limit`` (e.g. "500/hour"). ``user_id`` is not
+    authenticated, so every request also draws from a per-address budget of
+    ``ip_limit``; inventing a new ``user_id`` per request does not get
+    around it. Counters live in the ``limits`` storage named by
+    ``storage_uri``: ``sqlite://`` (see SQLiteStorage) shares them between
+    the workers on one host, ``redis://`` between hosts and ``memory://``
+    keeps them per process. Over either budget the request is refused with
+    429 and a Retry-After header.
+    """
+
+    def __init__(self, limit: str, ip_limit: str, storage_uri: str, route_costs: dict):
+        self.item = parse(limit)
+        self.ip_item = parse(ip_limit)
+        self.storage = storage_from_string(storage_uri)
+        self.strategy = FixedWindowRateLimiter(self.storage)
+        self.route_costs = route_costs
+
+        self.allowed = 0
+        self.rejected = 0
+        self.rejected_by_ip = 0
+        self.cost_allowed = 0
+
+    async def __call__(self, request: Request) -> None:
+        route = request.scope.get("route")
+        cost = self.route_costs.get((request.method, getattr(route, "path", None)), 1)
+        key = await self.client_key(request)
+        address = f"address:{request.client.host if request.client else 'unknown'}"
+        buckets = [(self.item, key), (self.ip_item, address)]
+
+        refused, reset_at = await asyncio.to_thread(self._hit, buckets, cost)
+        if refused is not None:
+            self.rejected += 1
+            if refused is self.ip_item:
+                self.rejected_by_ip += 1
+            retry_after = max(1, math.ceil(reset_at - time.time()))
+            raise HTTPException(
+                status_code=429,
+                detail=f"Rate limit exceeded: {refused} (this request costs {cost})",
+                headers={"Retry-After": str(retry_after)}
+            )
+        self.allowed += 1
+        self.cost_allowed += cost
+
+    def _hit(self, buckets: list, cost: int):
+        """Draw ``cost`` from every (limit, key) bucket; returns the refusing limit and its reset time, or (None, None)"""
+        # Test all first so a refused request does not draw from any budget
+        for item, key in buckets:
+            if cost > item.amount or not self.strategy.test(item, key, cost=cost):
+                return item, self.strategy.get_window_stats(item, key).reset_time
+        for item, key in buckets:
+            if not self.strategy.hit(item, key, cost=cost):
+                # Another worker took the rest of the window in the meantime
+                return item, self.strategy.get_window_stats(item, key).reset_time
+        return None, None
+
+    @staticmethod
+    async def client_key(request: Request) -> str:
+        """user:<user_id> for identified callers, ip:<address> for everyone else"""
+        if request.headers.get("content-type", "").startswith("application/json"):
+            try:
+                length = int(request.headers.get("content-length", ""))
+            except ValueError:
+                length = None
+            if length is not None and length <= MAX_KEY_BODY_BYTES:
+                # Starlette keeps the body, so the endpoint still reads it
+                try:
+                    body = json.loads(await request.body() or b"null")
+                except ValueError:
+                    body = None
+                user_id = body.get("user_id") if isinstance(body, dict) else None
+                if isinstance(user_id, str) and user_id.strip().lower() not in ANONYMOUS_USERS:
+                    return f"user:{user_id.strip()}"
+        return f"ip:{request.client.host if request.client else 'unknown'}"
+
+    def stats(self) -> dict:
+        """Limiter counters for the metrics endpoint"""
+        return {
+            "limit": str(self.item),
+            "ip_limit": str(self.ip_item),
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "rejected_by_ip": self.rejected_by_ip,
+            "cost_allowed": self.cost_allowed,
+        }
+
 
 # This single instance is imported everywhere else
-limiter = Limiter(
-    key_func=get_remote_address,
-    default_limits=["100/hour"]
-    # storage_uri="redis://localhost:6379"  # If distributed
+limiter = RateLimiter(
+    limit=settings.rate_limit,
+    ip_limit=settings.rate_limit_per_ip,
+    storage_uri=settings.rate_limit_storage_uri,
+    route_costs=ROUTE_COSTS
 )
@@ -0,0 +1,97 @@
+import os
+import sqlite3
+import threading
+import time
+from limits.storage import Storage
+
+# Expired counters are deleted every this many increments
+SWEEP_EVERY = 1000
+
+
+class SQLiteStorage(Storage):
+    """
+    ``limits`` storage backed by a SQLite file, so every worker process on the
+    host draws from the same counters.
+
+    Registered for ``sqlite://`` URIs, which follow SQLAlchemy's form:
+    ``sqlite:///relative/path`` or ``sqlite:////absolute/path``. Each
+    increment is one UPSERT statement, which SQLite applies atomically
+    across processes; a counter whose window has passed restarts at the
+    increment.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        db_path = uri.split("://", 1)[1][1:]
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._increments = 0
+        self._connection = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        now = time.time()
+        with self._lock:
+            value = self._connection.execute(
+                """
+                INSERT INTO rate_limits (key, value, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    value = CASE WHEN expires_at <= ? THEN excluded.value ELSE value + excluded.value END,
+                    expires_at = CASE WHEN expires_at <= ? THEN excluded.expires_at ELSE expires_at END
+                RETURNING value
+                """,
+                (key, amount, now + expiry, now, now)
+            ).fetchone()[0]
+
+            self._increments += 1
+            if self._increments % SWEEP_EVERY == 0:
+                self._connection.execute("DELETE FROM rate_limits WHERE expires_at <= ?", (now,))
+        return value
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM rate_limits WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        return row[0] if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires_at FROM rate_limits WHERE key = ? AND expires_at > ?",
+                (key, now)
+            ).fetchone()
+        return row[0] if row else now
+
+    def check(self) -> bool:
+        try:
+            with self._lock:
+                self._connection.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> int | None:
+        with self._lock:
+            return self._connection.execute("DELETE FROM rate_limits").rowcount
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM rate_limits WHERE key = ?", (key,))
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 from src.backend.api.v1.endpoints import database, document # Import individual endpoint modules
-from src.backend.api.v1.endpoints import submission, audit
+from src.backend.api.v1.endpoints import submission, audit, jobs, metrics
 
 api_router = APIRouter()
 
@@ -9,4 +9,6 @@ api_router.include_router(database.router, prefix="/database", tags=["Database"]
 api_router.include_router(document.router, prefix="/document", tags=["Document"])
 api_router.include_router(submission.router, prefix="/submission", tags=["Submission"])
 api_router.include_router(audit.router, prefix="/audit", tags=["Audit"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
 
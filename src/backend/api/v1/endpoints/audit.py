@@ -1,16 +1,26 @@
-from fastapi import APIRouter, HTTPException
-from src.backend.ai.agents.auditor_agent import auditor_agent, AuditResponse
-from src.backend.ai.agents.anomaly_detection_agent import anomaly_detection_agent, AnomalyDetectionResponse
+import json
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from src.backend.ai.agents.registry import auditor_agent, anomaly_detection_agent
+from src.backend.schemas.anomaly_response import AnomalyDetectionResponse
+from src.backend.schemas.audit_response import AuditResponse
+from src.backend.services.auditor_service import audit_rules_cache
 
 router = APIRouter()
 
 @router.post("/{submission_id}", response_model=AuditResponse)
-async def audit_submission(submission_id: str):
+async def audit_submission(
+    submission_id: str,
+    force: bool = Query(False),
+    use_cache: bool = Query(True)
+):
     """
     Evaluate a submission against all audit rules.
     
     Args:
         submission_id: The ID of the submission to audit
+        force: Re-evaluate every rule instead of reusing unchanged results
+        use_cache: Serve byte-identical prompts from the LLM response cache
     
     Returns:
         AuditResponse with detailed validation results for each rule
@@ -18,7 +28,9 @@ async def audit_submission(submission_id: str):
     try:
         # Evaluate the submission
         audit_result = await auditor_agent.evaluate_submission(
-            submission_id=submission_id
+            submission_id=submission_id,
+            reuse_previous=not force,
+            use_cache=use_cache
         )
         
         return audit_result
@@ -29,13 +41,52 @@ async def audit_submission(submission_id: str):
             detail=f"Error during audit evaluation: {str(e)}"
         )
 
+@router.post("/{submission_id}/stream")
+async def stream_audit_submission(
+    submission_id: str,
+    force: bool = Query(False),
+    use_cache: bool = Query(True)
+):
+    """
+    Evaluate a submission and stream results as NDJSON.
+    
+    Each rule result is written as soon as its evaluation finishes
+    (``{"event": "rule_result", "data": {...}}``), followed by one
+    ``{"event": "summary", "data": {...}}`` line with the aggregate counts.
+    
+    Args:
+        submission_id: The ID of the submission to audit
+        force: Re-evaluate every rule instead of reusing unchanged results
+        use_cache: Serve byte-identical prompts from the LLM response cache
+    
+    Returns:
+        StreamingResponse of newline-delimited JSON events
+    """
+    async def event_stream():
+        try:
+            async for event in auditor_agent.stream_evaluation(
+                submission_id=submission_id,
+                reuse_previous=not force,
+                use_cache=use_cache
+            ):
+                if event["event"] == "summary":
+                    data = event["data"].model_dump(mode="json", exclude={"validation_results"})
+                else:
+                    data = event["data"].model_dump(mode="json")
+                yield json.dumps({"event": event["event"], "data": data}) + "\n"
+        except Exception as e:
+            yield json.dumps({"event": "error", "detail": f"Error during audit evaluation: {str(e)}"}) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
 @router.post("/anomalies/{submission_id}", response_model=AnomalyDetectionResponse)
-async def detect_document_anomalies(submission_id: str):
+async def detect_document_anomalies(submission_id: str, use_cache: bool = Query(True)):
     """
     Detect anomalies in submission documents.
     
     Args:
         submission_id: The ID of the submission to analyze
+        use_cache: Serve byte-identical prompts from the LLM response cache
     
     Returns:
         AnomalyDetectionResponse with detected anomalies and risk assessment
@@ -43,7 +94,8 @@ async def detect_document_anomalies(submission_id: str):
     try:
         # Detect anomalies in documents
         anomaly_result = await anomaly_detection_agent.detect_anomalies(
-            submission_id=submission_id
+            submission_id=submission_id,
+            use_cache=use_cache
         )
         
         return anomaly_result
@@ -53,3 +105,14 @@ async def detect_document_anomalies(submission_id: str):
             status_code=500,
             detail=f"Error during anomaly detection: {str(e)}"
         )
+
+@router.delete("/rules/cache", response_model=dict)
+async def invalidate_audit_rules_cache():
+    """
+    Drop the cached audit rules so the next audit reloads rules_master.
+    
+    Returns:
+        Cache counters after invalidation
+    """
+    audit_rules_cache.invalidate()
+    return audit_rules_cache.stats()
@@ -1,6 +1,5 @@
 from fastapi import APIRouter
-from src.backend.ai.agents.sql_agent import sql_analyst_agent
-from src.backend.ai.agents.doc_agent import doc_analyst_agent
+from src.backend.ai.agents.registry import sql_analyst_agent
 from src.backend.schemas.user import ChatRequest
 
 
@@ -1,7 +1,9 @@
 from fastapi import APIRouter
-from src.backend.ai.agents.doc_agent import doc_analyst_agent
+from src.backend.ai.agents.registry import doc_analyst_agent
+from src.backend.core.lazy import lazy_import
 from src.backend.schemas.user import ChatRequest
-from src.backend.services.mongo_vectorstore_service import get_document_context
+
+vectorstore = lazy_import("src.backend.services.mongo_vectorstore_service")
 
 
 router = APIRouter()
@@ -16,7 +18,7 @@ async def register_user(data: ChatRequest):
 @router.post("/test")
 async def register_user(data: ChatRequest):
     user_query = data.question
-    response = await get_document_context("5EF63283-BCD9-4D33-8044-4AA8551025DC",user_query)
+    response = await vectorstore.get_document_context("5EF63283-BCD9-4D33-8044-4AA8551025DC",user_query)
 
     return response
 
@@ -0,0 +1,42 @@
+import asyncio
+from fastapi import APIRouter, Response
+from sqlalchemy import text
+from src.backend.core.config import settings
+from src.backend.services.sql_service import DatabaseManager
+from src.backend.services.warmup_service import warmup_service
+
+router = APIRouter()
+
+@router.get("/live", response_model=dict)
+async def live():
+    """The process is up and serving requests"""
+    return {"status": "ok"}
+
+@router.get("/ready", response_model=dict)
+async def ready(response: Response):
+    """
+    Whether this worker should receive traffic.
+
+    Ready once the database answers and, when WARMUP_ON_STARTUP is set, the
+    startup warmup has finished. Returns 503 otherwise.
+    """
+    checks = {}
+    try:
+        await asyncio.wait_for(
+            DatabaseManager.get_shared_async_db().fetch_one(text("SELECT 1")),
+            timeout=settings.readiness_timeout_seconds
+        )
+        checks["sql"] = "ok"
+    except Exception as e:
+        checks["sql"] = f"error: {str(e) or type(e).__name__}"
+
+    warmup = warmup_service.status()
+    is_ready = checks["sql"] == "ok" and warmup["state"] in ("disabled", "done")
+    if not is_ready:
+        response.status_code = 503
+
+    return {
+        "status": "ready" if is_ready else "not_ready",
+        "checks": checks,
+        "warmup": warmup,
+    }
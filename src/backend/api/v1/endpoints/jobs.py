@@ -0,0 +1,70 @@
+from fastapi import APIRouter, HTTPException, Query
+from src.backend.schemas.job import JobStatus
+from src.backend.services.job_service import job_service
+
+router = APIRouter()
+
+@router.post("/audit/{submission_id}", response_model=JobStatus, status_code=202)
+async def enqueue_audit(
+    submission_id: str,
+    force: bool = Query(False),
+    use_cache: bool = Query(True)
+):
+    """
+    Queue an audit of a submission and return at once.
+
+    Args:
+        submission_id: The ID of the submission to audit
+        force: Re-evaluate every rule instead of reusing unchanged results
+        use_cache: Serve byte-identical prompts from the LLM response cache
+
+    Returns:
+        JobStatus to poll with GET /jobs/{job_id}; its result is the AuditResponse
+    """
+    try:
+        return await job_service.enqueue("audit", submission_id, force=force, use_cache=use_cache)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error queueing audit: {str(e)}")
+
+@router.post("/anomalies/{submission_id}", response_model=JobStatus, status_code=202)
+async def enqueue_anomaly_scan(submission_id: str, use_cache: bool = Query(True)):
+    """
+    Queue an anomaly scan of a submission's documents and return at once.
+
+    Args:
+        submission_id: The ID of the submission to analyze
+        use_cache: Serve byte-identical prompts from the LLM response cache
+
+    Returns:
+        JobStatus to poll with GET /jobs/{job_id}; its result is the AnomalyDetectionResponse
+    """
+    try:
+        return await job_service.enqueue("anomalies", submission_id, use_cache=use_cache)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error queueing anomaly scan: {str(e)}")
+
+@router.get("/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str):
+    """
+    Status of a job, with its result once it has succeeded.
+
+    Args:
+        job_id: The ID returned when the job was queued
+    """
+    job = await job_service.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+@router.delete("/{job_id}", response_model=JobStatus)
+async def cancel_job(job_id: str):
+    """
+    Cancel a queued or running job. Finished jobs are returned unchanged.
+
+    Args:
+        job_id: The ID returned when the job was queued
+    """
+    job = await job_service.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
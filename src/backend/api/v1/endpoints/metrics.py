@@ -0,0 +1,42 @@
+from fastapi import APIRouter
+from src.backend.api.limiter import limiter
+from src.backend.ai.llm_limiter import llm_limiter
+from src.backend.core import singleflight
+from src.backend.core.lazy import lazy_import
+from src.backend.services.anomaly_prescreen_service import anomaly_prescreen
+from src.backend.services.auditor_service import audit_rules_cache
+from src.backend.services.field_store_service import extracted_field_store
+from src.backend.services.job_service import job_service
+from src.backend.services.query_cache_service import query_cache
+from src.backend.services.schema_digest_service import schema_digest
+
+# Reported once something else has loaded them; reading metrics never builds a client
+llm_cache = lazy_import("src.backend.ai.llm_cache", "llm_cache")
+model_registry = lazy_import("src.backend.ai.model_registry", "model_registry")
+embeddings = lazy_import("src.backend.services.mongo_vectorstore_service", "embeddings")
+bounded_query_executor = lazy_import("src.backend.services.bounded_query_service", "bounded_query_executor")
+conversation_checkpointer = lazy_import("src.backend.ai.state.bounded_checkpointer", "conversation_checkpointer")
+conversation_compaction = lazy_import("src.backend.ai.middleware.conversation_compaction", "conversation_compaction")
+
+router = APIRouter()
+
+@router.get("/", response_model=dict)
+async def get_metrics():
+    """Runtime counters for in-process caches and limiters"""
+    return {
+        "rate_limiter": limiter.stats(),
+        "jobs": job_service.stats(),
+        "singleflight": singleflight.stats(),
+        "audit_rules_cache": audit_rules_cache.stats(),
+        "llm_limiter": llm_limiter.stats(),
+        "llm_cache": llm_cache.stats() if llm_cache.initialized else None,
+        "models": model_registry.stats() if model_registry.initialized else {},
+        "embedding_cache": embeddings.stats() if embeddings.initialized else None,
+        "anomaly_prescreen": anomaly_prescreen.stats(),
+        "extracted_field_store": extracted_field_store.stats(),
+        "schema_digest": schema_digest.stats(),
+        "query_cache": query_cache.stats(),
+        "agent_sql": bounded_query_executor.stats() if bounded_query_executor.initialized else None,
+        "conversation_checkpointer": conversation_checkpointer.stats() if conversation_checkpointer.initialized else None,
+        "conversation_compaction": conversation_compaction.stats() if conversation_compaction.initialized else None,
+    }
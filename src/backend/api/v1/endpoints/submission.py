@@ -1,7 +1,8 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional, List
-from src.backend.schemas.submission import SubmissionCreate, SubmissionUpdate
-from src.backend.services.submission_service import SubmissionService
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from typing import Literal, Optional, List
+from src.backend.schemas.submission import BulkSubmissionReport, SubmissionCreate, SubmissionUpdate
+from src.backend.services.record_stream import iter_records, record_format
+from src.backend.services.submission_service import BULK_CSV_COLUMNS, SubmissionService
 
 router = APIRouter()
 submission_service = SubmissionService()
@@ -16,24 +17,84 @@ async def create_submission(submission: SubmissionCreate):
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+def bulk_records(request: Request):
+    """Records of a bulk request body, read as it streams in"""
+    body_format = record_format(request.headers.get("content-type", ""))
+    if body_format is None:
+        raise HTTPException(
+            status_code=415,
+            detail="Send text/csv or application/x-ndjson"
+        )
+    return iter_records(request.stream(), body_format, BULK_CSV_COLUMNS)
+
+# CREATE - Bulk import
+@router.post("/bulk", response_model=BulkSubmissionReport)
+async def bulk_create_submissions(request: Request):
+    """
+    Create submissions from a CSV (text/csv) or NDJSON (application/x-ndjson) body.
+
+    A CSV header names the fields, either as in SubmissionCreate or as
+    Submissions columns; empty cells are treated as missing. The body is
+    parsed while it uploads and written in committed chunks, so rows before
+    a failure stay imported. Rows that fail validation or are rejected by the
+    database are listed in the report's errors.
+    """
+    records = bulk_records(request)
+    try:
+        return await submission_service.bulk_create_submissions(records)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+# UPDATE - Bulk update
+@router.put("/bulk", response_model=BulkSubmissionReport)
+async def bulk_update_submissions(request: Request):
+    """
+    Update submissions from a CSV (text/csv) or NDJSON (application/x-ndjson) body.
+
+    Every row carries a submission_id and the fields to change; missing or
+    empty fields are left as they are. Streaming, chunking and the report
+    work as for POST /bulk.
+    """
+    records = bulk_records(request)
+    try:
+        return await submission_service.bulk_update_submissions(records)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 # READ - Get all submissions with filters
 @router.get("/", response_model=List[dict])
 async def list_submissions(
+    response: Response,
     insured_name: Optional[str] = Query(None),
     overall_status: Optional[str] = Query(None),
     underwriter: Optional[str] = Query(None),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000)
+    match_mode: Literal["contains", "prefix", "exact"] = Query("contains"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+    include_total: bool = Query(False, description="Return an estimated total in X-Total-Estimate"),
+    skip: int = Query(0, ge=0, deprecated=True, description="OFFSET paging; use cursor instead")
 ):
-    """Get all submissions with optional filters"""
+    """
+    Get submissions newest first with optional filters.
+
+    The next page's cursor is returned in the X-Next-Cursor header, which is
+    absent on the last page. ``skip`` still pages by OFFSET for old clients.
+    """
     try:
-        result = await submission_service.get_all_submissions(
+        result, next_cursor, total = await submission_service.get_all_submissions(
             insured_name=insured_name,
             overall_status=overall_status,
             underwriter=underwriter,
-            skip=skip,
-            limit=limit
+            match_mode=match_mode,
+            cursor=cursor,
+            limit=limit,
+            include_total=include_total,
+            skip=skip
         )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        if total is not None:
+            response.headers["X-Total-Estimate"] = str(total)
         return result
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
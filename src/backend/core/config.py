@@ -11,6 +11,65 @@ class Settings(BaseSettings):
     langsmith_project: str = Field(default="", alias="LANGSMITH_PROJECT")
     mongodb_atlas_cluster_uri: str = Field(..., alias="MONGODB_ATLAS_CLUSTER_URI")
     google_api_key: SecretStr = Field(..., alias="GOOGLE_API_KEY")
+    llm_model_name: str = Field(default="qwen2.5-coder", alias="LLM_MODEL_NAME")
+    llm_model_provider: str = Field(default="ollama", alias="LLM_MODEL_PROVIDER")
+    llm_base_url: str = Field(default="https://waldo-unappliable-supersolemnly.ngrok-free.dev", alias="LLM_BASE_URL")
+    llm_http_max_connections: int = Field(default=64, alias="LLM_HTTP_MAX_CONNECTIONS")
+    llm_http_max_keepalive_connections: int = Field(default=32, alias="LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    llm_http_keepalive_expiry_seconds: float = Field(default=60.0, alias="LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS")
+    sql_pool_size: int = Field(default=10, alias="SQL_POOL_SIZE")
+    audit_rules_cache_ttl_seconds: float = Field(default=300, alias="AUDIT_RULES_CACHE_TTL_SECONDS")
+    llm_concurrency_initial: int = Field(default=4, alias="LLM_CONCURRENCY_INITIAL")
+    llm_concurrency_min: int = Field(default=1, alias="LLM_CONCURRENCY_MIN")
+    llm_concurrency_max: int = Field(default=32, alias="LLM_CONCURRENCY_MAX")
+    llm_latency_target_seconds: float = Field(default=15.0, alias="LLM_LATENCY_TARGET_SECONDS")
+    embedding_cache_path: str = Field(default=".cache/embeddings.sqlite3", alias="EMBEDDING_CACHE_PATH")
+    embedding_cache_memory_entries: int = Field(default=10000, alias="EMBEDDING_CACHE_MEMORY_ENTRIES")
+    embedding_cache_max_bytes: int = Field(default=512 * 1024 * 1024, alias="EMBEDDING_CACHE_MAX_BYTES")
+    vector_store_backend: str = Field(default="atlas", alias="VECTOR_STORE_BACKEND")
+    local_vector_store_path: str = Field(default=".cache/vector_index", alias="LOCAL_VECTOR_STORE_PATH")
+    local_vector_search_mode: str = Field(default="auto", alias="LOCAL_VECTOR_SEARCH_MODE")
+    local_vector_ivf_min_rows: int = Field(default=20000, alias="LOCAL_VECTOR_IVF_MIN_ROWS")
+    local_vector_ivf_nprobe: int = Field(default=8, alias="LOCAL_VECTOR_IVF_NPROBE")
+    audit_result_store_path: str = Field(default=".cache/audit_results.sqlite3", alias="AUDIT_RESULT_STORE_PATH")
+    extracted_field_store_path: str = Field(default=".cache/extracted_fields.sqlite3", alias="EXTRACTED_FIELD_STORE_PATH")
+    audit_batch_size: int = Field(default=4, alias="AUDIT_BATCH_SIZE")
+    llm_cache_path: str = Field(default=".cache/llm_responses.sqlite3", alias="LLM_CACHE_PATH")
+    llm_cache_ttl_seconds: float = Field(default=7 * 24 * 3600, alias="LLM_CACHE_TTL_SECONDS")
+    llm_cache_max_bytes: int = Field(default=256 * 1024 * 1024, alias="LLM_CACHE_MAX_BYTES")
+    checkpoint_store_path: str = Field(default=".cache/checkpoints.sqlite3", alias="CHECKPOINT_STORE_PATH")
+    checkpoint_max_per_thread: int = Field(default=10, alias="CHECKPOINT_MAX_PER_THREAD")
+    checkpoint_max_thread_bytes: int = Field(default=4 * 1024 * 1024, alias="CHECKPOINT_MAX_THREAD_BYTES")
+    checkpoint_max_memory_bytes: int = Field(default=256 * 1024 * 1024, alias="CHECKPOINT_MAX_MEMORY_BYTES")
+    checkpoint_idle_ttl_seconds: float = Field(default=1800, alias="CHECKPOINT_IDLE_TTL_SECONDS")
+    schema_digest_refresh_seconds: float = Field(default=3600, alias="SCHEMA_DIGEST_REFRESH_SECONDS")
+    schema_digest_max_tables: int = Field(default=4, alias="SCHEMA_DIGEST_MAX_TABLES")
+    query_cache_path: str = Field(default=".cache/query_results.sqlite3", alias="QUERY_CACHE_PATH")
+    query_cache_ttl_seconds: float = Field(default=300, alias="QUERY_CACHE_TTL_SECONDS")
+    query_cache_max_bytes: int = Field(default=64 * 1024 * 1024, alias="QUERY_CACHE_MAX_BYTES")
+    query_cache_max_result_bytes: int = Field(default=256 * 1024, alias="QUERY_CACHE_MAX_RESULT_BYTES")
+    agent_sql_max_rows: int = Field(default=50, alias="AGENT_SQL_MAX_ROWS")
+    agent_sql_max_bytes: int = Field(default=8000, alias="AGENT_SQL_MAX_BYTES")
+    agent_sql_count_limit: int = Field(default=10000, alias="AGENT_SQL_COUNT_LIMIT")
+    agent_sql_max_estimated_rows: int = Field(default=100000, alias="AGENT_SQL_MAX_ESTIMATED_ROWS")
+    agent_sql_max_handles: int = Field(default=256, alias="AGENT_SQL_MAX_HANDLES")
+    agent_sql_handle_ttl_seconds: float = Field(default=900, alias="AGENT_SQL_HANDLE_TTL_SECONDS")
+    conversation_max_tokens: int = Field(default=8000, alias="CONVERSATION_MAX_TOKENS")
+    conversation_tool_output_tokens: int = Field(default=200, alias="CONVERSATION_TOOL_OUTPUT_TOKENS")
+    conversation_keep_turns: int = Field(default=2, alias="CONVERSATION_KEEP_TURNS")
+    rate_limit: str = Field(default="500/hour", alias="RATE_LIMIT")
+    rate_limit_per_ip: str = Field(default="2000/hour", alias="RATE_LIMIT_PER_IP")
+    rate_limit_storage_uri: str = Field(default="sqlite:///.cache/rate_limits.sqlite3", alias="RATE_LIMIT_STORAGE_URI")
+    job_store_path: str = Field(default=".cache/jobs.sqlite3", alias="JOB_STORE_PATH")
+    job_workers: int = Field(default=2, alias="JOB_WORKERS")
+    job_poll_seconds: float = Field(default=1.0, alias="JOB_POLL_SECONDS")
+    job_heartbeat_seconds: float = Field(default=5.0, alias="JOB_HEARTBEAT_SECONDS")
+    job_stale_seconds: float = Field(default=60.0, alias="JOB_STALE_SECONDS")
+    job_retention_seconds: float = Field(default=7 * 24 * 3600, alias="JOB_RETENTION_SECONDS")
+    submission_bulk_chunk_size: int = Field(default=1000, alias="SUBMISSION_BULK_CHUNK_SIZE")
+    submission_bulk_max_errors: int = Field(default=1000, alias="SUBMISSION_BULK_MAX_ERRORS")
+    warmup_on_startup: bool = Field(default=False, alias="WARMUP_ON_STARTUP")
+    readiness_timeout_seconds: float = Field(default=2.0, alias="READINESS_TIMEOUT_SECONDS")
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,79 @@
+import importlib
+import sys
+import threading
+from typing import Any, Callable, Optional
+
+
+class LazyObject:
+    """
+    Stand-in for a module-level singleton that is built on first use.
+
+    Attribute access is forwarded to the object returned by ``factory``, so
+    call sites use the proxy exactly like the singleton itself. The factory
+    runs once under a lock; if it raises, the next access tries again.
+    """
+
+    def __init__(self, factory: Callable[[], Any], name: str):
+        self._factory = factory
+        self._name = name
+        self._lock = threading.Lock()
+        self._instance = None
+        self._initialized = False
+
+    @property
+    def initialized(self) -> bool:
+        return self._initialized
+
+    def resolve(self) -> Any:
+        """Return the underlying object, building it if needed"""
+        if not self._initialized:
+            with self._lock:
+                # Double-check so concurrent first requests build it once
+                if not self._initialized:
+                    self._instance = self._factory()
+                    self._initialized = True
+        return self._instance
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the proxy itself does not have
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = "initialized" if self._initialized else "not initialized"
+        return f"<LazyObject {self._name} ({state})>"
+
+
+class LazyImport(LazyObject):
+    """LazyObject for an attribute of a module that is only imported on first use"""
+
+    def __init__(self, module_path: str, attribute: Optional[str] = None):
+        self._module_path = module_path
+        self._attribute = attribute
+        super().__init__(self._load, f"{module_path}:{attribute}" if attribute else module_path)
+
+    @property
+    def initialized(self) -> bool:
+        if self._initialized:
+            return True
+        # Someone else importing the module builds its singletons too
+        module = sys.modules.get(self._module_path)
+        if module is None or self._attribute is None:
+            return module is not None
+        value = getattr(module, self._attribute, None)
+        if isinstance(value, LazyObject):
+            return value.initialized
+        return value is not None
+
+    def _load(self) -> Any:
+        module = importlib.import_module(self._module_path)
+        if self._attribute is None:
+            return module
+        value = getattr(module, self._attribute)
+        return value.resolve() if isinstance(value, LazyObject) else value
+
+
+def lazy_import(module_path: str, attribute: Optional[str] = None) -> LazyImport:
+    """Proxy for ``module_path`` (or one of its attributes) that imports it on first use"""
+    return LazyImport(module_path, attribute)
@@ -0,0 +1,104 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical async calls into one computation.
+
+    The first caller for a key starts the computation as its own task; callers
+    arriving with the same key while it runs wait for that task instead of
+    starting another, and all of them get its result or its exception. The
+    key is forgotten as soon as the task finishes, so nothing is cached.
+    Waiters are counted per key: a cancelled caller (e.g. its client
+    disconnected or its job was cancelled) stops waiting without disturbing
+    the others, and when the last waiter is cancelled the computation is
+    cancelled too, so nobody pays for work nobody is waiting for.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.abandoned = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Return ``await fn()``, sharing one run among concurrent callers with the same key"""
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(functools.partial(self._done, key))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+
+        self._waiters[key] += 1
+        try:
+            # Shielded so one waiter's cancellation does not cancel the others' result
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._in_flight.get(key) is task and self._waiters[key] == 1 and not task.done():
+                # The last waiter left: stop the shared computation, and
+                # forget the key now so a new caller starts afresh
+                del self._in_flight[key]
+                del self._waiters[key]
+                task.cancel()
+                self.abandoned += 1
+            raise
+        finally:
+            if self._in_flight.get(key) is task:
+                self._waiters[key] -= 1
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+            del self._waiters[key]
+        # Mark the exception retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "abandoned": self.abandoned,
+            "in_flight": len(self._in_flight),
+        }
+
+
+# Every group, by name, for the metrics endpoint
+_groups: Dict[str, SingleFlight] = {}
+
+
+def single_flight(name: str, key: Callable[..., Hashable]):
+    """
+    Decorator coalescing concurrent calls of an async function.
+
+    ``key`` receives the call's arguments and returns what makes two calls
+    identical. Only calls with exactly the same arguments may share a key:
+    the shared run sees the first caller's arguments, not the others'. Functions decorated with the same
+    ``name`` share one group.
+    """
+    group = _groups.setdefault(name, SingleFlight(name))
+
+    def decorator(fn: Callable[..., Awaitable[Any]]):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await group.do(key(*args, **kwargs), lambda: fn(*args, **kwargs))
+        return wrapper
+
+    return decorator
+
+
+def stats() -> dict:
+    """Counters of every single-flight group"""
+    return {name: group.stats() for name, group in _groups.items()}
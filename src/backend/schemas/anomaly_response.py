@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import List
+from pydantic import BaseModel, Field
+
+class DetectedAnomaly(BaseModel):
+    """A detected anomaly in submission documents"""
+    anomaly_id: str
+    document_type: str
+    anomaly_type: str  # e.g., "missing_field", "inconsistent_data", "suspicious_pattern"
+    severity: str = Field(..., description="low, medium, high, critical")
+    description: str
+    affected_field: str
+    evidence: str
+    recommended_action: str
+
+class AnomalyDetectionResponse(BaseModel):
+    """Complete anomaly detection response"""
+    submission_id: str
+    documents_analyzed: int
+    anomalies_detected: int
+    risk_level: str = Field(..., description="low, medium, high, critical")
+    detected_anomalies: List[DetectedAnomaly]
+    summary: str
+    analyzed_at: datetime
+    llm_calls_avoided: int = Field(default=0, description="Documents settled by the deterministic pre-screen without an LLM call")
@@ -19,6 +19,8 @@ class AuditResponse(BaseModel):
     total_rules: int
     passed_rules: int
     failed_rules: int
+    reused_rules: int = Field(default=0, description="Rules whose stored result was reused")
+    recomputed_rules: int = Field(default=0, description="Rules evaluated by the LLM in this run")
     validation_results: List[RuleValidationResult]
 
 
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Dict, Union
+from pydantic import BaseModel, Field
+
+class ExtractedField(BaseModel):
+    """One typed key/value pair parsed from a document"""
+    name: str
+    field_type: str = Field(..., description="date, amount, number or text")
+    value: Union[float, str] = Field(..., description="ISO date, numeric value or trimmed text")
+    raw: str = Field(..., description="Value as written in the document")
+
+class ExtractedDocument(BaseModel):
+    """Fields extracted from one submission document"""
+    submission_id: str
+    document_id: str
+    document_type: str
+    checksum: str = Field(..., description="SHA-256 of the document content the fields were parsed from")
+    fields: Dict[str, ExtractedField]
+    unstructured: str = Field(default="", description="Content lines that are not key/value fields")
+    extracted_at: datetime
@@ -0,0 +1,17 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+
+class JobStatus(BaseModel):
+    """State of a background audit or anomaly scan"""
+    job_id: str
+    kind: str = Field(..., description="audit or anomalies")
+    submission_id: str
+    status: str = Field(..., description="queued, running, cancelling, succeeded, failed or cancelled")
+    params: dict = Field(default_factory=dict, description="Options the job was submitted with")
+    queue_position: Optional[int] = Field(default=None, description="Jobs ahead of this one while queued")
+    result: Optional[dict] = Field(default=None, description="AuditResponse or AnomalyDetectionResponse once succeeded")
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime, date
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 class SubmissionBase(BaseModel):
@@ -39,10 +39,33 @@ class SubmissionUpdate(BaseModel):
     technical_assistant: Optional[str] = None
     underwriting_year: Optional[int] = None
 
+class SubmissionBulkUpdate(SubmissionUpdate):
+    submission_id: str
+
+class BulkRowError(BaseModel):
+    row: int = Field(..., description="1-based data row of the upload, header excluded")
+    key: Optional[str] = Field(default=None, description="submission_no (import) or submission_id (update) of the row")
+    error: str
+
+class BulkSubmissionReport(BaseModel):
+    """Outcome of a bulk import or update"""
+    rows: int = Field(..., description="Data rows read from the body")
+    written: int = Field(..., description="Rows inserted or updated")
+    unchanged: int = Field(default=0, description="Update rows without any field to change")
+    failed: int
+    errors: List[BulkRowError] = Field(default_factory=list)
+    errors_truncated: bool = Field(default=False, description="More rows failed than are listed in errors")
+    aborted: Optional[str] = Field(default=None, description="Why reading stopped before the end of the body")
+
 class SubmissionResponse(SubmissionBase):
+    # Legacy rows may hold NULL in columns that new submissions always fill,
+    # so a stored row is returned as it is rather than failing validation
+    submission_no: Optional[str] = None
+    insured_name: Optional[str] = None
+    overall_status: Optional[str] = None
     submission_id: UUID
-    created_at: datetime
-    updated_at: datetime
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
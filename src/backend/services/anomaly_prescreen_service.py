@@ -0,0 +1,264 @@
+import re
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+from src.backend.schemas.anomaly_response import DetectedAnomaly
+from src.backend.schemas.extracted_fields import ExtractedDocument, ExtractedField
+from src.backend.services.field_store_service import parse_amount, parse_date
+
+# Declarative checks per document_type. Field names are the "Label:" prefixes
+# used in the document content.
+#   required        fields that must be present and non-empty
+#   dates / amounts fields that must parse as a date / a monetary amount
+#   ordered_dates   (earlier, later) pairs where later must be after earlier
+#   not_expired     date fields that must not be in the past
+#   max_age_days    {field: days} dates older than this are stale
+#   not_greater     (part, whole) amount pairs where part must not exceed whole
+#   needs_judgment  send the document to the LLM even when a check fails
+DOCUMENT_CHECKS = {
+    "Policy_Details": {
+        "required": ["Policy Number", "Effective Date", "Expiry Date", "Premium"],
+        "dates": ["Effective Date", "Expiry Date"],
+        "amounts": ["Premium"],
+        "ordered_dates": [("Effective Date", "Expiry Date")],
+    },
+    "Insured_Information": {
+        "required": ["Company Name", "Registration No", "Industry"],
+    },
+    "Risk_Assessment": {
+        "required": ["Risk Level", "Location", "Assessment Date"],
+        "dates": ["Assessment Date"],
+        "max_age_days": {"Assessment Date": 365},
+        "needs_judgment": True,
+    },
+    "Financial_Statements": {
+        "required": ["Revenue", "Year"],
+        "amounts": ["Revenue", "Profit"],
+        "not_greater": [("Profit", "Revenue")],
+        "needs_judgment": True,
+    },
+    "Broker_Authorization": {
+        "required": ["Broker", "Authorization", "Expiry"],
+        "dates": ["Expiry"],
+        "not_expired": ["Expiry"],
+    },
+}
+
+# Checks across documents of one submission, run on the extracted field store.
+#   not_before  the field's date must be on or after the reference field's date
+# Besides these, a field name that appears in several documents with
+# different values is reported as a conflict.
+CROSS_DOCUMENT_CHECKS = [
+    {
+        "check": "not_before",
+        "field": ("Broker_Authorization", "Expiry"),
+        "reference": ("Policy_Details", "Expiry Date"),
+        "severity": "high",
+        "recommended_action": "Renew the broker authorization to cover the policy period",
+    },
+]
+
+
+class AnomalyPrescreen:
+    """
+    Rule engine that settles cheap document checks before the LLM sees them.
+
+    Each document type's checks are compiled once into per-field regex
+    extractors. ``screen`` returns DetectedAnomaly objects for every failed
+    check and whether the document still needs an LLM review: documents that
+    pass every check, document types without checks, and types marked
+    ``needs_judgment`` go to the LLM; the rest are settled here.
+    """
+
+    def __init__(self, document_checks: Dict[str, dict], cross_document_checks: List[dict]):
+        self.document_checks = document_checks
+        self.cross_document_checks = cross_document_checks
+        self._extractors: Dict[str, Dict[str, re.Pattern]] = {}
+        for document_type, checks in document_checks.items():
+            fields = set(checks.get("required", []))
+            fields.update(checks.get("dates", []))
+            fields.update(checks.get("amounts", []))
+            self._extractors[document_type] = {
+                field: re.compile(rf"^[ \t]*{re.escape(field)}[ \t]*:[ \t]*(.*?)[ \t]*$", re.IGNORECASE | re.MULTILINE)
+                for field in fields
+            }
+
+        self.documents_screened = 0
+        self.anomalies_found = 0
+        self.llm_calls_avoided = 0
+
+    def extract_fields(self, document_type: str, content: str) -> Dict[str, str]:
+        """Return {field: value} for every field the document type's checks use"""
+        fields = {}
+        for field, pattern in self._extractors.get(document_type, {}).items():
+            match = pattern.search(content or "")
+            if match:
+                fields[field] = match.group(1)
+        return fields
+
+    def screen(self, document: dict, today: Optional[date] = None) -> Tuple[List[DetectedAnomaly], bool]:
+        """
+        Run the deterministic checks for one document
+
+        Returns:
+            (anomalies found, whether the document still needs an LLM review)
+        """
+        document_type = document.get("document_type", "")
+        checks = self.document_checks.get(document_type)
+        self.documents_screened += 1
+        if checks is None:
+            return [], True
+
+        today = today or date.today()
+        fields = self.extract_fields(document_type, document.get("content", ""))
+        findings = []
+
+        for field in checks.get("required", []):
+            if not fields.get(field):
+                findings.append((
+                    "missing_field", "high", field, f"{field} is missing from the document",
+                    f"Request the {field} from the broker"
+                ))
+
+        dates, amounts = {}, {}
+        for field in checks.get("dates", []):
+            if fields.get(field):
+                dates[field] = parse_date(fields[field])
+                if dates[field] is None:
+                    findings.append((
+                        "data_quality", "medium", field, f"{field}: {fields[field]} is not a valid date",
+                        f"Correct the {field} format"
+                    ))
+        for field in checks.get("amounts", []):
+            if fields.get(field):
+                amounts[field] = parse_amount(fields[field])
+                if amounts[field] is None:
+                    findings.append((
+                        "data_quality", "medium", field, f"{field}: {fields[field]} is not a valid amount",
+                        f"Correct the {field} value"
+                    ))
+
+        for earlier, later in checks.get("ordered_dates", []):
+            if dates.get(earlier) and dates.get(later) and dates[later] <= dates[earlier]:
+                findings.append((
+                    "inconsistent_data", "high", later,
+                    f"{later}: {fields[later]} is not after {earlier}: {fields[earlier]}",
+                    f"Confirm the {earlier} and {later}"
+                ))
+
+        for field in checks.get("not_expired", []):
+            if dates.get(field) and dates[field] < today:
+                findings.append((
+                    "outdated_info", "high", field, f"{field}: {fields[field]} is in the past",
+                    f"Obtain a current {document_type.replace('_', ' ')}"
+                ))
+
+        for field, max_age_days in checks.get("max_age_days", {}).items():
+            if dates.get(field) and (today - dates[field]).days > max_age_days:
+                findings.append((
+                    "outdated_info", "medium", field,
+                    f"{field}: {fields[field]} is more than {max_age_days} days old",
+                    f"Request an updated {document_type.replace('_', ' ')}"
+                ))
+
+        for part, whole in checks.get("not_greater", []):
+            if amounts.get(part) is not None and amounts.get(whole) is not None and amounts[part] > amounts[whole]:
+                findings.append((
+                    "inconsistent_data", "medium", part,
+                    f"{part}: {fields[part]} exceeds {whole}: {fields[whole]}",
+                    f"Verify the {part} and {whole} figures"
+                ))
+
+        document_id = document.get("document_id")
+        anomalies = [
+            DetectedAnomaly(
+                anomaly_id=f"{document_id}-PRE{i}",
+                document_type=document_type,
+                anomaly_type=anomaly_type,
+                severity=severity,
+                description=f"{anomaly_type} detected in {document_type}",
+                affected_field=field,
+                evidence=evidence,
+                recommended_action=action
+            )
+            for i, (anomaly_type, severity, field, evidence, action) in enumerate(findings)
+        ]
+
+        needs_llm = not anomalies or checks.get("needs_judgment", False)
+        self.anomalies_found += len(anomalies)
+        if not needs_llm:
+            self.llm_calls_avoided += 1
+        return anomalies, needs_llm
+
+    @staticmethod
+    def _comparable(field: ExtractedField) -> tuple:
+        """Value two documents must agree on; "$25,000" and "25000" are the same number"""
+        if field.field_type in ("amount", "number"):
+            return "numeric", float(field.value)
+        return field.field_type, field.value
+
+    def check_consistency(self, documents: List[ExtractedDocument]) -> List[DetectedAnomaly]:
+        """
+        Compare extracted fields across a submission's documents
+
+        Returns:
+            DetectedAnomaly per conflicting field and per failed cross-document check
+        """
+        findings = []
+
+        # The same field stated differently in two documents
+        values: Dict[str, List[Tuple[ExtractedDocument, str]]] = {}
+        for document in documents:
+            for name, field in document.fields.items():
+                values.setdefault(name.lower(), []).append((document, field))
+        for occurrences in values.values():
+            if len({self._comparable(field) for _, field in occurrences}) > 1:
+                first_document, first_field = occurrences[0]
+                findings.append((
+                    first_document, "inconsistent_data", "medium", first_field.name,
+                    "; ".join(f"{document.document_type}: {field.raw}" for document, field in occurrences),
+                    f"Reconcile {first_field.name} across documents"
+                ))
+
+        by_type = {document.document_type: document for document in documents}
+        for check in self.cross_document_checks:
+            if check["check"] != "not_before":
+                continue
+            (document_type, name), (reference_type, reference_name) = check["field"], check["reference"]
+            document, reference = by_type.get(document_type), by_type.get(reference_type)
+            field = document.fields.get(name) if document else None
+            reference_field = reference.fields.get(reference_name) if reference else None
+            if not (field and reference_field and field.field_type == reference_field.field_type == "date"):
+                continue
+            if field.value < reference_field.value:
+                findings.append((
+                    document, "inconsistent_data", check["severity"], name,
+                    f"{document_type} {name}: {field.raw} is before {reference_type} {reference_name}: {reference_field.raw}",
+                    check["recommended_action"]
+                ))
+
+        anomalies = [
+            DetectedAnomaly(
+                anomaly_id=f"{document.document_id}-XDOC{i}",
+                document_type=document.document_type,
+                anomaly_type=anomaly_type,
+                severity=severity,
+                description=f"Cross-document {anomaly_type} detected in {document.document_type}",
+                affected_field=name,
+                evidence=evidence,
+                recommended_action=action
+            )
+            for i, (document, anomaly_type, severity, name, evidence, action) in enumerate(findings)
+        ]
+        self.anomalies_found += len(anomalies)
+        return anomalies
+
+    def stats(self) -> dict:
+        """Pre-screen counters for the metrics endpoint"""
+        return {
+            "documents_screened": self.documents_screened,
+            "anomalies_found": self.anomalies_found,
+            "llm_calls_avoided": self.llm_calls_avoided,
+        }
+
+
+anomaly_prescreen = AnomalyPrescreen(DOCUMENT_CHECKS, CROSS_DOCUMENT_CHECKS)
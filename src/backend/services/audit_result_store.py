@@ -0,0 +1,71 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Tuple
+from src.backend.core.config import settings
+from src.backend.schemas.audit_response import RuleValidationResult
+
+
+class AuditResultStore:
+    """
+    Persists the latest RuleValidationResult per (submission, rule) together
+    with the fingerprint of the inputs it was computed from.
+    """
+
+    def __init__(self, db_path: str):
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS rule_results (
+                submission_id TEXT NOT NULL,
+                rule_id TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                result_json TEXT NOT NULL,
+                evaluated_at TEXT NOT NULL,
+                PRIMARY KEY (submission_id, rule_id)
+            )
+        """)
+        self._connection.commit()
+
+    def get_results(self, submission_id: str) -> Dict[str, Tuple[str, RuleValidationResult]]:
+        """Return {rule_id: (fingerprint, result)} for every stored rule of a submission"""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT rule_id, fingerprint, result_json FROM rule_results WHERE submission_id = ?",
+                (submission_id,)
+            ).fetchall()
+        return {
+            rule_id: (fingerprint, RuleValidationResult.model_validate_json(result_json))
+            for rule_id, fingerprint, result_json in rows
+        }
+
+    def save_results(self, submission_id: str, results: List[Tuple[str, RuleValidationResult]]) -> None:
+        """Store (fingerprint, result) pairs, replacing earlier results for the same rules"""
+        if not results:
+            return
+        evaluated_at = datetime.now().isoformat()
+        with self._lock:
+            self._connection.executemany(
+                """
+                INSERT OR REPLACE INTO rule_results (submission_id, rule_id, fingerprint, result_json, evaluated_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (submission_id, result.rule_id, fingerprint, result.model_dump_json(), evaluated_at)
+                    for fingerprint, result in results
+                ]
+            )
+            self._connection.commit()
+
+    def clear(self, submission_id: str) -> None:
+        """Forget every stored result of a submission"""
+        with self._lock:
+            self._connection.execute("DELETE FROM rule_results WHERE submission_id = ?", (submission_id,))
+            self._connection.commit()
+
+
+audit_result_store = AuditResultStore(settings.audit_result_store_path)
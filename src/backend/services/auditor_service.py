@@ -1,37 +1,149 @@
-from typing import List
+import asyncio
+import time
+from typing import List, Optional
 
 from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from src.backend.core.config import settings
 from src.backend.services.sql_service import DatabaseManager
 
 
-def get_audit_rules_from_db() -> List[dict]:
+RULES_QUERY = text("""
+    SELECT
+        rule_id,
+        rule_name,
+        rule_description,
+        severity
+    FROM rules_master
+    ORDER BY rule_id
+""")
+
+# Cheap fingerprint of rules_master; CHECKSUM_AGG also catches in-place edits on Azure SQL
+RULES_VERSION_QUERY_MSSQL = text("""
+    SELECT
+        COUNT(*) AS row_count,
+        CHECKSUM_AGG(BINARY_CHECKSUM(rule_id, rule_name, rule_description, severity)) AS checksum
+    FROM rules_master
+""")
+
+RULES_VERSION_QUERY = text("""
+    SELECT
+        COUNT(*) AS row_count,
+        MAX(rule_id) AS checksum
+    FROM rules_master
+""")
+
+
+def _fetch_rules_version(connection: Connection) -> tuple:
+    """Return a cheap version marker for rules_master"""
+    query = RULES_VERSION_QUERY_MSSQL if connection.dialect.name == "mssql" else RULES_VERSION_QUERY
+    return tuple(connection.execute(query).one())
+
+
+def _fetch_rules(connection: Connection) -> List[dict]:
+    """Read every audit rule from rules_master"""
+    result = connection.execute(RULES_QUERY)
+    # Convert rows directly to list of dictionaries
+    return [dict(row._mapping) for row in result]
+
+
+class AuditRulesCache:
+    """
+    In-process cache of rules_master.
+
+    Cached rules are served without touching the database until the TTL lapses.
+    After that a single version query decides whether the cached copy is still
+    current (TTL is extended) or the rules need to be reloaded. Both queries
+    run on the shared SQL thread pool, never on the event loop.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._rules: Optional[List[dict]] = None
+        self._version: Optional[tuple] = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+
+    async def get_rules(self) -> List[dict]:
+        """Return the audit rules, reloading them only when rules_master changed"""
+        if self._rules is not None and time.monotonic() < self._expires_at:
+            self.hits += 1
+            return list(self._rules)
+
+        async with self._lock:
+            # Another caller may have revalidated while this one waited
+            if self._rules is not None and time.monotonic() < self._expires_at:
+                self.hits += 1
+                return list(self._rules)
+
+            cached_rules, cached_version = self._rules, self._version
+            invalidations = self.invalidations
+            db = DatabaseManager.get_shared_async_db()
+            version, rules = await db.transaction(
+                lambda connection: self._load(connection, cached_version if cached_rules is not None else None)
+            )
+
+            if rules is None:
+                self.hits += 1
+                self.revalidations += 1
+                rules = cached_rules
+            else:
+                self.misses += 1
+
+            # Invalidated while loading: serve what was read but do not keep it
+            if invalidations == self.invalidations:
+                self._rules = rules
+                self._version = version
+                self._expires_at = time.monotonic() + self.ttl_seconds
+            return list(rules)
+
+    @staticmethod
+    def _load(connection: Connection, cached_version: Optional[tuple]):
+        """(version, rules), with rules None when ``cached_version`` is still current"""
+        version = _fetch_rules_version(connection)
+        if cached_version is not None and version == cached_version:
+            return version, None
+        return version, _fetch_rules(connection)
+
+    def invalidate(self) -> None:
+        """Drop the cached rules so the next read goes to the database"""
+        self._rules = None
+        self._version = None
+        self._expires_at = 0.0
+        self.invalidations += 1
+
+    def stats(self) -> dict:
+        """Cache counters for the metrics endpoint"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "cached_rules": len(self._rules) if self._rules is not None else 0,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+audit_rules_cache = AuditRulesCache(ttl_seconds=settings.audit_rules_cache_ttl_seconds)
+
+
+async def get_audit_rules_from_db() -> List[dict]:
     """
     Fetch audit rules from Azure SQL database.
-    
+
     Expected table structure:
     - audit_rules (rule_id, rule_name, rule_description, severity, is_active, created_at)
-    
+
+    Rules are served from the in-process cache and only re-read when the
+    rules_master version changes or the cache is invalidated.
+
     Returns:
         List of audit rules from database
     """
-    db = DatabaseManager.get_shared_db()
-    
-    # Query to fetch active audit rules from the database
-    query = text("""
-        SELECT 
-            rule_id,
-            rule_name,
-            rule_description,
-            severity
-        FROM rules_master
-        ORDER BY rule_id
-    """)
-    
-    # Execute the query using the underlying SQLAlchemy engine
-    with db._engine.connect() as connection:
-        result = connection.execute(query)
-        
-        # Convert rows directly to list of dictionaries
-        rules = [dict(row._mapping) for row in result]
-    
-    return rules
+    return await audit_rules_cache.get_rules()
@@ -0,0 +1,238 @@
+import re
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from langchain_community.utilities.sql_database import truncate_word
+from sqlalchemy import func, literal_column, select, table, text
+from sqlalchemy.engine import Connection
+from src.backend.core.config import settings
+from src.backend.services.query_cache_service import STRING_LITERAL, is_read_only, normalize_sql, referenced_tables
+from src.backend.services.sql_service import DatabaseManager
+
+# Rows pulled from the cursor per round trip
+FETCH_BATCH = 100
+
+# Same per-value cap SQLDatabase.run applies
+MAX_VALUE_LENGTH = 300
+
+# Any of these makes a query's result size depend on more than the table size
+BOUNDED_QUERY = re.compile(r"\b(?:top|limit|fetch|where|group by|having)\b|\b(?:count|sum|avg|min|max)\(")
+
+TABLE_ROW_ESTIMATE_MSSQL = text("""
+    SELECT SUM(row_count) FROM sys.dm_db_partition_stats
+    WHERE object_id = OBJECT_ID(:table_name) AND index_id IN (0, 1)
+""")
+
+READ_ONLY_REJECTION = (
+    "Error: Query rejected: only a single read-only SELECT statement is allowed. "
+    "This tool cannot insert, update, delete or change the schema."
+)
+
+# Cached per table; row counts do not move fast enough to matter here
+TABLE_ESTIMATE_TTL_SECONDS = 300
+
+
+class BoundedQueryExecutor:
+    """
+    Runs the SQL agent's queries without materializing whole result sets.
+
+    Rows are streamed from the cursor in batches until ``max_rows`` rows or
+    ``max_bytes`` characters of output. Past the budget the cursor is only
+    counted (up to ``count_limit`` rows) and closed, and the preview ends with
+    the count and a continuation handle that ``resume`` turns into the next
+    page. Queries with no filter, limit or aggregate are rejected up front
+    when a table they read holds more than ``max_estimated_rows`` rows.
+    Only single read-only SELECT statements are run, and nothing is ever
+    committed, so this path cannot write to the database.
+    """
+
+    def __init__(
+        self,
+        max_rows: int,
+        max_bytes: int,
+        count_limit: int,
+        max_estimated_rows: int,
+        max_handles: int,
+        handle_ttl_seconds: float
+    ):
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.count_limit = count_limit
+        self.max_estimated_rows = max_estimated_rows
+        self.max_handles = max_handles
+        self.handle_ttl_seconds = handle_ttl_seconds
+        self._lock = threading.Lock()
+        # handle -> (query, offset, created_at)
+        self._handles: "OrderedDict[str, Tuple[str, int, float]]" = OrderedDict()
+        # table -> (estimated rows, fetched_at)
+        self._table_estimates: Dict[str, Tuple[int, float]] = {}
+
+        self.queries = 0
+        self.truncated = 0
+        self.rejected = 0
+        self.continuations = 0
+        self.rows_returned = 0
+
+    def run(self, query: str) -> Tuple[str, bool]:
+        """
+        Execute a query within the row/byte budget
+
+        Returns:
+            (tool output, whether the output is a truncated preview)
+        """
+        self.queries += 1
+        if not is_read_only(normalize_sql(query)):
+            self.rejected += 1
+            return READ_ONLY_REJECTION, False
+        try:
+            with DatabaseManager.get_shared_engine().connect() as connection:
+                rejection = self._check_estimate(connection, query)
+                if rejection:
+                    self.rejected += 1
+                    return rejection, False
+                return self._execute(connection, query, offset=0)
+        except Exception as e:
+            return f"Error: {e}", False
+
+    def resume(self, handle: str) -> str:
+        """Next page of a truncated result"""
+        with self._lock:
+            self._expire_handles()
+            entry = self._handles.get(handle)
+        if entry is None:
+            return f"Error: Unknown or expired handle '{handle}'. Run the query again with sql_db_query."
+
+        query, offset, _ = entry
+        self.continuations += 1
+        try:
+            with DatabaseManager.get_shared_engine().connect() as connection:
+                output, _ = self._execute(connection, query, offset=offset)
+                return output
+        except Exception as e:
+            return f"Error: {e}"
+
+    def _execute(self, connection: Connection, query: str, offset: int) -> Tuple[str, bool]:
+        result = connection.execute(text(query))
+        if not result.returns_rows:
+            # Read-only statements return rows; never keep the effects of anything else
+            connection.rollback()
+            return "", False
+
+        rows, size, fetched = [], 0, 0
+        truncated = False
+        while not truncated:
+            batch = result.fetchmany(FETCH_BATCH)
+            if not batch:
+                break
+            fetched += len(batch)
+            for position, row in enumerate(batch, start=fetched - len(batch)):
+                if position < offset:
+                    continue
+                values = tuple(truncate_word(value, length=MAX_VALUE_LENGTH) for value in row)
+                row_size = len(str(values)) + 2
+                if len(rows) >= self.max_rows or (rows and size + row_size > self.max_bytes):
+                    truncated = True
+                    break
+                rows.append(values)
+                size += row_size
+
+        self.rows_returned += len(rows)
+        if not truncated:
+            result.close()
+            return (str(rows) if rows else ""), False
+
+        # Count the rest without keeping it, then stop reading
+        count_complete = True
+        while True:
+            if fetched >= self.count_limit:
+                count_complete = False
+                break
+            batch = result.fetchmany(FETCH_BATCH)
+            if not batch:
+                break
+            fetched += len(batch)
+        result.close()
+
+        handle = self._register(query, offset + len(rows))
+        first, last = offset + 1, offset + len(rows)
+        count = str(fetched) if count_complete else f"at least {fetched}"
+        self.truncated += 1
+        return (
+            f"{rows}\n"
+            f"-- Rows {first}-{last} of {count} shown (limit {self.max_rows} rows / {self.max_bytes} characters). "
+            f"Call sql_db_query_continue with handle \"{handle}\" for the next rows, "
+            f"or narrow the query with filters, TOP or aggregates."
+        ), True
+
+    def _register(self, query: str, offset: int) -> str:
+        handle = secrets.token_hex(4)
+        with self._lock:
+            self._expire_handles()
+            self._handles[handle] = (query, offset, time.monotonic())
+            while len(self._handles) > self.max_handles:
+                self._handles.popitem(last=False)
+        return handle
+
+    def _expire_handles(self) -> None:
+        cutoff = time.monotonic() - self.handle_ttl_seconds
+        while self._handles and next(iter(self._handles.values()))[2] < cutoff:
+            self._handles.popitem(last=False)
+
+    def _check_estimate(self, connection: Connection, query: str) -> Optional[str]:
+        """Rejection message for an unbounded query over a large table, else None"""
+        normalized = normalize_sql(query)
+        code = STRING_LITERAL.sub("''", normalized)
+        if not code.startswith(("select", "with")) or BOUNDED_QUERY.search(code):
+            return None
+
+        for table_name in referenced_tables(normalized):
+            estimate = self._table_estimate(connection, table_name)
+            if estimate is not None and estimate > self.max_estimated_rows:
+                return (
+                    f"Error: Query rejected: it has no WHERE, TOP/LIMIT or aggregate and {table_name} holds "
+                    f"about {estimate} rows (limit {self.max_estimated_rows}). Add a filter, TOP or an aggregate."
+                )
+        return None
+
+    def _table_estimate(self, connection: Connection, table_name: str) -> Optional[int]:
+        cached = self._table_estimates.get(table_name)
+        if cached and time.monotonic() - cached[1] < TABLE_ESTIMATE_TTL_SECONDS:
+            return cached[0]
+        try:
+            if connection.dialect.name == "mssql":
+                # Partition metadata instead of a scan
+                estimate = connection.execute(TABLE_ROW_ESTIMATE_MSSQL, {"table_name": table_name}).scalar()
+            else:
+                capped = select(literal_column("1")).select_from(table(table_name)).limit(self.max_estimated_rows + 1)
+                estimate = connection.execute(select(func.count()).select_from(capped.subquery())).scalar()
+        except Exception:
+            # CTE names, aliases and views without stats: no estimate, no rejection
+            connection.rollback()
+            return None
+        if estimate is None:
+            return None
+        self._table_estimates[table_name] = (int(estimate), time.monotonic())
+        return int(estimate)
+
+    def stats(self) -> dict:
+        """Executor counters for the metrics endpoint"""
+        return {
+            "queries": self.queries,
+            "truncated": self.truncated,
+            "rejected": self.rejected,
+            "continuations": self.continuations,
+            "rows_returned": self.rows_returned,
+            "open_handles": len(self._handles),
+        }
+
+
+bounded_query_executor = BoundedQueryExecutor(
+    max_rows=settings.agent_sql_max_rows,
+    max_bytes=settings.agent_sql_max_bytes,
+    count_limit=settings.agent_sql_count_limit,
+    max_estimated_rows=settings.agent_sql_max_estimated_rows,
+    max_handles=settings.agent_sql_max_handles,
+    handle_ttl_seconds=settings.agent_sql_handle_ttl_seconds
+)
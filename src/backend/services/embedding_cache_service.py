@@ -0,0 +1,233 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from langchain_core.embeddings import Embeddings
+
+
+def _encode_vector(vector: List[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _decode_vector(blob: bytes) -> List[float]:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector.tolist()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Content-addressed cache in front of an embeddings client.
+
+    Vectors are keyed by a SHA-256 of (namespace, kind, text), where ``kind``
+    separates query and document embeddings because providers such as Gemini
+    embed them with different task types. Lookups go through an in-memory LRU
+    tier first and an SQLite tier second; only the remaining misses are sent to
+    the underlying client, in one batch. The SQLite tier is capped by size and
+    evicts least recently used vectors first.
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        namespace: str,
+        db_path: str,
+        memory_max_entries: int,
+        disk_max_bytes: int,
+        query_batch_kwargs: Optional[dict] = None
+    ):
+        self.underlying = underlying
+        self.namespace = namespace
+        self.memory_max_entries = memory_max_entries
+        self.disk_max_bytes = disk_max_bytes
+        self.query_batch_kwargs = query_batch_kwargs or {}
+
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # The byte total lives in the database, kept by triggers, so every
+        # process sharing the file enforces the cap against the same number
+        self._connection.executescript("""
+            BEGIN IMMEDIATE;
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_embeddings_last_access ON embeddings (last_access);
+            CREATE TABLE IF NOT EXISTS embeddings_size (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                total INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO embeddings_size (id, total)
+                SELECT 0, COALESCE(SUM(size), 0) FROM embeddings;
+            CREATE TRIGGER IF NOT EXISTS embeddings_size_insert AFTER INSERT ON embeddings
+                BEGIN UPDATE embeddings_size SET total = total + NEW.size WHERE id = 0; END;
+            CREATE TRIGGER IF NOT EXISTS embeddings_size_update AFTER UPDATE OF size ON embeddings
+                BEGIN UPDATE embeddings_size SET total = total + NEW.size - OLD.size WHERE id = 0; END;
+            CREATE TRIGGER IF NOT EXISTS embeddings_size_delete AFTER DELETE ON embeddings
+                BEGIN UPDATE embeddings_size SET total = total - OLD.size WHERE id = 0; END;
+            COMMIT;
+        """)
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.disk_evictions = 0
+
+    def _key(self, kind: str, text: str) -> str:
+        return hashlib.sha256(f"{self.namespace}\0{kind}\0{text}".encode("utf-8")).hexdigest()
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Resolve keys from the memory tier, then the disk tier"""
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+                    self.memory_hits += 1
+
+            disk_keys = [key for key in keys if key not in found]
+            if disk_keys:
+                placeholders = ",".join("?" * len(disk_keys))
+                rows = self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    disk_keys
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = _decode_vector(blob)
+                    self._remember(key, found[key])
+                    self.disk_hits += 1
+                if rows:
+                    self._connection.executemany(
+                        "UPDATE embeddings SET last_access = ? WHERE key = ?",
+                        [(time.time(), key) for key, _ in rows]
+                    )
+                    self._connection.commit()
+
+            self.misses += len(keys) - len(found)
+        return found
+
+    def _store(self, vectors: Dict[str, List[float]]) -> None:
+        """Write freshly computed vectors to both tiers"""
+        with self._lock:
+            now = time.time()
+            rows = []
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+                blob = _encode_vector(vector)
+                rows.append((key, blob, len(blob), now))
+
+            # Upsert rather than REPLACE so a re-stored key changes the total by its size delta
+            self._connection.executemany(
+                """
+                INSERT INTO embeddings (key, vector, size, last_access) VALUES (?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    vector = excluded.vector, size = excluded.size, last_access = excluded.last_access
+                """,
+                rows
+            )
+            # The write above holds the database lock, so the total is current
+            # for every process until this transaction commits
+            if self._disk_bytes() > self.disk_max_bytes:
+                self._evict_disk()
+            self._connection.commit()
+
+    def _disk_bytes(self) -> int:
+        return self._connection.execute("SELECT total FROM embeddings_size WHERE id = 0").fetchone()[0]
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self) -> None:
+        """Drop least recently used vectors until the disk tier is at 90% of its cap"""
+        excess = self._disk_bytes() - int(self.disk_max_bytes * 0.9)
+        rows = self._connection.execute("SELECT key, size FROM embeddings ORDER BY last_access")
+        evicted = []
+        for key, size in rows:
+            if excess <= 0:
+                break
+            evicted.append((key,))
+            excess -= size
+        self._connection.executemany("DELETE FROM embeddings WHERE key = ?", evicted)
+        self.disk_evictions += len(evicted)
+
+    def _split(self, kind: str, texts: List[str]) -> Tuple[List[str], Dict[str, List[float]], Dict[str, str]]:
+        """Return the keys for ``texts``, the cached vectors and the unique misses by key"""
+        keys = [self._key(kind, text) for text in texts]
+        found = self._lookup(list(dict.fromkeys(keys)))
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+        return keys, found, missing
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, found, missing = self._split("document", texts)
+        if missing:
+            computed = dict(zip(missing, self.underlying.embed_documents(list(missing.values()))))
+            self._store(computed)
+            found.update(computed)
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        keys, found, missing = self._split("query", [text])
+        if missing:
+            found[keys[0]] = self.underlying.embed_query(text)
+            self._store({keys[0]: found[keys[0]]})
+        return found[keys[0]]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, found, missing = await asyncio.to_thread(self._split, "document", texts)
+        if missing:
+            vectors = await self.underlying.aembed_documents(list(missing.values()))
+            computed = dict(zip(missing, vectors))
+            await asyncio.to_thread(self._store, computed)
+            found.update(computed)
+        return [found[key] for key in keys]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self.aembed_queries([text]))[0]
+
+    async def aembed_queries(self, texts: List[str]) -> List[List[float]]:
+        """Embed many queries, sending only the cache misses to the provider in one batch"""
+        keys, found, missing = await asyncio.to_thread(self._split, "query", texts)
+        if missing:
+            if len(missing) == 1:
+                vectors = [await self.underlying.aembed_query(next(iter(missing.values())))]
+            else:
+                vectors = await self.underlying.aembed_documents(
+                    list(missing.values()),
+                    **self.query_batch_kwargs
+                )
+            computed = dict(zip(missing, vectors))
+            await asyncio.to_thread(self._store, computed)
+            found.update(computed)
+        return [found[key] for key in keys]
+
+    def stats(self) -> dict:
+        """Cache counters for the metrics endpoint"""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        with self._lock:
+            disk_bytes = self._disk_bytes()
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_bytes": disk_bytes,
+            "disk_evictions": self.disk_evictions,
+        }
@@ -0,0 +1,201 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from src.backend.core.config import settings
+from src.backend.schemas.extracted_fields import ExtractedDocument, ExtractedField
+
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d %B %Y", "%d %b %Y", "%B %d, %Y")
+
+AMOUNT_PATTERN = re.compile(r"^[^\d\-]*(-?[\d,]+(?:\.\d+)?)\s*([kKmM]?)\b")
+AMOUNT_SUFFIXES = {"": 1, "k": 1_000, "m": 1_000_000}
+
+# A currency marker or thousands separator makes a numeric value an amount
+CURRENCY_PATTERN = re.compile(r"[$€£¥]|\b(?:USD|EUR|GBP|INR|AED)\b|\d,\d{3}")
+NUMBER_PATTERN = re.compile(r"^-?\d+(?:\.\d+)?$")
+
+# "Label: value" lines; labels are short and start with a letter
+FIELD_LINE_PATTERN = re.compile(r"^[ \t]*([A-Za-z][\w /&().'-]{0,60}?)[ \t]*:[ \t]*(\S.*?)[ \t]*$")
+
+# Bump whenever extract_document or render_compact changes what a prompt sees;
+# stored extractions and reused audit verdicts from older versions are then redone
+CONTEXT_FORMAT_VERSION = 1
+
+
+def parse_date(value: str) -> Optional[date]:
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_amount(value: str) -> Optional[float]:
+    match = AMOUNT_PATTERN.match(value)
+    if not match:
+        return None
+    return float(match.group(1).replace(",", "")) * AMOUNT_SUFFIXES[match.group(2).lower()]
+
+
+def type_field(name: str, raw: str) -> ExtractedField:
+    """Classify a raw value as a date, amount, number or text and normalize it"""
+    parsed_date = parse_date(raw)
+    if parsed_date:
+        return ExtractedField(name=name, field_type="date", value=parsed_date.isoformat(), raw=raw)
+    if NUMBER_PATTERN.match(raw):
+        return ExtractedField(name=name, field_type="number", value=float(raw), raw=raw)
+    if CURRENCY_PATTERN.search(raw):
+        amount = parse_amount(raw)
+        if amount is not None:
+            return ExtractedField(name=name, field_type="amount", value=amount, raw=raw)
+    return ExtractedField(name=name, field_type="text", value=" ".join(raw.split()).casefold(), raw=raw)
+
+
+def extract_document(submission_id: str, document: dict) -> ExtractedDocument:
+    """Parse a document's "Label: value" lines into typed fields; other lines are kept as text"""
+    content = document.get("content") or ""
+    fields: Dict[str, ExtractedField] = {}
+    unstructured = []
+    for line in content.splitlines():
+        match = FIELD_LINE_PATTERN.match(line)
+        if match and match.group(1) not in fields:
+            fields[match.group(1)] = type_field(match.group(1), match.group(2))
+        elif line.strip():
+            unstructured.append(" ".join(line.split()))
+
+    return ExtractedDocument(
+        submission_id=submission_id,
+        document_id=str(document.get("document_id")),
+        document_type=document.get("document_type") or "Unknown",
+        checksum=hashlib.sha256(content.encode("utf-8")).hexdigest(),
+        fields=fields,
+        unstructured="\n".join(unstructured),
+        extracted_at=datetime.now()
+    )
+
+
+def render_compact(document: ExtractedDocument) -> str:
+    """Compact prompt form of a document: one normalized line per field, then any free text"""
+    lines = []
+    for field in document.fields.values():
+        if field.field_type == "date":
+            value = field.value
+        elif field.field_type == "number":
+            value = f"{field.value:.15g}"
+        else:
+            # Amounts keep their written form so the currency is not lost
+            value = " ".join(field.raw.split())
+        lines.append(f"{field.name}: {value}")
+    if document.unstructured:
+        lines.append(document.unstructured)
+    return "\n".join(lines)
+
+
+class ExtractedFieldStore:
+    """
+    Typed fields extracted once per submission document.
+
+    Rows are keyed by (SubmissionID, document_id) and carry the checksum of the
+    content they were parsed from, so a document is only parsed again when its
+    content changes. Shared by the auditor and anomaly agents.
+    """
+
+    def __init__(self, db_path: str):
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS extracted_documents (
+                submission_id TEXT NOT NULL,
+                document_id TEXT NOT NULL,
+                checksum TEXT NOT NULL,
+                document_json TEXT NOT NULL,
+                PRIMARY KEY (submission_id, document_id)
+            )
+        """)
+        self._connection.execute("CREATE INDEX IF NOT EXISTS ix_extracted_documents_checksum ON extracted_documents (checksum)")
+        self._connection.commit()
+
+        self.extracted = 0
+        self.reused = 0
+
+    def get_documents(self, submission_id: str, documents: List[dict]) -> List[ExtractedDocument]:
+        """
+        Return extracted fields for each document, parsing only new or changed ones
+
+        Args:
+            submission_id: Submission the documents belong to
+            documents: Dicts with document_id, document_type and content
+
+        Returns:
+            One ExtractedDocument per input document, in input order
+        """
+        with self._lock:
+            stored = {
+                document_id: (checksum, document_json)
+                for document_id, checksum, document_json in self._connection.execute(
+                    "SELECT document_id, checksum, document_json FROM extracted_documents WHERE submission_id = ?",
+                    (submission_id,)
+                )
+            }
+
+        results, changed = [], []
+        for document in documents:
+            document_id = str(document.get("document_id"))
+            checksum = hashlib.sha256((document.get("content") or "").encode("utf-8")).hexdigest()
+            previous = stored.get(document_id)
+            if previous and previous[0] == self._stored_checksum(checksum):
+                results.append(ExtractedDocument.model_validate_json(previous[1]))
+                self.reused += 1
+            else:
+                extracted = extract_document(submission_id, document)
+                results.append(extracted)
+                changed.append(extracted)
+                self.extracted += 1
+
+        if changed:
+            with self._lock:
+                self._connection.executemany(
+                    """
+                    INSERT OR REPLACE INTO extracted_documents (submission_id, document_id, checksum, document_json)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            submission_id,
+                            extracted.document_id,
+                            self._stored_checksum(extracted.checksum),
+                            extracted.model_dump_json()
+                        )
+                        for extracted in changed
+                    ]
+                )
+                self._connection.commit()
+        return results
+
+    @staticmethod
+    def _stored_checksum(checksum: str) -> str:
+        """Content checksum tagged with the extraction version it was parsed under"""
+        return f"v{CONTEXT_FORMAT_VERSION}:{checksum}"
+
+    def clear(self, submission_id: str) -> None:
+        """Forget every extracted document of a submission"""
+        with self._lock:
+            self._connection.execute("DELETE FROM extracted_documents WHERE submission_id = ?", (submission_id,))
+            self._connection.commit()
+
+    def stats(self) -> dict:
+        """Store counters for the metrics endpoint"""
+        return {
+            "documents_extracted": self.extracted,
+            "documents_reused": self.reused,
+        }
+
+
+extracted_field_store = ExtractedFieldStore(settings.extracted_field_store_path)
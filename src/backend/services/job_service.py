@@ -0,0 +1,390 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+from src.backend.ai.agents.registry import anomaly_detection_agent, auditor_agent
+from src.backend.core.config import settings
+from src.backend.schemas.job import JobStatus
+
+FINISHED = ("succeeded", "failed", "cancelled")
+
+
+async def run_audit(submission_id: str, force: bool = False, use_cache: bool = True) -> dict:
+    result = await auditor_agent.evaluate_submission(
+        submission_id=submission_id,
+        reuse_previous=not force,
+        use_cache=use_cache
+    )
+    return result.model_dump(mode="json")
+
+
+async def run_anomaly_scan(submission_id: str, use_cache: bool = True) -> dict:
+    result = await anomaly_detection_agent.detect_anomalies(
+        submission_id=submission_id,
+        use_cache=use_cache
+    )
+    return result.model_dump(mode="json")
+
+
+JOB_KINDS: Dict[str, Callable[..., Awaitable[dict]]] = {
+    "audit": run_audit,
+    "anomalies": run_anomaly_scan,
+}
+
+
+def _timestamp(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value, tz=timezone.utc) if value is not None else None
+
+
+class JobService:
+    """
+    Background runner for audits and anomaly scans.
+
+    Jobs are rows in a SQLite file, so any worker process can enqueue, poll or
+    cancel any job and a restart picks up where the queue left off. Each
+    process runs ``workers`` async workers that claim the oldest queued job
+    with one atomic UPDATE. While a job runs its worker refreshes a heartbeat
+    every ``heartbeat_seconds`` and checks whether it was asked to cancel;
+    jobs whose heartbeat is older than ``stale_seconds`` (their process died)
+    are queued again. Every claim gets its own token, and heartbeats and the
+    final result are only written under that token, so a worker whose job
+    was requeued behind its back (e.g. its event loop stalled) abandons the
+    job instead of writing over the run that took it over. Finished jobs are
+    deleted after ``retention_seconds``.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        workers: int,
+        poll_seconds: float,
+        heartbeat_seconds: float,
+        stale_seconds: float,
+        retention_seconds: float
+    ):
+        self.workers = workers
+        self.poll_seconds = poll_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.stale_seconds = stale_seconds
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self._tasks: List[asyncio.Task] = []
+        self._running: Dict[str, asyncio.Task] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._last_maintenance = 0.0
+
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._connection = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                submission_id TEXT NOT NULL,
+                params TEXT NOT NULL,
+                status TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL,
+                heartbeat_at REAL,
+                claim_token TEXT
+            );
+            CREATE INDEX IF NOT EXISTS ix_jobs_status_created ON jobs (status, created_at);
+        """)
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(jobs)")}
+        if "claim_token" not in columns:
+            self._connection.execute("ALTER TABLE jobs ADD COLUMN claim_token TEXT")
+        self._connection.commit()
+
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.requeued = 0
+        self.abandoned = 0
+
+    async def enqueue(self, kind: str, submission_id: str, **params) -> JobStatus:
+        """Queue a job and return its initial status"""
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job_id = str(uuid.uuid4())
+        await asyncio.to_thread(self._insert, job_id, kind, submission_id, params)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return await self.get(job_id)
+
+    async def get(self, job_id: str) -> Optional[JobStatus]:
+        """Current status of a job, or None if it does not exist (or has expired)"""
+        return await asyncio.to_thread(self._get, job_id)
+
+    async def cancel(self, job_id: str) -> Optional[JobStatus]:
+        """
+        Cancel a job. A queued job is cancelled at once; a running one is marked
+        "cancelling" and stopped by its worker within ``heartbeat_seconds``.
+        """
+        await asyncio.to_thread(self._mark_cancelled, job_id)
+        # Running in this process: no need to wait for the next heartbeat
+        task = self._running.get(job_id)
+        if task is not None:
+            task.cancel()
+        return await self.get(job_id)
+
+    def _insert(self, job_id: str, kind: str, submission_id: str, params: dict) -> None:
+        with self._lock:
+            self._connection.execute(
+                """
+                INSERT INTO jobs (job_id, kind, submission_id, params, status, created_at)
+                VALUES (?, ?, ?, ?, 'queued', ?)
+                """,
+                (job_id, kind, submission_id, json.dumps(params), time.time())
+            )
+            self._connection.commit()
+
+    def _get(self, job_id: str) -> Optional[JobStatus]:
+        with self._lock:
+            row = self._connection.execute(
+                """
+                SELECT job_id, kind, submission_id, params, status, result, error,
+                       created_at, started_at, finished_at
+                FROM jobs WHERE job_id = ?
+                """,
+                (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            position = None
+            if row[4] == "queued":
+                position = self._connection.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status = 'queued' AND created_at < ?",
+                    (row[7],)
+                ).fetchone()[0]
+
+        return JobStatus(
+            job_id=row[0],
+            kind=row[1],
+            submission_id=row[2],
+            params=json.loads(row[3]),
+            status=row[4],
+            queue_position=position,
+            result=json.loads(row[5]) if row[5] else None,
+            error=row[6],
+            created_at=_timestamp(row[7]),
+            started_at=_timestamp(row[8]),
+            finished_at=_timestamp(row[9])
+        )
+
+    def _mark_cancelled(self, job_id: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? WHERE job_id = ? AND status = 'queued'",
+                (time.time(), job_id)
+            )
+            self._connection.execute(
+                "UPDATE jobs SET status = 'cancelling' WHERE job_id = ? AND status = 'running'",
+                (job_id,)
+            )
+            self._connection.commit()
+
+    def start(self) -> None:
+        """Start this process's workers on the running loop"""
+        if self._tasks:
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        print(f"Job workers started: {self.workers}")
+
+    async def stop(self) -> None:
+        """Stop the workers; jobs they were running go back to the queue"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                job = await asyncio.to_thread(self._claim)
+            except Exception as e:
+                print(f"Error claiming job: {str(e)}")
+                job = None
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+            await self._run(*job)
+
+    def _claim(self) -> Optional[tuple]:
+        now = time.time()
+        with self._lock:
+            if now - self._last_maintenance > self.heartbeat_seconds:
+                self._maintain(now)
+            row = self._connection.execute(
+                """
+                UPDATE jobs SET status = 'running', started_at = ?, heartbeat_at = ?, claim_token = ?
+                WHERE job_id = (
+                    SELECT job_id FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1
+                ) AND status = 'queued'
+                RETURNING job_id, claim_token, kind, submission_id, params
+                """,
+                (now, now, uuid.uuid4().hex)
+            ).fetchone()
+            self._connection.commit()
+        return row
+
+    def _maintain(self, now: float) -> None:
+        """Requeue jobs of dead processes and drop expired finished jobs"""
+        stale = now - self.stale_seconds
+        requeued = self._connection.execute(
+            """
+            UPDATE jobs SET status = 'queued', started_at = NULL, claim_token = NULL
+            WHERE status = 'running' AND heartbeat_at < ?
+            """,
+            (stale,)
+        ).rowcount
+        self._connection.execute(
+            """
+            UPDATE jobs SET status = 'cancelled', finished_at = ?, claim_token = NULL
+            WHERE status = 'cancelling' AND heartbeat_at < ?
+            """,
+            (now, stale)
+        )
+        self._connection.execute(
+            f"DELETE FROM jobs WHERE status IN ({', '.join('?' for _ in FINISHED)}) AND finished_at < ?",
+            (*FINISHED, now - self.retention_seconds)
+        )
+        self._connection.commit()
+        self._last_maintenance = now
+        if requeued:
+            self.requeued += requeued
+            print(f"Requeued {requeued} jobs with a stale heartbeat")
+
+    def _heartbeat(self, job_id: str, token: str) -> Optional[str]:
+        """Refresh a running job's heartbeat and return its status, or None if this claim lost the job"""
+        with self._lock:
+            row = self._connection.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE job_id = ? AND claim_token = ? RETURNING status",
+                (time.time(), job_id, token)
+            ).fetchone()
+            self._connection.commit()
+        return row[0] if row else None
+
+    def _finish(
+        self,
+        job_id: str,
+        token: str,
+        status: str,
+        result: Optional[dict] = None,
+        error: Optional[str] = None
+    ) -> bool:
+        """Record the outcome if this claim still owns the job; False if it was lost"""
+        with self._lock:
+            finished = self._connection.execute(
+                """
+                UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, claim_token = NULL
+                WHERE job_id = ? AND claim_token = ?
+                """,
+                (status, json.dumps(result) if result is not None else None, error, time.time(), job_id, token)
+            ).rowcount
+            self._connection.commit()
+        return finished > 0
+
+    def _requeue(self, job_id: str, token: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                """
+                UPDATE jobs SET status = 'queued', started_at = NULL, claim_token = NULL
+                WHERE job_id = ? AND claim_token = ? AND status = 'running'
+                """,
+                (job_id, token)
+            )
+            self._connection.commit()
+
+    async def _run(self, job_id: str, token: str, kind: str, submission_id: str, params: str) -> None:
+        task = asyncio.create_task(JOB_KINDS[kind](submission_id, **json.loads(params)))
+        self._running[job_id] = task
+        lost = False
+        try:
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=self.heartbeat_seconds)
+                if done:
+                    break
+                status = await asyncio.to_thread(self._heartbeat, job_id, token)
+                if status is None:
+                    # Requeued as stale and possibly running elsewhere: leave it to that run
+                    lost = True
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+                    break
+                if status == "cancelling":
+                    task.cancel()
+        except asyncio.CancelledError:
+            # The worker is shutting down: hand the job back to the queue
+            task.cancel()
+            await asyncio.to_thread(self._requeue, job_id, token)
+            raise
+        finally:
+            self._running.pop(job_id, None)
+
+        if not lost:
+            try:
+                result = task.result()
+            except asyncio.CancelledError:
+                outcome = ("cancelled", None, None)
+            except Exception as e:
+                print(f"Job {job_id} ({kind} {submission_id}) failed: {str(e)}")
+                outcome = ("failed", None, str(e))
+            else:
+                outcome = ("succeeded", result, None)
+            lost = not await asyncio.to_thread(self._finish, job_id, token, *outcome)
+
+        if lost:
+            self.abandoned += 1
+            print(f"Job {job_id} ({kind} {submission_id}) was requeued while running here; result discarded")
+        elif outcome[0] == "cancelled":
+            self.cancelled += 1
+        elif outcome[0] == "failed":
+            self.failed += 1
+        else:
+            self.completed += 1
+
+    def stats(self) -> dict:
+        """Queue depth and job counters for the metrics endpoint"""
+        now = time.time()
+        with self._lock:
+            counts = dict(self._connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+            oldest = self._connection.execute(
+                "SELECT MIN(created_at) FROM jobs WHERE status = 'queued'"
+            ).fetchone()[0]
+        return {
+            "queue_depth": counts.get("queued", 0),
+            "oldest_queued_seconds": round(now - oldest, 1) if oldest else None,
+            "running": counts.get("running", 0) + counts.get("cancelling", 0),
+            "running_here": len(self._running),
+            "workers_here": len(self._tasks),
+            "jobs_by_status": counts,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "requeued": self.requeued,
+            "abandoned": self.abandoned,
+        }
+
+
+job_service = JobService(
+    db_path=settings.job_store_path,
+    workers=settings.job_workers,
+    poll_seconds=settings.job_poll_seconds,
+    heartbeat_seconds=settings.job_heartbeat_seconds,
+    stale_seconds=settings.job_stale_seconds,
+    retention_seconds=settings.job_retention_seconds
+)
@@ -0,0 +1,336 @@
+import asyncio
+import fcntl
+import hashlib
+import itertools
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+import numpy as np
+from langchain_core.documents import Document
+from src.backend.services.embedding_cache_service import CachedEmbeddings
+from src.backend.services.vectorstore_backend import VectorStoreBackend
+
+SEARCH_MODES = ("auto", "exact", "ivf")
+
+# Rows scored per block during exact search, bounds the temporary score matrix
+EXACT_BLOCK_ROWS = 65536
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    return matrix / (np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12)
+
+
+def _top_k(scores: np.ndarray, indices: np.ndarray, k: int):
+    """Return the k best (scores, indices) of a 1-D candidate set, best first"""
+    if len(scores) > k:
+        keep = np.argpartition(-scores, k - 1)[:k]
+        scores, indices = scores[keep], indices[keep]
+    order = np.argsort(-scores, kind="stable")
+    return scores[order], indices[order]
+
+
+@contextmanager
+def partition_lock(path: str):
+    """Exclusive lock on a partition directory, held across every process sharing it"""
+    with open(os.path.join(path, ".lock"), "ab") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def build_ivf(matrix: np.ndarray, nlist: int, iterations: int = 10, seed: int = 0):
+    """
+    Partition unit vectors into ``nlist`` inverted lists with spherical k-means.
+
+    Returns:
+        (centroids, order, offsets) where rows ``order[offsets[c]:offsets[c + 1]]``
+        belong to list ``c``
+    """
+    rng = np.random.default_rng(seed)
+    centroids = matrix[rng.choice(len(matrix), size=nlist, replace=False)].copy()
+
+    for _ in range(iterations):
+        assignments = np.argmax(matrix @ centroids.T, axis=1)
+        order = np.argsort(assignments, kind="stable")
+        filled, starts = np.unique(assignments[order], return_index=True)
+        centroids[filled] = _normalize(np.add.reduceat(matrix[order], starts, axis=0))
+
+    assignments = np.argmax(matrix @ centroids.T, axis=1)
+    order = np.argsort(assignments, kind="stable").astype(np.int64)
+    offsets = np.searchsorted(assignments[order], np.arange(nlist + 1)).astype(np.int64)
+    return centroids, order, offsets
+
+
+class _Partition:
+    """Loaded view of one submission's vectors, chunks and IVF lists"""
+
+    def __init__(self, path: str, meta: dict, version: tuple):
+        self.path = path
+        self.meta = meta
+        # meta.json identity when loaded; a different one means another writer appended
+        self.version = version
+        self.count = meta["count"]
+        self.dim = meta["dim"]
+        self.vectors = np.memmap(
+            os.path.join(path, "vectors.f32"),
+            dtype=np.float32,
+            mode="r",
+            shape=(self.count, self.dim)
+        )
+        self._documents: Optional[List[Document]] = None
+        self.ivf = None
+
+    @property
+    def documents(self) -> List[Document]:
+        if self._documents is None:
+            # Lines past the committed count belong to an append that never finished
+            with open(os.path.join(self.path, "documents.jsonl"), encoding="utf-8") as handle:
+                self._documents = [
+                    Document(id=row["id"], page_content=row["page_content"], metadata=row["metadata"])
+                    for row in map(json.loads, itertools.islice(handle, self.count))
+                ]
+        return self._documents
+
+
+class LocalVectorIndex(VectorStoreBackend):
+    """
+    On-disk vector store with one partition per SubmissionID.
+
+    Each partition directory holds a memory-mapped float32 matrix of unit
+    vectors (``vectors.f32``), the chunk text and metadata (``documents.jsonl``)
+    and, once the partition is large enough, an IVF index (``ivf.npz``).
+    Searches are exact blockwise dot products, or IVF probes of the
+    ``nprobe`` closest lists followed by exact rescoring of their members.
+
+    ``meta.json`` is the commit point: it is replaced atomically after an
+    append and records how many rows and document bytes are complete, so
+    anything past that (an interrupted append) is ignored on load and cut
+    off before the next append. Appends and IVF builds hold an flock on the
+    partition's ``.lock`` file, so workers sharing ``root_path`` take turns.
+    Loaded partitions are reused until ``meta.json`` changes on disk, e.g.
+    after another worker appended.
+    """
+
+    def __init__(
+        self,
+        root_path: str,
+        embeddings: CachedEmbeddings,
+        search_mode: str = "auto",
+        ivf_min_rows: int = 20000,
+        nprobe: int = 8
+    ):
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode '{search_mode}', expected one of {SEARCH_MODES}")
+
+        self.root_path = root_path
+        self.embeddings = embeddings
+        self.search_mode = search_mode
+        self.ivf_min_rows = ivf_min_rows
+        self.nprobe = nprobe
+        self._partitions: Dict[str, _Partition] = {}
+        self._lock = threading.Lock()
+        # One lock per partition path serializes IVF builds of that partition
+        self._build_locks: Dict[str, threading.Lock] = {}
+        os.makedirs(root_path, exist_ok=True)
+
+    def _partition_path(self, submission_id: str) -> str:
+        # Hash the ID so arbitrary SubmissionIDs map to safe directory names
+        return os.path.join(self.root_path, hashlib.sha1(submission_id.encode("utf-8")).hexdigest())
+
+    def _read_meta(self, path: str) -> Optional[dict]:
+        try:
+            with open(os.path.join(path, "meta.json"), encoding="utf-8") as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _meta_version(path: str) -> Optional[tuple]:
+        try:
+            stat = os.stat(os.path.join(path, "meta.json"))
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _get_partition(self, submission_id: str) -> Optional[_Partition]:
+        path = self._partition_path(submission_id)
+        version = self._meta_version(path)
+        with self._lock:
+            partition = self._partitions.get(submission_id)
+            if partition is not None and partition.version == version:
+                return partition
+            self._partitions.pop(submission_id, None)
+            if version is None:
+                return None
+            meta = self._read_meta(path)
+            if not meta or not meta["count"]:
+                return None
+            partition = _Partition(path, meta, version)
+            self._partitions[submission_id] = partition
+            return partition
+
+    def add_vectors(self, submission_id: str, documents: List[Document], vectors: List[List[float]]) -> None:
+        """Append pre-computed embeddings and their chunks to a submission's partition"""
+        if not documents:
+            return
+
+        matrix = _normalize(np.asarray(vectors, dtype=np.float32))
+        path = self._partition_path(submission_id)
+        with self._lock:
+            os.makedirs(path, exist_ok=True)
+            with partition_lock(path):
+                self._append(path, submission_id, documents, matrix)
+            self._partitions.pop(submission_id, None)
+
+    def _append(self, path: str, submission_id: str, documents: List[Document], matrix: np.ndarray) -> None:
+        """Append and commit one batch; the caller holds the partition lock"""
+        vectors_path = os.path.join(path, "vectors.f32")
+        documents_path = os.path.join(path, "documents.jsonl")
+        meta = self._read_meta(path) or {"submission_id": submission_id, "dim": matrix.shape[1], "count": 0}
+        if meta["dim"] != matrix.shape[1]:
+            raise ValueError(f"Embedding dimension {matrix.shape[1]} does not match index dimension {meta['dim']}")
+        if "documents_bytes" not in meta:
+            meta["documents_bytes"] = self._committed_document_bytes(documents_path, meta["count"])
+
+        lines = b"".join(
+            (json.dumps({
+                "id": document.id or str(uuid.uuid4()),
+                "page_content": document.page_content,
+                "metadata": {**document.metadata, "SubmissionID": submission_id},
+            }, default=str) + "\n").encode("utf-8")
+            for document in documents
+        )
+
+        # Cut off whatever an interrupted append left behind, then append
+        # both files; nothing is visible until meta.json is replaced
+        with open(vectors_path, "ab") as handle:
+            handle.truncate(meta["count"] * meta["dim"] * 4)
+            handle.write(np.ascontiguousarray(matrix, dtype=np.float32).tobytes())
+        with open(documents_path, "ab") as handle:
+            handle.truncate(meta["documents_bytes"])
+            handle.write(lines)
+
+        meta["count"] += len(documents)
+        meta["documents_bytes"] += len(lines)
+        meta_tmp_path = os.path.join(path, "meta.json.tmp")
+        with open(meta_tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(meta, handle)
+        os.replace(meta_tmp_path, os.path.join(path, "meta.json"))
+
+    @staticmethod
+    def _committed_document_bytes(documents_path: str, count: int) -> int:
+        """Byte length of the first ``count`` lines, for partitions written before meta tracked it"""
+        if not count:
+            return 0
+        with open(documents_path, "rb") as handle:
+            return sum(len(line) for line in itertools.islice(handle, count))
+
+    async def add_documents(self, submission_id: str, documents: List[Document]) -> None:
+        vectors = await self.embeddings.aembed_documents([document.page_content for document in documents])
+        await asyncio.to_thread(self.add_vectors, submission_id, documents, vectors)
+
+    def _load_ivf(self, partition: _Partition):
+        """Load the partition's IVF lists, rebuilding them if the partition grew"""
+        if partition.ivf is not None:
+            return partition.ivf
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(partition.path, threading.Lock())
+
+        # The thread lock keeps this process's builders apart; the partition
+        # lock makes other workers wait for (and then load) this build
+        with build_lock, partition_lock(partition.path):
+            if partition.ivf is not None:
+                return partition.ivf
+
+            ivf_path = os.path.join(partition.path, "ivf.npz")
+            if os.path.exists(ivf_path):
+                with np.load(ivf_path) as stored:
+                    if int(stored["count"]) == partition.count:
+                        partition.ivf = (stored["centroids"], stored["order"], stored["offsets"])
+                        return partition.ivf
+
+            nlist = max(1, int(np.sqrt(partition.count)))
+            centroids, order, offsets = build_ivf(np.asarray(partition.vectors), nlist)
+            # Written aside and swapped in, so readers never see a half-written file
+            ivf_tmp_path = os.path.join(partition.path, f"ivf.{uuid.uuid4().hex}.tmp")
+            with open(ivf_tmp_path, "wb") as handle:
+                np.savez(handle, centroids=centroids, order=order, offsets=offsets, count=partition.count)
+            os.replace(ivf_tmp_path, ivf_path)
+            partition.ivf = (centroids, order, offsets)
+            return partition.ivf
+
+    def _search_exact(self, partition: _Partition, queries: np.ndarray, k: int) -> list:
+        best = [(np.empty(0, np.float32), np.empty(0, np.int64)) for _ in queries]
+        for start in range(0, partition.count, EXACT_BLOCK_ROWS):
+            block = partition.vectors[start:start + EXACT_BLOCK_ROWS]
+            block_scores = queries @ block.T
+            block_indices = np.arange(start, start + len(block), dtype=np.int64)
+            for i, row in enumerate(block_scores):
+                best[i] = _top_k(
+                    np.concatenate([best[i][0], row]),
+                    np.concatenate([best[i][1], block_indices]),
+                    k
+                )
+        return best
+
+    def _search_ivf(self, partition: _Partition, queries: np.ndarray, k: int) -> list:
+        centroids, order, offsets = self._load_ivf(partition)
+        nprobe = min(self.nprobe, len(centroids))
+        probes = np.argpartition(-(queries @ centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+
+        results = []
+        for query, lists in zip(queries, probes):
+            # Sorted row ids keep memmap reads sequential
+            candidates = np.sort(np.concatenate([order[offsets[c]:offsets[c + 1]] for c in lists]))
+            scores = partition.vectors[candidates] @ query
+            results.append(_top_k(scores, candidates, k))
+        return results
+
+    def search_vectors(
+        self,
+        submission_id: str,
+        query_vectors: List[List[float]],
+        k: int,
+        score_threshold: float,
+        mode: Optional[str] = None
+    ) -> List[List[Document]]:
+        """Search a submission's partition with pre-computed query embeddings"""
+        partition = self._get_partition(submission_id)
+        if partition is None:
+            return [[] for _ in query_vectors]
+
+        queries = _normalize(np.asarray(query_vectors, dtype=np.float32))
+        mode = mode or self.search_mode
+        if mode == "auto":
+            mode = "ivf" if partition.count >= self.ivf_min_rows else "exact"
+
+        if mode == "ivf":
+            matches = self._search_ivf(partition, queries, k)
+        else:
+            matches = self._search_exact(partition, queries, k)
+
+        results = []
+        for cosines, indices in matches:
+            scores = (1.0 + cosines) / 2.0
+            results.append([
+                partition.documents[index]
+                for score, index in zip(scores, indices)
+                if score >= score_threshold
+            ])
+        return results
+
+    async def search(
+        self,
+        submission_id: str,
+        queries: List[str],
+        k: int,
+        score_threshold: float
+    ) -> List[List[Document]]:
+        query_vectors = await self.embeddings.aembed_queries(queries)
+        return await asyncio.to_thread(self.search_vectors, submission_id, query_vectors, k, score_threshold)
@@ -1,40 +1,183 @@
+import asyncio
+from typing import List
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_mongodb import MongoDBAtlasVectorSearch
 from pymongo import MongoClient
 from src.backend.core.config import settings
+from src.backend.core.lazy import LazyObject
+from src.backend.core.singleflight import single_flight
+from src.backend.services.embedding_cache_service import CachedEmbeddings
+from src.backend.services.local_vectorstore_service import LocalVectorIndex
+from src.backend.services.vectorstore_backend import VectorStoreBackend
 
 
-client = MongoClient(settings.mongodb_atlas_cluster_uri)
 db_name = "underwriting_accelerator_db"
 collection_name = "underwriting_accelerator_vectorstores"
-collection = client[db_name][collection_name]
 index_name = "underwriting_accelerator-index-vectorstores"
+text_key = "text"
+embedding_key = "embedding"
 
 #embeddings=init_embeddings("models/gemini-embedding-001", provider="google_genai", api_key=settings.google_api_key)
 model="models/gemini-embedding-001"
-embeddings = GoogleGenerativeAIEmbeddings(model=model, api_key=settings.google_api_key)
+embeddings = CachedEmbeddings(
+    GoogleGenerativeAIEmbeddings(model=model, api_key=settings.google_api_key),
+    namespace=model,
+    db_path=settings.embedding_cache_path,
+    memory_max_entries=settings.embedding_cache_memory_entries,
+    disk_max_bytes=settings.embedding_cache_max_bytes,
+    query_batch_kwargs={"task_type": "RETRIEVAL_QUERY"}
+)
 
-vector_store=MongoDBAtlasVectorSearch(
-            collection=collection,
+
+class AtlasVectorStoreBackend(VectorStoreBackend):
+    """MongoDB Atlas Vector Search backend"""
+
+    def __init__(self, cluster_uri: str, embeddings: Embeddings):
+        self.embeddings = embeddings
+        self.client = MongoClient(cluster_uri)
+        self.collection = self.client[db_name][collection_name]
+        self.vector_store = MongoDBAtlasVectorSearch(
+            collection=self.collection,
             embedding=embeddings,
             index_name=index_name,
+            text_key=text_key,
+            embedding_key=embedding_key,
             relevance_score_fn="cosine",
         )
 
+    async def search(
+        self,
+        submission_id: str,
+        queries: List[str],
+        k: int,
+        score_threshold: float
+    ) -> List[List[Document]]:
+        if len(queries) == 1:
+            return [await self._vector_search(submission_id, queries[0], k, score_threshold)]
+        return await self._batched_search(submission_id, queries, k, score_threshold)
+
+    async def _vector_search(self, submission_id: str, query: str, k: int, score_threshold: float) -> List[Document]:
+        """Single query through Atlas $vectorSearch"""
+        retriever = self.vector_store.as_retriever(
+            search_type="similarity_score_threshold",
+            search_kwargs={
+                "k": k,
+                "score_threshold": score_threshold,
+                "pre_filter": {"SubmissionID": {"$eq": submission_id}}
+                })
+        return await retriever.ainvoke(query)
+
+    async def _batched_search(
+        self,
+        submission_id: str,
+        queries: List[str],
+        k: int,
+        score_threshold: float
+    ) -> List[List[Document]]:
+        """
+        Many queries against one submission through the Atlas vector index.
+
+        All queries are embedded in one request, then one $vectorSearch per
+        query runs concurrently, each filtered to the submission, so only the
+        top ``k`` chunks per query come over the wire.
+        """
+        query_vectors = await self.embeddings.aembed_queries(queries)
+        return list(await asyncio.gather(*[
+            asyncio.to_thread(self._search_by_vector, submission_id, vector, k, score_threshold)
+            for vector in query_vectors
+        ]))
+
+    def _search_by_vector(self, submission_id: str, vector: List[float], k: int, score_threshold: float) -> List[Document]:
+        # vectorSearchScore is already on the cosine relevance scale, (1 + cosine) / 2
+        return self.vector_store.similarity_search_by_vector(
+            vector,
+            k=k,
+            pre_filter={"SubmissionID": {"$eq": submission_id}},
+            post_filter_pipeline=[{"$match": {"score": {"$gte": score_threshold}}}]
+        )
+
+    async def add_documents(self, submission_id: str, documents: List[Document]) -> None:
+        vectors = await self.embeddings.aembed_documents([document.page_content for document in documents])
+        records = [
+            {
+                text_key: document.page_content,
+                embedding_key: vector,
+                **document.metadata,
+                "SubmissionID": submission_id,
+            }
+            for document, vector in zip(documents, vectors)
+        ]
+        await asyncio.to_thread(self.collection.insert_many, records)
+
+
+def create_vector_backend() -> VectorStoreBackend:
+    """Build the vector store backend selected by VECTOR_STORE_BACKEND"""
+    if settings.vector_store_backend == "local":
+        return LocalVectorIndex(
+            root_path=settings.local_vector_store_path,
+            embeddings=embeddings,
+            search_mode=settings.local_vector_search_mode,
+            ivf_min_rows=settings.local_vector_ivf_min_rows,
+            nprobe=settings.local_vector_ivf_nprobe,
+        )
+    if settings.vector_store_backend == "atlas":
+        return AtlasVectorStoreBackend(settings.mongodb_atlas_cluster_uri, embeddings)
+    raise ValueError(f"Unknown vector store backend '{settings.vector_store_backend}'")
+
 
+# Built on first search so an unreachable cluster does not fail the import
+vector_backend = LazyObject(create_vector_backend, "vector_backend")
+
+
+@single_flight(
+    "document_context",
+    key=lambda submission_id, query: (submission_id, query)
+)
 async def get_document_context(submission_id,query):
-    retriever = vector_store.as_retriever(
-        search_type="similarity_score_threshold",
-        search_kwargs={
-            "k": 5, 
-            "score_threshold": 0.8, 
-            "pre_filter": {"SubmissionID": {"$eq": submission_id}}
-            })
-    
     try:
-        docs = await retriever.ainvoke(query)
-        return docs
+        docs = await vector_backend.search(submission_id, [query], k=5, score_threshold=0.8)
+        return docs[0]
     except Exception as e:
         print(f"Error during vector search: {e}")
         return []
 
+
+async def get_document_contexts(
+    submission_id: str,
+    queries: List[str],
+    k: int = 5,
+    score_threshold: float = 0.8
+) -> List[List[Document]]:
+    """
+    Retrieve context for many queries against one submission together.
+
+    All uncached queries are embedded with one embedding request. On Atlas,
+    one $vectorSearch per query then runs concurrently, each filtered to the
+    submission; the local index scores every query against the submission's
+    partition in one call. ``k`` and ``score_threshold`` mean the same as in
+    get_document_context.
+
+    Args:
+        submission_id: The submission whose chunks are searched
+        queries: One search query per caller (e.g. per audit rule)
+        k: Maximum number of chunks returned per query
+        score_threshold: Minimum relevance score for a chunk to be returned
+
+    Returns:
+        One list of Documents per query, in the same order as ``queries``
+    """
+    if not queries:
+        return []
+
+    try:
+        return await vector_backend.search(submission_id, queries, k=k, score_threshold=score_threshold)
+    except Exception as e:
+        print(f"Error during batched vector search: {e}")
+        return [[] for _ in queries]
+
+
+async def add_documents(submission_id: str, documents: List[Document]) -> None:
+    """Embed and store document chunks for a submission in the configured backend"""
+    await vector_backend.add_documents(submission_id, documents)
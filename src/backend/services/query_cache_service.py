@@ -0,0 +1,264 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+from src.backend.core.config import settings
+
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+PUNCTUATION_SPACING = re.compile(r"\s*([=<>!,()])\s*")
+READ_STATEMENT = re.compile(r"^(?:select|with)\b")
+
+# Anything that writes, runs code or reaches outside the database is never executed
+WRITE_KEYWORD = re.compile(
+    r"\b(?:insert|update|delete|merge|drop|alter|create|truncate|exec|execute|grant|revoke|deny|into|"
+    r"openrowset|opendatasource|openquery)\b"
+)
+# Read statements that read a clock/random source are executed but never cached
+NON_DETERMINISTIC = re.compile(
+    r"\b(?:getdate|getutcdate|sysdatetime|sysutcdatetime|current_timestamp|current_date|current_time|now|"
+    r"newid|rand|random)\b"
+)
+TABLE_REFERENCE = re.compile(r"\b(?:from|join)\s+((?:[\w$#@]+|\[[^\]]+\]|\"[^\"]+\")(?:\s*\.\s*(?:[\w$#@]+|\[[^\]]+\]|\"[^\"]+\"))*)")
+
+
+def normalize_sql(query: str) -> str:
+    """
+    Canonical form of a statement for cache keys: comments removed, whitespace
+    collapsed and dropped around operators and commas, keywords and
+    identifiers lowercased (string literals are kept as written) and a
+    trailing semicolon dropped
+    """
+    def canonical(code: str) -> str:
+        return PUNCTUATION_SPACING.sub(r"\1", " ".join(code.lower().split()))
+
+    parts = []
+    position = 0
+    query = COMMENT.sub(" ", query).strip().rstrip(";").strip()
+    for literal in STRING_LITERAL.finditer(query):
+        parts.append(canonical(query[position:literal.start()]))
+        parts.append(literal.group(0))
+        position = literal.end()
+    parts.append(canonical(query[position:]))
+    return "".join(parts)
+
+
+def referenced_tables(normalized: str) -> List[str]:
+    """Unqualified, unquoted names of the tables a normalized SELECT reads"""
+    code = STRING_LITERAL.sub("''", normalized)
+    tables = set()
+    for reference in TABLE_REFERENCE.findall(code):
+        name = reference.split(".")[-1].strip().strip('[]"')
+        tables.add(name)
+    return sorted(tables)
+
+
+def is_read_only(normalized: str) -> bool:
+    """A single SELECT (or WITH ... SELECT) statement that writes nothing"""
+    code = STRING_LITERAL.sub("''", normalized)
+    if not READ_STATEMENT.match(code) or ";" in code:
+        return False
+    return WRITE_KEYWORD.search(code) is None
+
+
+def is_cacheable(normalized: str) -> bool:
+    """Only read-only statements without non-deterministic functions"""
+    if not is_read_only(normalized):
+        return False
+    return NON_DETERMINISTIC.search(STRING_LITERAL.sub("''", normalized)) is None
+
+
+class QueryResultCache:
+    """
+    Result cache for read-only statements run by the SQL agent's query tool.
+
+    Entries are keyed by the normalized statement and stored with the tables
+    it reads, so a write through SubmissionService can invalidate every cached
+    result that touches the written table. The cache lives in SQLite, so an
+    invalidation in one worker is seen by all of them. Entries expire after
+    ``ttl_seconds``. Results larger than ``max_result_bytes`` are not stored
+    and the table is capped at ``max_bytes``, evicting least recently used
+    results first.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float, max_bytes: int, max_result_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_result_bytes = max_result_bytes
+        self._lock = threading.Lock()
+
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # The byte total lives in the database, kept by triggers, so every
+        # process sharing the file enforces the cap against the same number
+        self._connection.executescript("""
+            BEGIN IMMEDIATE;
+            CREATE TABLE IF NOT EXISTS query_results (
+                key TEXT PRIMARY KEY,
+                statement TEXT NOT NULL,
+                result TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_query_results_last_access ON query_results (last_access);
+            CREATE TABLE IF NOT EXISTS query_result_tables (
+                key TEXT NOT NULL,
+                table_name TEXT NOT NULL,
+                PRIMARY KEY (table_name, key)
+            );
+            CREATE INDEX IF NOT EXISTS ix_query_result_tables_key ON query_result_tables (key);
+            CREATE TABLE IF NOT EXISTS query_results_size (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                total INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO query_results_size (id, total)
+                SELECT 0, COALESCE(SUM(size), 0) FROM query_results;
+            CREATE TRIGGER IF NOT EXISTS query_results_size_insert AFTER INSERT ON query_results
+                BEGIN UPDATE query_results_size SET total = total + NEW.size WHERE id = 0; END;
+            CREATE TRIGGER IF NOT EXISTS query_results_size_update AFTER UPDATE OF size ON query_results
+                BEGIN UPDATE query_results_size SET total = total + NEW.size - OLD.size WHERE id = 0; END;
+            CREATE TRIGGER IF NOT EXISTS query_results_size_delete AFTER DELETE ON query_results
+                BEGIN UPDATE query_results_size SET total = total - OLD.size WHERE id = 0; END;
+            COMMIT;
+        """)
+
+        self.hits = 0
+        self.misses = 0
+        self.not_cacheable = 0
+        self.too_large = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(normalized: str) -> str:
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get(self, normalized: str) -> Optional[str]:
+        """Return the cached result of a normalized statement, or None"""
+        key = self._key(normalized)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT result, created_at FROM query_results WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row and now - row[1] > self.ttl_seconds:
+                self._delete([key])
+                self._connection.commit()
+                self.expired += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._connection.execute("UPDATE query_results SET last_access = ? WHERE key = ?", (now, key))
+            self._connection.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, normalized: str, result: str) -> None:
+        """Store a result unless it is over the per-result cap"""
+        size = len(result.encode("utf-8"))
+        if size > self.max_result_bytes:
+            self.too_large += 1
+            return
+
+        key = self._key(normalized)
+        now = time.time()
+        with self._lock:
+            self._delete([key])
+            self._connection.execute(
+                """
+                INSERT INTO query_results (key, statement, result, size, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, normalized, result, size, now, now)
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO query_result_tables (key, table_name) VALUES (?, ?)",
+                [(key, table) for table in referenced_tables(normalized)]
+            )
+            # The write above holds the database lock, so the total is current
+            # for every process until this transaction commits
+            if self._bytes() > self.max_bytes:
+                self._evict()
+            self._connection.commit()
+
+    def _bytes(self) -> int:
+        return self._connection.execute("SELECT total FROM query_results_size WHERE id = 0").fetchone()[0]
+
+    def _delete(self, keys: List[str]) -> None:
+        self._connection.executemany("DELETE FROM query_results WHERE key = ?", [(key,) for key in keys])
+        self._connection.executemany("DELETE FROM query_result_tables WHERE key = ?", [(key,) for key in keys])
+
+    def _evict(self) -> None:
+        """Drop expired results, then least recently used ones until at 90% of the cap"""
+        cutoff = time.time() - self.ttl_seconds
+        expired = [key for (key,) in self._connection.execute("SELECT key FROM query_results WHERE created_at < ?", (cutoff,))]
+        self._delete(expired)
+        self.expired += len(expired)
+
+        excess = self._bytes() - int(self.max_bytes * 0.9)
+        evicted = []
+        for key, size in self._connection.execute("SELECT key, size FROM query_results ORDER BY last_access"):
+            if excess <= 0:
+                break
+            evicted.append(key)
+            excess -= size
+        self._delete(evicted)
+        self.evictions += len(evicted)
+
+    def invalidate(self, *tables: str) -> None:
+        """Drop every cached result that reads one of ``tables``"""
+        names = [table.lower() for table in tables]
+        with self._lock:
+            keys = [
+                key for (key,) in self._connection.execute(
+                    f"SELECT DISTINCT key FROM query_result_tables WHERE table_name IN ({', '.join('?' for _ in names)})",
+                    names
+                )
+            ]
+            self._delete(keys)
+            self._connection.commit()
+            self.invalidations += len(keys)
+
+    def clear(self) -> None:
+        """Drop every cached result"""
+        with self._lock:
+            self._connection.execute("DELETE FROM query_results")
+            self._connection.execute("DELETE FROM query_result_tables")
+            self._connection.commit()
+
+    def stats(self) -> dict:
+        """Cache counters for the metrics endpoint"""
+        lookups = self.hits + self.misses
+        with self._lock:
+            entries = self._connection.execute("SELECT COUNT(*) FROM query_results").fetchone()[0]
+            size = self._bytes()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "not_cacheable": self.not_cacheable,
+            "too_large": self.too_large,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": entries,
+            "bytes": size,
+        }
+
+
+query_cache = QueryResultCache(
+    db_path=settings.query_cache_path,
+    ttl_seconds=settings.query_cache_ttl_seconds,
+    max_bytes=settings.query_cache_max_bytes,
+    max_result_bytes=settings.query_cache_max_result_bytes
+)
@@ -0,0 +1,107 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+CSV_TYPES = {"text/csv", "application/csv"}
+NDJSON_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines"}
+
+# (row number, fields, error): exactly one of fields and error is set
+Record = Tuple[int, Optional[dict], Optional[str]]
+
+
+def record_format(content_type: str) -> Optional[str]:
+    """"csv" or "ndjson" for a supported Content-Type, None otherwise"""
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type in CSV_TYPES:
+        return "csv"
+    if media_type in NDJSON_TYPES:
+        return "ndjson"
+    return None
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Decode a UTF-8 byte stream into lines, each ending in "\\n" except maybe
+    the last. A leading BOM is dropped and characters split across chunks are
+    reassembled; invalid UTF-8 raises UnicodeDecodeError.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def iter_csv_records(chunks: AsyncIterator[bytes], columns: Dict[str, str]) -> AsyncIterator[Record]:
+    """
+    Records of a CSV body whose first row names the fields.
+
+    ``columns`` maps accepted header names (lowercase) onto field names; any
+    other header raises ValueError before a row is read. Empty cells are
+    left out of the row's fields.
+    """
+    header = None
+    record = ""
+    quotes = 0
+    row = 0
+    async for line in iter_lines(chunks):
+        # A quoted field may span lines: the record ends on a line that
+        # leaves an even number of quotes
+        record += line
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+        text, record, quotes = record, "", 0
+        if not text.strip():
+            continue
+
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip().lower() for name in values]
+            unknown = [name for name in header if name not in columns]
+            if unknown:
+                raise ValueError(f"Unknown CSV columns: {', '.join(unknown)}")
+            header = [columns[name] for name in header]
+            continue
+
+        row += 1
+        if len(values) != len(header):
+            yield row, None, f"Expected {len(header)} fields, got {len(values)}"
+            continue
+        yield row, {field: value for field, value in zip(header, values) if value != ""}, None
+
+    if record:
+        yield row + 1, None, "Unterminated quoted field at end of body"
+    elif header is None:
+        raise ValueError("CSV body has no header row")
+
+
+async def iter_ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    """Records of a newline-delimited JSON body, one object per non-blank line"""
+    row = 0
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            fields = json.loads(line)
+        except ValueError as e:
+            yield row, None, f"Invalid JSON: {str(e)}"
+            continue
+        if not isinstance(fields, dict):
+            yield row, None, "Expected a JSON object"
+            continue
+        yield row, fields, None
+
+
+def iter_records(chunks: AsyncIterator[bytes], body_format: str, columns: Dict[str, str]) -> AsyncIterator[Record]:
+    """Records of a body in ``body_format`` ("csv" or "ndjson"), parsed as the chunks arrive"""
+    if body_format == "csv":
+        return iter_csv_records(chunks, columns)
+    return iter_ndjson_records(chunks)
@@ -0,0 +1,183 @@
+import asyncio
+import math
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Set
+from sqlalchemy import inspect
+from src.backend.core.config import settings
+from src.backend.services.sql_service import DatabaseManager
+
+# Words that say nothing about which table a question is about
+STOPWORDS = {
+    "a", "all", "an", "and", "are", "as", "at", "by", "can", "do", "does", "for", "from", "get",
+    "give", "has", "have", "how", "in", "is", "it", "list", "many", "me", "much", "of", "on", "or",
+    "per", "show", "that", "the", "their", "them", "there", "this", "to", "was", "were", "what",
+    "when", "where", "which", "who", "with",
+}
+
+# A word in the table name counts this much more than one in a column name
+TABLE_NAME_WEIGHT = 3.0
+
+# Tables scoring below this fraction of the best match are left out
+RELEVANCE_CUTOFF = 0.5
+
+
+def tokenize(text: str) -> Set[str]:
+    """Lowercase word stems of identifiers or free text (CamelCase and snake_case are split)"""
+    words = re.findall(r"[a-z0-9]+", re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", text).lower())
+    tokens = set()
+    for word in words:
+        if len(word) < 2 or word in STOPWORDS or word.isdigit():
+            continue
+        # Crude singular so "submissions" matches "Submission"
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.add(word)
+    return tokens
+
+
+class SchemaDigest:
+    """
+    Snapshot of the SQL agent's database schema with a table relevance index.
+
+    The digest holds each usable table's DDL (with sample rows, as
+    sql_db_schema returns it), its columns and its foreign keys. It is built
+    from the shared SQLDatabase once and rebuilt after ``refresh_seconds``.
+    ``select`` scores tables against a question by the words shared with
+    table and column names, weighted by how rare each word is across tables
+    and by how much of the table name the question covers. It keeps the
+    tables close to the best score and adds the tables they reference
+    through foreign keys.
+    """
+
+    def __init__(self, refresh_seconds: float, max_tables: int):
+        self.refresh_seconds = refresh_seconds
+        self.max_tables = max_tables
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._built_at: Optional[float] = None
+        self.dialect = ""
+        self.tables: Dict[str, dict] = {}
+        self._index: Dict[str, Dict[str, float]] = {}
+        self._idf: Dict[str, float] = {}
+
+        self.builds = 0
+        self.selections = 0
+        self.tables_selected = 0
+        self.unmatched = 0
+
+    @property
+    def stale(self) -> bool:
+        return self._built_at is None or time.monotonic() - self._built_at > self.refresh_seconds
+
+    def refresh(self) -> None:
+        """Rebuild the digest from the database"""
+        db = DatabaseManager.get_shared_db()
+        inspector = inspect(DatabaseManager.get_shared_engine())
+
+        tables = {}
+        for name in db.get_usable_table_names():
+            columns = [column["name"] for column in inspector.get_columns(name)]
+            tables[name] = {
+                "ddl": db.get_table_info_no_throw([name]),
+                "columns": columns,
+                "name_tokens": tokenize(name),
+                "references": {fk["referred_table"] for fk in inspector.get_foreign_keys(name) if fk.get("referred_table")},
+            }
+
+        index: Dict[str, Dict[str, float]] = {}
+        for name, table in tables.items():
+            for token in table["name_tokens"]:
+                index.setdefault(token, {})[name] = TABLE_NAME_WEIGHT
+            for column in table["columns"]:
+                for token in tokenize(column):
+                    weights = index.setdefault(token, {})
+                    weights[name] = max(weights.get(name, 0.0), 1.0)
+        idf = {token: math.log(1 + len(tables) / len(weights)) for token, weights in index.items()}
+
+        with self._lock:
+            self.dialect = db.dialect
+            self.tables, self._index, self._idf = tables, index, idf
+            self._built_at = time.monotonic()
+            self.builds += 1
+        print(f"Schema digest built: {len(tables)} tables")
+
+    def refresh_if_stale(self) -> None:
+        with self._refresh_lock:
+            # Re-check: a concurrent caller may have just rebuilt it
+            if not self.stale:
+                return
+            has_previous = self._built_at is not None
+            try:
+                self.refresh()
+            except Exception as e:
+                # Keep answering from the previous digest if the database is briefly unavailable
+                if not has_previous:
+                    raise
+                print(f"Error refreshing schema digest: {e}")
+
+    async def arefresh_if_stale(self) -> None:
+        if self.stale:
+            await asyncio.to_thread(self.refresh_if_stale)
+
+    def select(self, question: str) -> List[str]:
+        """Names of the tables most relevant to a question, best match first"""
+        with self._lock:
+            tables, index, idf = self.tables, self._index, self._idf
+
+        question_tokens = tokenize(question)
+        scores: Dict[str, float] = {}
+        for token in question_tokens:
+            for name, weight in index.get(token, {}).items():
+                scores[name] = scores.get(name, 0.0) + weight * idf[token]
+        for name in scores:
+            # "submissions" fits Submissions better than SubmissionDocuments
+            name_tokens = tables[name]["name_tokens"]
+            scores[name] *= 0.5 + 0.5 * len(name_tokens & question_tokens) / max(1, len(name_tokens))
+
+        best = max(scores.values(), default=0.0)
+        selected = sorted(
+            (name for name, score in scores.items() if score >= best * RELEVANCE_CUTOFF),
+            key=lambda name: (-scores[name], name)
+        )[:self.max_tables]
+        # Tables the matches join to, so the model sees both sides of a foreign key
+        for name in list(selected):
+            for referenced in sorted(tables[name]["references"]):
+                if referenced in tables and referenced not in selected and len(selected) < self.max_tables:
+                    selected.append(referenced)
+
+        self.selections += 1
+        self.tables_selected += len(selected)
+        if not selected:
+            self.unmatched += 1
+        return selected
+
+    def render(self, question: str) -> str:
+        """Schema section of the system prompt for a question"""
+        selected = self.select(question)
+        lines = [f"Tables: {', '.join(sorted(self.tables))}"]
+        if selected:
+            lines.append("")
+            lines.append("Schema of the tables relevant to this question:")
+            lines.extend(self.tables[name]["ddl"] for name in selected)
+        else:
+            lines.append("No table clearly matches this question; inspect candidates with sql_db_schema.")
+        return "\n".join(lines)
+
+    def stats(self) -> dict:
+        """Digest counters for the metrics endpoint"""
+        return {
+            "tables": len(self.tables),
+            "builds": self.builds,
+            "age_seconds": round(time.monotonic() - self._built_at, 1) if self._built_at else None,
+            "selections": self.selections,
+            "avg_tables_selected": self.tables_selected / self.selections if self.selections else 0.0,
+            "unmatched": self.unmatched,
+        }
+
+
+schema_digest = SchemaDigest(
+    refresh_seconds=settings.schema_digest_refresh_seconds,
+    max_tables=settings.schema_digest_max_tables
+)
@@ -1,26 +1,120 @@
+import asyncio
 import threading
-from sqlalchemy import create_engine
-from langchain_community.utilities import SQLDatabase
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.engine import Connection, Engine
 from src.backend.core.config import settings
 
+
+class AsyncDatabase:
+    """
+    Async facade over a synchronous SQLAlchemy engine.
+
+    Statements run on a dedicated, bounded thread pool so a slow SQL round trip
+    never blocks the event loop. Every statement is executed with bound
+    parameters and rows come back as plain dictionaries keyed by column name.
+    """
+
+    def __init__(self, engine: Engine, max_workers: int):
+        self.engine = engine
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="sql-worker"
+        )
+
+    async def run_sync(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking callable on the SQL thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def fetch_all(self, statement, params: Optional[dict] = None) -> List[dict]:
+        """Execute a read statement and return every row as a dictionary"""
+        def _fetch_all() -> List[dict]:
+            with self.engine.connect() as connection:
+                result = connection.execute(statement, params or {})
+                return [dict(row._mapping) for row in result]
+
+        return await self.run_sync(_fetch_all)
+
+    async def fetch_one(self, statement, params: Optional[dict] = None) -> Optional[dict]:
+        """Execute a read statement and return the first row, if any"""
+        def _fetch_one() -> Optional[dict]:
+            with self.engine.connect() as connection:
+                row = connection.execute(statement, params or {}).first()
+                return dict(row._mapping) if row is not None else None
+
+        return await self.run_sync(_fetch_one)
+
+    async def execute(self, statement, params: Optional[dict] = None) -> int:
+        """Execute a write statement in its own transaction and return the affected row count"""
+        def _execute() -> int:
+            with self.engine.begin() as connection:
+                return connection.execute(statement, params or {}).rowcount
+
+        return await self.run_sync(_execute)
+
+    async def transaction(self, fn: Callable[[Connection], Any]) -> Any:
+        """Run ``fn(connection)`` inside a single transaction on the SQL thread pool"""
+        def _transaction() -> Any:
+            with self.engine.begin() as connection:
+                return fn(connection)
+
+        return await self.run_sync(_transaction)
+
+
 class DatabaseManager:
+    _engine = None
     _db_instance = None
+    _async_db_instance = None
     _lock = threading.Lock()
 
+    @classmethod
+    def get_shared_engine(cls) -> Engine:
+        """Returns the globally shared SQLAlchemy engine."""
+        if cls._engine is None:
+            with cls._lock:
+                # Double-check pattern to prevent race conditions
+                if cls._engine is None:
+                    options = {}
+                    if make_url(settings.azure_sql_connection_string).get_driver_name() == "pyodbc":
+                        # Send executemany parameter sets to SQL Server as one
+                        # array instead of a round trip per row (bulk imports)
+                        options["fast_executemany"] = True
+                    # Best practice: use pool_pre_ping for long-lived agent connections
+                    cls._engine = create_engine(
+                        settings.azure_sql_connection_string,
+                        pool_pre_ping=True,
+                        pool_size=settings.sql_pool_size,
+                        max_overflow=20,
+                        **options
+                    )
+        return cls._engine
+
     @classmethod
     def get_shared_db(cls):
         """Returns a thread-safe globally shared database instance."""
         if cls._db_instance is None:
+            # Only the SQL agent needs the LangChain wrapper; import it on first use
+            from langchain_community.utilities import SQLDatabase
+
+            engine = cls.get_shared_engine()
             with cls._lock:
-                # Double-check pattern to prevent race conditions
                 if cls._db_instance is None:
-                    # Best practice: use pool_pre_ping for long-lived agent connections
-                    engine = create_engine(
-                        settings.azure_sql_connection_string, 
-                        pool_pre_ping=True, 
-                        pool_size=10, 
-                        max_overflow=20
-                    )
                     cls._db_instance = SQLDatabase(engine)
         return cls._db_instance
-    
\ No newline at end of file
+
+    @classmethod
+    def get_shared_async_db(cls) -> AsyncDatabase:
+        """Returns the globally shared non-blocking database facade."""
+        if cls._async_db_instance is None:
+            engine = cls.get_shared_engine()
+            with cls._lock:
+                if cls._async_db_instance is None:
+                    # One worker per pooled connection so queued statements wait
+                    # on the thread pool instead of on the connection pool
+                    cls._async_db_instance = AsyncDatabase(
+                        engine,
+                        max_workers=settings.sql_pool_size
+                    )
+        return cls._async_db_instance
@@ -1,150 +1,498 @@
-from typing import Optional, List
-from src.backend.services.sql_service import DatabaseManager
-from src.backend.schemas.submission import SubmissionCreate, SubmissionUpdate
+import asyncio
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, Optional, List, Tuple, Type
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import (
+    Column, Date, DateTime, FetchedValue, Float, Index, Integer, MetaData, String, Table,
+    and_, bindparam, case, delete, func, insert, or_, select, text, update
+)
+from sqlalchemy.engine import Connection
+from src.backend.core.config import settings
+from src.backend.services.query_cache_service import query_cache
+from src.backend.services.record_stream import Record
+from src.backend.services.sql_service import AsyncDatabase, DatabaseManager
+from src.backend.schemas.submission import (
+    BulkRowError, BulkSubmissionReport, SubmissionBulkUpdate, SubmissionCreate, SubmissionUpdate,
+    SubmissionResponse
+)
+
+metadata = MetaData()
+
+submissions_table = Table(
+    "Submissions",
+    metadata,
+    # SubmissionID, CreatedAt and UpdatedAt are populated by server-side defaults
+    Column("SubmissionID", String(36), primary_key=True, server_default=FetchedValue()),
+    Column("SubmissionNo", String(50)),
+    Column("InsuredName", String(255)),
+    Column("BrokerName", String(255)),
+    Column("CedantName", String(255)),
+    Column("Department", String(100)),
+    Column("ProfitCenter", String(100)),
+    Column("LineOfBusiness", String(100)),
+    Column("TotalSumInsured", Float),
+    Column("EffectiveDate", Date),
+    Column("ExpiryDate", Date),
+    Column("OverAllStatus", String(50)),
+    Column("Underwriter", String(255)),
+    Column("TechnicalAssistant", String(255)),
+    Column("UnderwritingYear", Integer),
+    Column("CreatedBy", String(255)),
+    Column("CreatedAt", DateTime, server_default=FetchedValue()),
+    Column("UpdatedAt", DateTime, server_default=FetchedValue()),
+    # Listing is keyset-paginated on (CreatedAt DESC, SubmissionID DESC); the
+    # filter indexes end in the same keys so filtered pages stay index seeks
+    Index("IX_Submissions_CreatedAt_SubmissionID", "CreatedAt", "SubmissionID"),
+    Index("IX_Submissions_InsuredName", "InsuredName"),
+    Index("IX_Submissions_OverAllStatus_CreatedAt", "OverAllStatus", "CreatedAt", "SubmissionID"),
+    Index("IX_Submissions_Underwriter_CreatedAt", "Underwriter", "CreatedAt", "SubmissionID"),
+)
+
+# Maps schema field names onto Submissions columns
+SUBMISSION_COLUMNS = {
+    "submission_id": submissions_table.c.SubmissionID,
+    "submission_no": submissions_table.c.SubmissionNo,
+    "insured_name": submissions_table.c.InsuredName,
+    "broker_name": submissions_table.c.BrokerName,
+    "cedant_name": submissions_table.c.CedantName,
+    "department": submissions_table.c.Department,
+    "profit_center": submissions_table.c.ProfitCenter,
+    "line_of_business": submissions_table.c.LineOfBusiness,
+    "total_sum_insured": submissions_table.c.TotalSumInsured,
+    "effective_date": submissions_table.c.EffectiveDate,
+    "expiry_date": submissions_table.c.ExpiryDate,
+    "overall_status": submissions_table.c.OverAllStatus,
+    "underwriter": submissions_table.c.Underwriter,
+    "technical_assistant": submissions_table.c.TechnicalAssistant,
+    "underwriting_year": submissions_table.c.UnderwritingYear,
+    "created_by": submissions_table.c.CreatedBy,
+    "created_at": submissions_table.c.CreatedAt,
+    "updated_at": submissions_table.c.UpdatedAt,
+}
+
+# Executed with one parameter set per row: target_id plus the columns to change,
+# which become the SET clause; UpdatedAt is always refreshed
+BULK_UPDATE = (
+    update(submissions_table)
+    .where(submissions_table.c.SubmissionID == bindparam("target_id"))
+    .values(UpdatedAt=func.current_timestamp())
+)
+
+# Header names a bulk CSV may use: schema field names or Submissions column names
+BULK_CSV_COLUMNS = {
+    **{field: field for field in SUBMISSION_COLUMNS},
+    **{column.name.lower(): field for field, column in SUBMISSION_COLUMNS.items()},
+}
+
+# Bulk updates check IDs in slices that stay under SQL Server's 2100 parameter limit
+ID_LOOKUP_BATCH = 1000
+
+# (row number, key, error) of a row the database rejected
+RowFailure = Tuple[int, Optional[str], str]
+
+# SELECT list that labels every column with its schema field name
+SUBMISSION_SELECT = select(
+    *[column.label(field) for field, column in SUBMISSION_COLUMNS.items()]
+)
+
+
+MATCH_MODES = ("contains", "prefix", "exact")
+
+# Filtered total estimates stop counting here; the header then reads as "at least"
+TOTAL_ESTIMATE_CAP = 10000
+
+# Row count from partition metadata instead of a table scan
+SUBMISSIONS_ROW_ESTIMATE_MSSQL = text("""
+    SELECT SUM(row_count) FROM sys.dm_db_partition_stats
+    WHERE object_id = OBJECT_ID('Submissions') AND index_id IN (0, 1)
+""")
+
+
+def to_column_values(fields: dict) -> dict:
+    """Translate schema field names into Submissions column names"""
+    return {SUBMISSION_COLUMNS[field].name: value for field, value in fields.items()}
+
+
+def validation_message(error: ValidationError) -> str:
+    """One-line summary of a pydantic validation error"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+def database_message(error: Exception) -> str:
+    """The driver's message for a failed statement, without the SQL and parameters"""
+    return str(getattr(error, "orig", None) or error)
+
+
+def encode_cursor(row: dict) -> str:
+    """Build the opaque cursor that resumes a listing after ``row``"""
+    # CreatedAt comes from a server default, but rows written with an explicit
+    # NULL (or before the default existed) have none; it is encoded as null
+    created_at = row["created_at"].isoformat() if row["created_at"] is not None else None
+    payload = json.dumps([created_at, str(row["submission_id"])])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], str]:
+    """Inverse of encode_cursor; raises ValueError for tokens it did not produce"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, submission_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if created_at is None:
+            return None, str(submission_id)
+        return datetime.fromisoformat(created_at), str(submission_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
 
 class SubmissionService:
     """Service layer for submission CRUD operations"""
-    
-    def __init__(self):
-        self.db = DatabaseManager.get_shared_db()
-    
+
+    def __init__(self, db: Optional[AsyncDatabase] = None):
+        self._db = db
+
+    @property
+    def db(self) -> AsyncDatabase:
+        # Resolved on first query so constructing the service does not create the engine
+        if self._db is None:
+            self._db = DatabaseManager.get_shared_async_db()
+        return self._db
+
+    @staticmethod
+    async def _invalidate_cached_queries() -> None:
+        """Drop SQL agent query results that read Submissions"""
+        await asyncio.to_thread(query_cache.invalidate, submissions_table.name)
+
+    @staticmethod
+    def _to_record(row: dict) -> dict:
+        """Map a labelled Submissions row onto the typed response schema"""
+        return SubmissionResponse.model_validate(row).model_dump()
+
     async def create_submission(self, submission: SubmissionCreate) -> dict:
         """Create a new submission"""
-        query = f"""
-        INSERT INTO Submissions (
-            SubmissionNo, InsuredName, BrokerName, CedantName, Department,
-            ProfitCenter, LineOfBusiness, TotalSumInsured, EffectiveDate, ExpiryDate,
-            OverAllStatus, Underwriter, TechnicalAssistant, UnderwritingYear, CreatedBy
-        )
-        VALUES (
-            '{submission.submission_no}', 
-            '{submission.insured_name}', 
-            '{submission.broker_name}', 
-            '{submission.cedant_name}', 
-            '{submission.department}',
-            '{submission.profit_center}', 
-            '{submission.line_of_business}', 
-            {submission.total_sum_insured or 'NULL'}, 
-            '{submission.effective_date or 'NULL'}', 
-            '{submission.expiry_date or 'NULL'}',
-            '{submission.overall_status}', 
-            '{submission.underwriter}', 
-            '{submission.technical_assistant}', 
-            {submission.underwriting_year or 'NULL'}, 
-            '{submission.created_by}'
-        )
-        """
+        statement = insert(submissions_table).values(**to_column_values(submission.model_dump()))
         try:
-            self.db.run(query)
+            await self.db.execute(statement)
+            await self._invalidate_cached_queries()
             return {"message": "Submission created successfully", "submission_no": submission.submission_no}
         except Exception as e:
             raise Exception(f"Error creating submission: {str(e)}")
-    
+
     async def get_submission(self, submission_id: str) -> dict:
         """Get a specific submission by ID"""
-        query = f"SELECT * FROM Submissions WHERE SubmissionID = '{submission_id}'"
+        statement = SUBMISSION_SELECT.where(submissions_table.c.SubmissionID == submission_id)
         try:
-            result = self.db.run(query)
-            return result if result else {"error": "Submission not found"}
+            row = await self.db.fetch_one(statement)
+            return self._to_record(row) if row else {"error": "Submission not found"}
         except Exception as e:
             raise Exception(f"Error fetching submission: {str(e)}")
-    
+
     async def get_submission_by_no(self, submission_no: str) -> dict:
         """Get a specific submission by SubmissionNo"""
-        query = f"SELECT * FROM Submissions WHERE SubmissionNo = '{submission_no}'"
+        statement = SUBMISSION_SELECT.where(submissions_table.c.SubmissionNo == submission_no)
         try:
-            result = self.db.run(query)
-            return result if result else {"error": "Submission not found"}
+            row = await self.db.fetch_one(statement)
+            return self._to_record(row) if row else {"error": "Submission not found"}
         except Exception as e:
             raise Exception(f"Error fetching submission: {str(e)}")
-    
+
     async def get_all_submissions(
-        self, 
+        self,
         insured_name: Optional[str] = None,
         overall_status: Optional[str] = None,
         underwriter: Optional[str] = None,
-        skip: int = 0,
-        limit: int = 100
-    ) -> List[dict]:
-        """Get all submissions with optional filters"""
+        match_mode: str = "contains",
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        include_total: bool = False,
+        skip: int = 0
+    ) -> Tuple[List[dict], Optional[str], Optional[int]]:
+        """
+        Get one page of submissions, newest first, with optional filters.
+
+        Pages are keyset-paginated on (CreatedAt, SubmissionID): ``cursor`` is
+        the token returned with the previous page, so every page costs the same
+        regardless of depth. ``match_mode`` controls the insured_name filter;
+        "prefix" and "exact" can use the InsuredName index, "contains" cannot.
+        Rows without a CreatedAt come last. ``skip`` is the deprecated OFFSET
+        paging, kept for old clients; its cost grows with the offset.
+
+        Returns:
+            (rows, cursor for the next page or None, estimated total or None)
+        """
+        if match_mode not in MATCH_MODES:
+            raise ValueError(f"Unknown match_mode '{match_mode}', expected one of {MATCH_MODES}")
+
         filters = []
-        
         if insured_name:
-            filters.append(f"InsuredName LIKE '%{insured_name}%'")
+            if match_mode == "exact":
+                filters.append(submissions_table.c.InsuredName == insured_name)
+            elif match_mode == "prefix":
+                filters.append(submissions_table.c.InsuredName.startswith(insured_name, autoescape=True))
+            else:
+                filters.append(submissions_table.c.InsuredName.contains(insured_name, autoescape=True))
         if overall_status:
-            filters.append(f"OverAllStatus = '{overall_status}'")
+            filters.append(submissions_table.c.OverAllStatus == overall_status)
         if underwriter:
-            filters.append(f"Underwriter = '{underwriter}'")
-        
-        where_clause = f"WHERE {' AND '.join(filters)}" if filters else ""
-        
-        query = f"""
-        SELECT * FROM Submissions {where_clause}
-        ORDER BY CreatedAt DESC
-        OFFSET {skip} ROWS
-        FETCH NEXT {limit} ROWS ONLY
-        """
-        
+            filters.append(submissions_table.c.Underwriter == underwriter)
+
+        statement = SUBMISSION_SELECT.where(*filters)
+        if cursor:
+            created_at, submission_id = decode_cursor(cursor)
+            statement = statement.where(self._after(created_at, submission_id))
+
+        # Fetch one extra row to learn whether another page exists. NULL
+        # CreatedAt sorts last explicitly; dialects disagree on where DESC puts it
+        statement = (
+            statement
+            .order_by(
+                case((submissions_table.c.CreatedAt.is_(None), 1), else_=0),
+                submissions_table.c.CreatedAt.desc(),
+                submissions_table.c.SubmissionID.desc()
+            )
+            .limit(limit + 1)
+        )
+        if skip:
+            statement = statement.offset(skip)
+
         try:
-            result = self.db.run(query)
-            return result if result else []
+            rows = await self.db.fetch_all(statement)
+            next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+            total = None
+            if include_total:
+                total = await self.db.transaction(lambda connection: self._estimate_total(connection, filters))
+            return [self._to_record(row) for row in rows[:limit]], next_cursor, total
         except Exception as e:
             raise Exception(f"Error fetching submissions: {str(e)}")
-    
+
+    @staticmethod
+    def _after(created_at: Optional[datetime], submission_id: str):
+        """Rows that sort after (created_at, submission_id) in the listing order (NULL CreatedAt last)"""
+        created = submissions_table.c.CreatedAt
+        if created_at is None:
+            # Already among the trailing NULLs: only later NULL rows remain
+            return and_(created.is_(None), submissions_table.c.SubmissionID < submission_id)
+        # Leading range on CreatedAt keeps the dated rows a single index seek;
+        # SQL Server has no row-value comparison. The NULL rows all follow
+        return or_(
+            and_(
+                created <= created_at,
+                or_(created < created_at, submissions_table.c.SubmissionID < submission_id)
+            ),
+            created.is_(None)
+        )
+
+    @staticmethod
+    def _estimate_total(connection: Connection, filters: list) -> int:
+        """Cheap row estimate: table metadata when unfiltered, a capped count otherwise"""
+        if not filters and connection.dialect.name == "mssql":
+            return int(connection.execute(SUBMISSIONS_ROW_ESTIMATE_MSSQL).scalar() or 0)
+        capped = (
+            select(submissions_table.c.SubmissionID)
+            .where(*filters)
+            .limit(TOTAL_ESTIMATE_CAP)
+            .subquery()
+        )
+        return int(connection.execute(select(func.count()).select_from(capped)).scalar() or 0)
+
     async def update_submission(self, submission_id: str, submission: SubmissionUpdate) -> dict:
         """Update a submission"""
-        updates = []
-        
-        if submission.submission_no is not None:
-            updates.append(f"SubmissionNo = '{submission.submission_no}'")
-        if submission.insured_name is not None:
-            updates.append(f"InsuredName = '{submission.insured_name}'")
-        if submission.broker_name is not None:
-            updates.append(f"BrokerName = '{submission.broker_name}'")
-        if submission.cedant_name is not None:
-            updates.append(f"CedantName = '{submission.cedant_name}'")
-        if submission.department is not None:
-            updates.append(f"Department = '{submission.department}'")
-        if submission.profit_center is not None:
-            updates.append(f"ProfitCenter = '{submission.profit_center}'")
-        if submission.line_of_business is not None:
-            updates.append(f"LineOfBusiness = '{submission.line_of_business}'")
-        if submission.total_sum_insured is not None:
-            updates.append(f"TotalSumInsured = {submission.total_sum_insured}")
-        if submission.effective_date is not None:
-            updates.append(f"EffectiveDate = '{submission.effective_date}'")
-        if submission.expiry_date is not None:
-            updates.append(f"ExpiryDate = '{submission.expiry_date}'")
-        if submission.overall_status is not None:
-            updates.append(f"OverAllStatus = '{submission.overall_status}'")
-        if submission.underwriter is not None:
-            updates.append(f"Underwriter = '{submission.underwriter}'")
-        if submission.technical_assistant is not None:
-            updates.append(f"TechnicalAssistant = '{submission.technical_assistant}'")
-        if submission.underwriting_year is not None:
-            updates.append(f"UnderwritingYear = {submission.underwriting_year}")
-        
-        updates.append("UpdatedAt = CURRENT_TIMESTAMP")
-        
-        if len(updates) <= 1:  # Only UpdatedAt was added
+        updates = to_column_values(submission.model_dump(exclude_none=True))
+
+        if not updates:
             return {"message": "No updates provided"}
-        
-        update_clause = ", ".join(updates)
-        query = f"UPDATE Submissions SET {update_clause} WHERE SubmissionID = '{submission_id}'"
-        
+
+        updates["UpdatedAt"] = func.current_timestamp()
+        statement = (
+            update(submissions_table)
+            .where(submissions_table.c.SubmissionID == submission_id)
+            .values(**updates)
+        )
+
         try:
-            self.db.run(query)
+            await self.db.execute(statement)
+            await self._invalidate_cached_queries()
             return {"message": "Submission updated successfully", "submission_id": submission_id}
         except Exception as e:
             raise Exception(f"Error updating submission: {str(e)}")
-    
+
     async def delete_submission(self, submission_id: str) -> dict:
         """Delete a submission"""
-        query = f"DELETE FROM Submissions WHERE SubmissionID = '{submission_id}'"
-        
+        statement = delete(submissions_table).where(submissions_table.c.SubmissionID == submission_id)
+
         try:
-            self.db.run(query)
+            await self.db.execute(statement)
+            await self._invalidate_cached_queries()
             return {"message": "Submission deleted successfully", "submission_id": submission_id}
         except Exception as e:
             raise Exception(f"Error deleting submission: {str(e)}")
 
+    async def bulk_create_submissions(self, records: AsyncIterator[Record]) -> dict:
+        """
+        Create a submission for every valid record.
+
+        Records are validated as they arrive and inserted in chunks of
+        SUBMISSION_BULK_CHUNK_SIZE with one executemany per chunk, each chunk
+        committed on its own. A chunk the database rejects is retried row by
+        row so only the offending rows fail. Chunks committed before a
+        failure stay committed.
+        """
+        try:
+            return await self._bulk_write(records, SubmissionCreate, "submission_no", self._insert_chunk)
+        except Exception as e:
+            raise Exception(f"Error importing submissions: {str(e)}")
+
+    async def bulk_update_submissions(self, records: AsyncIterator[Record]) -> dict:
+        """
+        Apply every valid update record to the submission named by its submission_id.
+
+        As with update_submission only the fields a record sets are changed.
+        Records go to the database in committed chunks like bulk_create_submissions;
+        unknown submission IDs are reported per row.
+        """
+        try:
+            return await self._bulk_write(records, SubmissionBulkUpdate, "submission_id", self._update_chunk)
+        except Exception as e:
+            raise Exception(f"Error updating submissions: {str(e)}")
+
+    async def _bulk_write(
+        self,
+        records: AsyncIterator[Record],
+        model: Type[BaseModel],
+        key_field: str,
+        write_chunk: Callable[[List[Tuple[int, BaseModel]]], Tuple[int, int, List[RowFailure]]]
+    ) -> dict:
+        """Validate records into chunks, write each chunk and collect the per-row report"""
+        chunk_size = max(1, settings.submission_bulk_chunk_size)
+        rows = written = unchanged = failed = 0
+        errors: List[BulkRowError] = []
+        aborted = None
+        chunk: List[Tuple[int, BaseModel]] = []
+
+        def fail(row: int, key, error: str) -> None:
+            nonlocal failed
+            failed += 1
+            if len(errors) < settings.submission_bulk_max_errors:
+                errors.append(BulkRowError(row=row, key=str(key) if key is not None else None, error=error))
+
+        async def flush() -> None:
+            nonlocal written, unchanged
+            chunk_written, chunk_unchanged, failures = await self.db.run_sync(write_chunk, chunk)
+            written += chunk_written
+            unchanged += chunk_unchanged
+            for failure in failures:
+                fail(*failure)
+
+        try:
+            try:
+                async for row, fields, error in records:
+                    rows += 1
+                    if error is None:
+                        try:
+                            chunk.append((row, model.model_validate(fields)))
+                        except ValidationError as e:
+                            error = validation_message(e)
+                    if error is not None:
+                        fail(row, (fields or {}).get(key_field), error)
+                    if len(chunk) >= chunk_size:
+                        await flush()
+                        chunk = []
+            except UnicodeDecodeError as e:
+                # The rest of the body cannot be split into rows; keep what was read
+                aborted = f"Body is not valid UTF-8: {str(e)}"
+            if chunk:
+                await flush()
+        finally:
+            if written:
+                await self._invalidate_cached_queries()
+
+        return BulkSubmissionReport(
+            rows=rows,
+            written=written,
+            unchanged=unchanged,
+            failed=failed,
+            errors=errors,
+            errors_truncated=failed > len(errors),
+            aborted=aborted
+        ).model_dump()
+
+    def _insert_chunk(self, chunk: List[Tuple[int, SubmissionCreate]]) -> Tuple[int, int, List[RowFailure]]:
+        """Insert a chunk with one executemany in one transaction (runs on the SQL thread pool)"""
+        statement = insert(submissions_table)
+        writes = [
+            (row, submission.submission_no, to_column_values(submission.model_dump()))
+            for row, submission in chunk
+        ]
+        try:
+            with self.db.engine.begin() as connection:
+                connection.execute(statement, [values for _, _, values in writes])
+            return len(writes), 0, []
+        except Exception:
+            return self._write_rows(statement, writes, "Error creating submission")
+
+    def _update_chunk(self, chunk: List[Tuple[int, SubmissionBulkUpdate]]) -> Tuple[int, int, List[RowFailure]]:
+        """
+        Update a chunk in one transaction (runs on the SQL thread pool).
+
+        Rows are grouped by the set of columns they change, one executemany
+        per group, so the chunk costs a handful of round trips however many
+        rows it holds.
+        """
+        failures: List[RowFailure] = []
+        unchanged = 0
+        groups: Dict[tuple, list] = {}
+        try:
+            with self.db.engine.begin() as connection:
+                existing = self._existing_ids(connection, [submission.submission_id for _, submission in chunk])
+                for row, submission in chunk:
+                    if submission.submission_id.lower() not in existing:
+                        failures.append((row, submission.submission_id, "Submission not found"))
+                        continue
+                    values = to_column_values(submission.model_dump(exclude_none=True, exclude={"submission_id"}))
+                    if not values:
+                        unchanged += 1
+                        continue
+                    values["target_id"] = submission.submission_id
+                    groups.setdefault(tuple(sorted(values)), []).append((row, submission.submission_id, values))
+
+                for writes in groups.values():
+                    connection.execute(BULK_UPDATE, [values for _, _, values in writes])
+        except Exception:
+            if not groups:
+                # The ID lookup itself failed, so nothing is known about the chunk
+                raise
+            writes = [write for group in groups.values() for write in group]
+            written, _, row_failures = self._write_rows(BULK_UPDATE, writes, "Error updating submission")
+            return written, unchanged, failures + row_failures
+
+        return sum(len(writes) for writes in groups.values()), unchanged, failures
+
+    @staticmethod
+    def _existing_ids(connection: Connection, submission_ids: List[str]) -> set:
+        """Lowercased IDs among ``submission_ids`` that exist"""
+        existing = set()
+        for start in range(0, len(submission_ids), ID_LOOKUP_BATCH):
+            batch = submission_ids[start:start + ID_LOOKUP_BATCH]
+            result = connection.execute(
+                select(submissions_table.c.SubmissionID).where(submissions_table.c.SubmissionID.in_(batch))
+            )
+            existing.update(str(submission_id).lower() for submission_id in result.scalars())
+        return existing
+
+    def _write_rows(self, statement, writes: list, error_prefix: str) -> Tuple[int, int, List[RowFailure]]:
+        """Fallback for a rejected chunk: one transaction per row so only the bad rows fail"""
+        written = 0
+        failures: List[RowFailure] = []
+        for row, key, values in writes:
+            try:
+                with self.db.engine.begin() as connection:
+                    connection.execute(statement, values)
+                written += 1
+            except Exception as e:
+                failures.append((row, key, f"{error_prefix}: {database_message(e)}"))
+        return written, 0, failures
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import List
+from langchain_core.documents import Document
+
+
+class VectorStoreBackend(ABC):
+    """
+    Storage and similarity search for submission document chunks.
+
+    Scores are on Atlas' cosine scale, (1 + cosine) / 2. A search returns at
+    most ``k`` chunks per query, best first, and drops any chunk scoring below
+    ``score_threshold``.
+    """
+
+    @abstractmethod
+    async def search(
+        self,
+        submission_id: str,
+        queries: List[str],
+        k: int,
+        score_threshold: float
+    ) -> List[List[Document]]:
+        """Return the matching chunks of one submission for every query, in query order"""
+
+    @abstractmethod
+    async def add_documents(self, submission_id: str, documents: List[Document]) -> None:
+        """Embed and store document chunks under a submission"""
@@ -0,0 +1,61 @@
+import asyncio
+import time
+from typing import Dict
+from src.backend.ai.agents.registry import (
+    anomaly_detection_agent,
+    auditor_agent,
+    doc_analyst_agent,
+    sql_analyst_agent,
+)
+from src.backend.core.lazy import LazyObject, lazy_import
+
+
+class WarmupService:
+    """
+    Builds lazily-initialized components ahead of the first request.
+
+    Components are resolved one at a time on worker threads so the event loop
+    keeps answering health probes meanwhile. A component that fails to build is
+    recorded and left lazy; its first request will try again.
+    """
+
+    def __init__(self, components: Dict[str, LazyObject]):
+        self.components = components
+        self.state = "disabled"
+        self.errors: Dict[str, str] = {}
+        self.seconds = 0.0
+
+    def start(self) -> asyncio.Task:
+        """Schedule the warmup on the running loop; readiness reports pending until it ends"""
+        self.state = "pending"
+        return asyncio.create_task(self.run())
+
+    async def run(self) -> None:
+        self.state = "running"
+        started = time.perf_counter()
+        for name, component in self.components.items():
+            try:
+                await asyncio.to_thread(component.resolve)
+            except Exception as e:
+                print(f"Warmup of {name} failed: {e}")
+                self.errors[name] = str(e)
+        self.seconds = time.perf_counter() - started
+        self.state = "done"
+        print(f"Warmup finished in {self.seconds:.2f}s ({len(self.errors)} failed)")
+
+    def status(self) -> dict:
+        return {
+            "state": self.state,
+            "seconds": round(self.seconds, 3),
+            "errors": dict(self.errors),
+            "initialized": {name: component.initialized for name, component in self.components.items()},
+        }
+
+
+warmup_service = WarmupService({
+    "vector_store": lazy_import("src.backend.services.mongo_vectorstore_service", "vector_backend"),
+    "auditor_agent": auditor_agent,
+    "anomaly_detection_agent": anomaly_detection_agent,
+    "sql_analyst_agent": sql_analyst_agent,
+    "doc_analyst_agent": doc_analyst_agent,
+})